@@ -67,6 +67,9 @@ from .custom_widgets.properties_bin.node_property_widgets import (
     PropertiesBinWidget
 )
 
+# utilities
+from .base.renderer import SessionRenderer
+
 
 __version__ = VERSION
 __all__ = [
@@ -86,6 +89,7 @@ __all__ = [
     'NodesMenu',
     'Port',
     'PropertiesBinWidget',
+    'SessionRenderer',
     'SubGraph',
     'VERSION',
     'constants',
@@ -0,0 +1,377 @@
+#!/usr/bin/python
+import atexit
+import json
+import os
+import struct
+import uuid
+import zlib
+
+from PySide6 import QtCore, QtWidgets
+
+from NodeGraphQt.base.model import SubGraphSession
+from NodeGraphQt.constants import (
+    CLIPBOARD_MIME_TYPE,
+    CLIPBOARD_TEXT_NODE_LIMIT,
+    CLIPBOARD_TOKEN_MIME_TYPE,
+)
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _DICT = range(8)
+_DOUBLE = struct.Struct('<d')
+
+
+class ClipboardPayload(object):
+    """
+    Compact binary encoding for serialized node data.
+
+    The payload is a header followed by a zlib compressed body of a string
+    table (every string is stored once) and the values encoded with a type
+    tag, integers and lengths are stored as variable length integers.
+    """
+
+    MAGIC = b'NGQT'
+    VERSION = 1
+
+    @classmethod
+    def encode(cls, data):
+        """
+        Encode serialized node data.
+
+        Args:
+            data (dict): serialized node data.
+
+        Returns:
+            bytes: binary payload.
+        """
+        strings = {}
+        body = bytearray()
+        cls._encode_value(data, body, strings)
+
+        table = bytearray()
+        cls._write_varint(len(strings), table)
+        for string in strings:
+            raw = string.encode('utf-8')
+            cls._write_varint(len(raw), table)
+            table += raw
+
+        return (cls.MAGIC + bytes([cls.VERSION]) +
+                zlib.compress(bytes(table + body), 1))
+
+    @classmethod
+    def decode(cls, payload):
+        """
+        Decode a binary payload.
+
+        Args:
+            payload (bytes): binary payload.
+
+        Returns:
+            dict: serialized node data.
+        """
+        payload = bytes(payload)
+        header_size = len(cls.MAGIC) + 1
+        if payload[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError('Not a node clipboard payload.')
+        if payload[len(cls.MAGIC)] != cls.VERSION:
+            raise ValueError('Unsupported node clipboard payload version: {}'
+                             .format(payload[len(cls.MAGIC)]))
+        body = zlib.decompress(payload[header_size:])
+
+        count, pos = cls._read_varint(body, 0)
+        strings = []
+        for _ in range(count):
+            size, pos = cls._read_varint(body, pos)
+            strings.append(body[pos:pos + size].decode('utf-8'))
+            pos += size
+
+        value, _ = cls._decode_value(body, pos, strings)
+        return value
+
+    @staticmethod
+    def _write_varint(value, buffer):
+        """
+        Write an unsigned variable length integer.
+
+        Args:
+            value (int): value.
+            buffer (bytearray): buffer.
+        """
+        while value > 0x7f:
+            buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    @staticmethod
+    def _read_varint(data, pos):
+        """
+        Read an unsigned variable length integer.
+
+        Args:
+            data (bytes): payload body.
+            pos (int): read position.
+
+        Returns:
+            tuple(int, int): value, next read position.
+        """
+        value = 0
+        shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+
+    @classmethod
+    def _encode_value(cls, value, buffer, strings):
+        """
+        Args:
+            value (object): value to encode.
+            buffer (bytearray): buffer.
+            strings (dict): {<str>: <index>} string table.
+        """
+        if value is None:
+            buffer.append(_NONE)
+        elif value is True:
+            buffer.append(_TRUE)
+        elif value is False:
+            buffer.append(_FALSE)
+        elif isinstance(value, str):
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            buffer.append(_STR)
+            cls._write_varint(index, buffer)
+        elif isinstance(value, int):
+            buffer.append(_INT)
+            # zigzag so small negative numbers stay small.
+            cls._write_varint(value * 2 if value >= 0 else -value * 2 - 1,
+                              buffer)
+        elif isinstance(value, float):
+            buffer.append(_FLOAT)
+            buffer += _DOUBLE.pack(value)
+        elif isinstance(value, dict):
+            buffer.append(_DICT)
+            cls._write_varint(len(value), buffer)
+            for k, v in value.items():
+                cls._encode_value(k, buffer, strings)
+                cls._encode_value(v, buffer, strings)
+        elif isinstance(value, (list, tuple)):
+            buffer.append(_LIST)
+            cls._write_varint(len(value), buffer)
+            for v in value:
+                cls._encode_value(v, buffer, strings)
+        else:
+            converted = SubGraphSession.json_default(value)
+            if converted is value:
+                raise TypeError('Object of type {} can\'t be encoded.'
+                                .format(type(value).__name__))
+            cls._encode_value(converted, buffer, strings)
+
+    @classmethod
+    def _decode_value(cls, data, pos, strings):
+        """
+        Args:
+            data (bytes): payload body.
+            pos (int): read position.
+            strings (list[str]): string table.
+
+        Returns:
+            tuple(object, int): value, next read position.
+        """
+        tag = data[pos]
+        pos += 1
+        if tag == _STR:
+            index, pos = cls._read_varint(data, pos)
+            return strings[index], pos
+        if tag == _INT:
+            value, pos = cls._read_varint(data, pos)
+            return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+        if tag == _FLOAT:
+            return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+        if tag == _DICT:
+            count, pos = cls._read_varint(data, pos)
+            value = {}
+            for _ in range(count):
+                k, pos = cls._decode_value(data, pos, strings)
+                v, pos = cls._decode_value(data, pos, strings)
+                value[k] = v
+            return value, pos
+        if tag == _LIST:
+            count, pos = cls._read_varint(data, pos)
+            value = []
+            for _ in range(count):
+                v, pos = cls._decode_value(data, pos, strings)
+                value.append(v)
+            return value, pos
+        if tag == _NONE:
+            return None, pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        raise ValueError('Invalid node clipboard payload tag: {}'.format(tag))
+
+
+def _clone_data(value):
+    """
+    Copy serialized node data (faster than ``copy.deepcopy`` as only the
+    containers are copied).
+
+    Args:
+        value (object): serialized data.
+
+    Returns:
+        object: copied data.
+    """
+    if isinstance(value, dict):
+        return {k: _clone_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clone_data(v) for v in value]
+    if isinstance(value, set):
+        return list(value)
+    return value
+
+
+class _NodeMimeData(QtCore.QMimeData):
+    """
+    Mime data for copied nodes that only encodes the
+    :class:`ClipboardPayload` and the ``JSON`` text fallback when another
+    application or process requests them, pasting in the same process
+    reads the serialized data from memory.
+
+    Args:
+        data (dict): serialized node data.
+        text_fallback (bool): provide the ``JSON`` text fallback.
+    """
+
+    def __init__(self, data, text_fallback=False):
+        super(_NodeMimeData, self).__init__()
+        self._data = data
+        self._formats = [CLIPBOARD_MIME_TYPE]
+        if text_fallback:
+            self._formats.append('text/plain')
+        # {<mime type>: <encoded data>}
+        self._encoded = {}
+
+    def formats(self):
+        return self._formats + super(_NodeMimeData, self).formats()
+
+    def hasFormat(self, mime_type):
+        return (mime_type in self._formats or
+                super(_NodeMimeData, self).hasFormat(mime_type))
+
+    def retrieveData(self, mime_type, preferred_type):
+        if mime_type not in self._formats:
+            return super(_NodeMimeData, self).retrieveData(
+                mime_type, preferred_type)
+        if mime_type not in self._encoded:
+            if mime_type == CLIPBOARD_MIME_TYPE:
+                self._encoded[mime_type] = QtCore.QByteArray(
+                    ClipboardPayload.encode(self._data))
+            else:
+                self._encoded[mime_type] = json.dumps(
+                    self._data, default=SubGraphSession.json_default)
+        return self._encoded[mime_type]
+
+
+class NodeClipboard(object):
+    """
+    Copies serialized nodes to the system clipboard as a
+    :class:`ClipboardPayload` with a private MIME type.
+
+    The data of the last copy is also kept in memory so pasting in the same
+    process skips the encode and decode (the payload is only encoded when
+    another process requests it), plain ``JSON`` text is provided as a
+    fallback for small selections and is still accepted when pasting.
+    """
+
+    # (<token>, <serialized data>) from the last copy in this process.
+    _last_copy = (None, None)
+    _release_registered = False
+
+    @classmethod
+    def set_data(cls, data, node_count=0):
+        """
+        Copy the serialized node data to the clipboard.
+
+        Args:
+            data (dict): serialized node data.
+            node_count (int): number of copied nodes.
+
+        Returns:
+            bool: true if the data was copied.
+        """
+        data = _clone_data(SubGraphSession.pack(data))
+        token = '{}:{}'.format(os.getpid(), uuid.uuid4().hex)
+
+        # the pasted data is cloned from the last copy so the mime data can
+        # share it.
+        mime_data = _NodeMimeData(
+            data, text_fallback=node_count <= CLIPBOARD_TEXT_NODE_LIMIT)
+        mime_data.setData(CLIPBOARD_TOKEN_MIME_TYPE,
+                          QtCore.QByteArray(token.encode('utf-8')))
+
+        cls._last_copy = (token, data)
+        QtWidgets.QApplication.clipboard().setMimeData(mime_data)
+        if not cls._release_registered:
+            atexit.register(cls._release)
+            cls._release_registered = True
+        return True
+
+    @classmethod
+    def _release(cls):
+        """
+        Replace the copied nodes on the clipboard with the text fallback
+        before python exits, the mime data is implemented in python and Qt
+        can still query it after the interpreter has shut down.
+        """
+        app = QtWidgets.QApplication.instance()
+        if app is None:
+            return
+        clipboard = QtWidgets.QApplication.clipboard()
+        mime_data = clipboard.mimeData()
+        if mime_data is None or \
+                not mime_data.hasFormat(CLIPBOARD_TOKEN_MIME_TYPE):
+            return
+        text = mime_data.text()
+        if text:
+            clipboard.setText(text)
+        else:
+            clipboard.clear()
+
+    @classmethod
+    def data(cls):
+        """
+        Returns the serialized node data from the clipboard.
+
+        Returns:
+            dict: serialized node data or None.
+        """
+        mime_data = QtWidgets.QApplication.clipboard().mimeData()
+        if mime_data is None:
+            return
+
+        # same process fast path.
+        token, data = cls._last_copy
+        if token and mime_data.hasFormat(CLIPBOARD_TOKEN_MIME_TYPE):
+            mime_token = bytes(mime_data.data(CLIPBOARD_TOKEN_MIME_TYPE))
+            if mime_token.decode('utf-8') == token:
+                return _clone_data(data)
+
+        if mime_data.hasFormat(CLIPBOARD_MIME_TYPE):
+            try:
+                return ClipboardPayload.decode(
+                    mime_data.data(CLIPBOARD_MIME_TYPE))
+            except (ValueError, IndexError, zlib.error) as e:
+                print('ERROR: Can\'t Decode Clipboard Data:\n{}'.format(e))
+                return
+
+        text = mime_data.text()
+        if not text:
+            return
+        try:
+            return json.loads(text)
+        except json.decoder.JSONDecodeError:
+            print('ERROR: Can\'t Decode Clipboard Data:\n'
+                  '"{}"'.format(text))
@@ -180,14 +180,14 @@ class NodeAddedCmd(QtGui.QUndoCommand):
     def undo(self):
         node_id = self.node.id
         self.pos = self.pos or self.node.pos()
-        self.graph.model.nodes.pop(self.node.id)
+        self.graph.model.remove_node(self.node.id)
         self.node.view.delete()
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit([node_id])
 
     def redo(self):
-        self.graph.model.nodes[self.node.id] = self.node
+        self.graph.model.add_node(self.node)
         self.graph.viewer().add_node(self.node.view, self.pos)
 
         # node width & height is calculated when it's added to the scene,
@@ -218,7 +218,7 @@ class NodesRemovedCmd(QtGui.QUndoCommand):
 
     def undo(self):
         for node in self.nodes:
-            self.graph.model.nodes[node.id] = node
+            self.graph.model.add_node(node)
             self.graph.scene().addItem(node.view)
 
             if self.emit_signal:
@@ -228,13 +228,113 @@ class NodesRemovedCmd(QtGui.QUndoCommand):
         node_ids = []
         for node in self.nodes:
             node_ids.append(node.id)
-            self.graph.model.nodes.pop(node.id)
+            self.graph.model.remove_node(node.id)
             node.view.delete()
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit(node_ids)
 
 
+class NodesDeletedCmd(QtGui.QUndoCommand):
+    """
+    Bulk node deleted command that removes the nodes and the pipe
+    connections to them in a single pass.
+
+    Only the connections to nodes that are not deleted are disconnected in
+    the port models (emitting the port disconnected signal and calling
+    "on_input_disconnected()"), connections between the deleted nodes are
+    kept in their models so they come back on undo.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.BaseNode or NodeGraphQt.NodeObject]): nodes.
+        emit_signal (bool): emit node deletion signals. (default: True)
+    """
+
+    def __init__(self, graph, nodes, emit_signal=True):
+        QtGui.QUndoCommand.__init__(self)
+        self.setText('deleted node(s)')
+        self.graph = graph
+        self.nodes = list(nodes)
+        self.emit_signal = emit_signal
+        # (<input port>, <output port>) connections to the remaining nodes
+        # and between the deleted nodes.
+        self.connections = []
+        self.internal_connections = []
+
+        node_ids = set(n.id for n in self.nodes)
+        all_nodes = graph.model.nodes
+        # {<node_id>: {<port_name>: <port>}} port lookups per node.
+        inputs, outputs = {}, {}
+        for node in self.nodes:
+            if not hasattr(node, 'input_ports'):
+                continue
+            for port in node.input_ports():
+                for node_id, port_name in port.model.connections():
+                    if node_id not in outputs:
+                        outputs[node_id] = all_nodes[node_id].outputs()
+                    connection = (port, outputs[node_id][port_name])
+                    if node_id in node_ids:
+                        self.internal_connections.append(connection)
+                    else:
+                        self.connections.append(connection)
+            for port in node.output_ports():
+                for node_id, port_name in port.model.connections():
+                    if node_id in node_ids:
+                        continue
+                    if node_id not in inputs:
+                        inputs[node_id] = all_nodes[node_id].inputs()
+                    self.connections.append((inputs[node_id][port_name], port))
+
+    def undo(self):
+        scene = self.graph.scene()
+        for node in self.nodes:
+            self.graph.model.add_node(node)
+            scene.addItem(node.view)
+
+        for in_port, out_port in self.internal_connections:
+            in_port.view.connect_to(out_port.view)
+        for in_port, out_port in self.connections:
+            in_port.model.add_connection(out_port.node().id, out_port.name())
+            out_port.model.add_connection(in_port.node().id, in_port.name())
+            in_port.view.connect_to(out_port.view)
+            in_port.node().on_input_connected(in_port, out_port)
+            self.graph.port_connected.emit(in_port, out_port)
+
+        if self.emit_signal:
+            for node in self.nodes:
+                self.graph.node_created.emit(node)
+
+    def redo(self):
+        for in_port, out_port in self.connections:
+            in_port.model.remove_connection(out_port.node().id, out_port.name())
+            out_port.model.remove_connection(in_port.node().id, in_port.name())
+
+        # remove all the pipes from the deleted nodes in one pass.
+        pipes = set()
+        for node in self.nodes:
+            for port_view in getattr(node.view, 'inputs', []):
+                pipes.update(port_view.connected_pipes)
+            for port_view in getattr(node.view, 'outputs', []):
+                pipes.update(port_view.connected_pipes)
+        node_ids = []
+        for node in self.nodes:
+            node_ids.append(node.id)
+            self.graph.model.remove_node(node.id)
+        self.graph.scene().remove_items(
+            list(pipes) + [n.view for n in self.nodes])
+        for pipe in pipes:
+            pipe.input_port.remove_pipe(pipe)
+            pipe.output_port.remove_pipe(pipe)
+
+        for in_port, out_port in self.connections:
+            in_port.node().on_input_disconnected(in_port, out_port)
+            self.graph.port_disconnected.emit(in_port, out_port)
+
+        if self.emit_signal:
+            self.graph.nodes_deleted.emit(node_ids)
+
+
 class NodeInputConnectedCmd(QtGui.QUndoCommand):
     """
     "BaseNode.on_input_connected()" command.
@@ -311,17 +411,8 @@ class PortConnectedCmd(QtGui.QUndoCommand):
         src_id = self.source.node().id
         trg_id = self.target.node().id
 
-        port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name() in port_names:
-            port_names.remove(self.target.name())
-
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name() in port_names:
-            port_names.remove(self.source.name())
+        src_model.remove_connection(trg_id, self.target.name())
+        trg_model.remove_connection(src_id, self.source.name())
 
         self.source.view.disconnect_from(self.target.view)
 
@@ -338,8 +429,8 @@ class PortConnectedCmd(QtGui.QUndoCommand):
         src_id = self.source.node().id
         trg_id = self.target.node().id
 
-        src_model.connected_ports[trg_id].append(self.target.name())
-        trg_model.connected_ports[src_id].append(self.source.name())
+        src_model.add_connection(trg_id, self.target.name())
+        trg_model.add_connection(src_id, self.source.name())
 
         self.source.view.connect_to(self.target.view)
 
@@ -373,8 +464,8 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
         src_id = self.source.node().id
         trg_id = self.target.node().id
 
-        src_model.connected_ports[trg_id].append(self.target.name())
-        trg_model.connected_ports[src_id].append(self.source.name())
+        src_model.add_connection(trg_id, self.target.name())
+        trg_model.add_connection(src_id, self.source.name())
 
         self.source.view.connect_to(self.target.view)
 
@@ -391,17 +482,8 @@ class PortDisconnectedCmd(QtGui.QUndoCommand):
         src_id = self.source.node().id
         trg_id = self.target.node().id
 
-        port_names = src_model.connected_ports.get(trg_id)
-        if port_names is []:
-            del src_model.connected_ports[trg_id]
-        if port_names and self.target.name() in port_names:
-            port_names.remove(self.target.name())
-
-        port_names = trg_model.connected_ports.get(src_id)
-        if port_names is []:
-            del trg_model.connected_ports[src_id]
-        if port_names and self.source.name() in port_names:
-            port_names.remove(self.source.name())
+        src_model.remove_connection(trg_id, self.target.name())
+        trg_model.remove_connection(src_id, self.source.name())
 
         self.source.view.disconnect_from(self.target.view)
 
@@ -0,0 +1,471 @@
+#!/usr/bin/python
+import time
+from collections import deque
+
+from NodeGraphQt.constants import NodeExecutorEnum
+from NodeGraphQt.errors import NodeEvaluationError
+from NodeGraphQt.nodes.base_node import BaseNode
+
+
+class NodeGraphEvaluator(object):
+    """
+    The ``NodeGraphEvaluator`` executes the nodes in a node graph by calling
+    :meth:`BaseNode.compute` on every node in topological order of the port
+    connections.
+
+    Computed outputs are cached per node and only the nodes downstream from a
+    changed custom property or port connection are recomputed, disabled nodes
+    are evaluated as a pass-through of their inputs.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph
+
+        graph = NodeGraph()
+        ...
+        results = graph.evaluator.evaluate()
+    """
+
+    def __init__(self, graph):
+        """
+        Args:
+            graph (NodeGraphQt.NodeGraph): node graph to evaluate.
+        """
+        self._graph = graph
+        # {<node_id>: (<outputs>, <input connections>)}
+        self._results = {}
+        self._dirty = set()
+        # result cache and the node result cache keys.
+        self._result_cache = None
+        self._keys = {}
+
+        graph.property_changed.connect(self._on_property_changed)
+        graph.port_connected.connect(self._on_connection_changed)
+        graph.port_disconnected.connect(self._on_connection_changed)
+        graph.nodes_deleted.connect(self._on_nodes_deleted)
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def _on_property_changed(self, node, name, value):
+        """
+        Slot when a node property has changed.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+            name (str): property name.
+            value (object): property value.
+        """
+        if not isinstance(node, BaseNode):
+            return
+        if name == 'disabled' or node.model.is_custom_property(name):
+            self.mark_dirty(node)
+
+    def _on_connection_changed(self, in_port, out_port):
+        """
+        Slot when a port has been connected or disconnected.
+
+        Args:
+            in_port (NodeGraphQt.Port): input port.
+            out_port (NodeGraphQt.Port): output port.
+        """
+        self.mark_dirty(in_port.node())
+
+    def _on_nodes_deleted(self, node_ids):
+        """
+        Slot when nodes have been deleted from the graph.
+
+        Args:
+            node_ids (list[int]): deleted node ids.
+        """
+        for node_id in node_ids:
+            self._results.pop(node_id, None)
+            self._keys.pop(node_id, None)
+            self._dirty.discard(node_id)
+
+    @property
+    def graph(self):
+        """
+        The node graph being evaluated.
+
+        Returns:
+            NodeGraphQt.NodeGraph: node graph.
+        """
+        return self._graph
+
+    def result_cache(self):
+        """
+        Returns the cache used to look up node outputs before they're
+        computed.
+
+        Returns:
+            NodeGraphQt.base.result_cache.NodeResultCache: result cache or None.
+        """
+        return self._result_cache
+
+    def set_result_cache(self, cache=None):
+        """
+        Set the cache used to look up node outputs before they're computed,
+        nodes with the same type, custom properties and upstream nodes as a
+        cached result aren't recomputed.
+
+        Args:
+            cache (NodeGraphQt.base.result_cache.NodeResultCache):
+                result cache (set to None to disable).
+        """
+        self._result_cache = cache
+        # cache keys are built from the upstream keys on the next evaluation.
+        self.invalidate()
+
+    def is_dirty(self, node):
+        """
+        Returns true if the node needs to be recomputed.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+
+        Returns:
+            bool: true if dirty.
+        """
+        return node.id in self._dirty or node.id not in self._results
+
+    def mark_dirty(self, node):
+        """
+        Mark the node and the nodes downstream from it to be recomputed.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            # nodes downstream from a dirty node are already dirty.
+            if node.id in self._dirty:
+                continue
+            self._dirty.add(node.id)
+            for port in node.output_ports():
+                stack.extend(p.node() for p in port.connected_ports())
+
+    def invalidate(self, nodes=None):
+        """
+        Clear the cached outputs so the nodes are recomputed.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): nodes (default: all nodes).
+        """
+        if nodes is None:
+            self._results.clear()
+            self._keys.clear()
+            self._dirty.clear()
+            return
+        for node in nodes:
+            self.mark_dirty(node)
+
+    def result(self, node, port=None):
+        """
+        Returns the cached outputs from the last evaluation of the node.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            port (str or NodeGraphQt.Port): output port (default: all outputs).
+
+        Returns:
+            object: output value or dict ``{<port_name>: <value>}``
+        """
+        outputs = self._results.get(node.id, ({}, None))[0]
+        if port is None:
+            return outputs
+        if not isinstance(port, str):
+            port = port.name()
+        return outputs.get(port)
+
+    def dependencies(self, nodes=None):
+        """
+        Returns the nodes and the upstream node dependencies from the port
+        connections.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]):
+                nodes and their upstream nodes (default: all nodes).
+
+        Returns:
+            tuple(dict, dict):
+                ``{<node_id>: <node>}``, ``{<node_id>: [<upstream_node_id>]}``
+        """
+        if nodes is None:
+            nodes = [n for n in self._graph.all_nodes()
+                     if isinstance(n, BaseNode)]
+
+        node_map = {}
+        upstream = {}
+        stack = list(reversed(nodes))
+        while stack:
+            node = stack.pop()
+            if node.id in node_map:
+                continue
+            node_map[node.id] = node
+            upstream_nodes = {}
+            for port in node.input_ports():
+                for connected_port in port.connected_ports():
+                    upstream_node = connected_port.node()
+                    upstream_nodes[upstream_node.id] = upstream_node
+            upstream[node.id] = list(upstream_nodes.keys())
+            stack.extend(upstream_nodes.values())
+        return node_map, upstream
+
+    def schedule(self, nodes=None):
+        """
+        Returns the nodes in the order they're evaluated.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]):
+                nodes and their upstream nodes (default: all nodes).
+
+        Returns:
+            list[NodeGraphQt.BaseNode]: nodes in topological order.
+        """
+        node_map, upstream = self.dependencies(nodes)
+
+        in_degree = {node_id: len(ids) for node_id, ids in upstream.items()}
+        downstream = {node_id: [] for node_id in node_map}
+        for node_id, upstream_ids in upstream.items():
+            for upstream_id in upstream_ids:
+                downstream[upstream_id].append(node_id)
+
+        ready = deque(i for i, degree in in_degree.items() if degree == 0)
+        order = []
+        while ready:
+            node_id = ready.popleft()
+            order.append(node_map[node_id])
+            for downstream_id in downstream[node_id]:
+                in_degree[downstream_id] -= 1
+                if in_degree[downstream_id] == 0:
+                    ready.append(downstream_id)
+
+        if len(order) != len(node_map):
+            cycle = [node_map[i].name() for i, d in in_degree.items() if d]
+            raise NodeEvaluationError(
+                'Can\'t evaluate cyclic connections between nodes: {}'
+                .format(', '.join(sorted(cycle)))
+            )
+        return order
+
+    def evaluate(self, nodes=None):
+        """
+        Evaluate the nodes and the nodes upstream from them, nodes that
+        haven't changed since the last evaluation aren't recomputed.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]):
+                nodes to evaluate (default: all nodes).
+
+        Returns:
+            dict: ``{<node_id>: {<port_name>: <value>}}`` evaluated outputs.
+        """
+        recomputed = set()
+        results = {}
+        node_map, upstream = self.dependencies(nodes)
+        for node in self.schedule(list(node_map.values())):
+            inputs, connections = self._node_inputs(node)
+            if self._needs_compute(node, connections,
+                                   recomputed.intersection(upstream[node.id])):
+                key, outputs = self._cached_outputs(node, connections)
+                if outputs is None:
+                    start = time.perf_counter()
+                    outputs = self._compute(node, inputs)
+                    self._cache_outputs(key, outputs,
+                                        time.perf_counter() - start)
+                self._store_result(node, outputs, connections, key)
+                recomputed.add(node.id)
+            results[node.id] = self._results[node.id][0]
+
+        if nodes is not None:
+            return {n.id: results[n.id] for n in nodes}
+        return results
+
+    def _node_inputs(self, node):
+        """
+        Returns the input values for the node from the upstream outputs.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+
+        Returns:
+            tuple(dict, tuple):
+                ``{<port_name>: <value>}``, input port connections.
+        """
+        inputs = {}
+        connections = []
+        for port in node.input_ports():
+            values = []
+            for connected_port in port.connected_ports():
+                upstream_id = connected_port.node().id
+                outputs = self._results[upstream_id][0]
+                values.append(outputs.get(connected_port.name()))
+                connections.append(
+                    (port.name(), upstream_id, connected_port.name())
+                )
+            if port.multi_connection():
+                inputs[port.name()] = values
+            else:
+                inputs[port.name()] = values[0] if values else None
+        return inputs, tuple(connections)
+
+    def _needs_compute(self, node, connections, upstream_changed=False):
+        """
+        Returns true if the node outputs have to be recomputed.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            connections (tuple): input port connections.
+            upstream_changed (bool): upstream nodes have been recomputed.
+
+        Returns:
+            bool: true if the node needs to be computed.
+        """
+        cached = self._results.get(node.id)
+        return bool(node.id in self._dirty or cached is None or
+                    cached[1] != connections or upstream_changed)
+
+    def _store_result(self, node, outputs, connections, key=None):
+        """
+        Cache the computed node outputs.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            outputs (dict): {<port_name>: <value>}
+            connections (tuple): input port connections.
+            key (str): result cache key.
+        """
+        self._results[node.id] = (outputs, connections)
+        self._dirty.discard(node.id)
+        if key is None:
+            self._keys.pop(node.id, None)
+        else:
+            self._keys[node.id] = key
+
+    def _result_key(self, node, connections):
+        """
+        Returns the result cache key for the node from the node type,
+        custom properties and the upstream node keys.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            connections (tuple): input port connections.
+
+        Returns:
+            str: cache key or None if an upstream node has no key or the
+                node properties can't be hashed.
+        """
+        upstream_keys = []
+        for port_name, upstream_id, upstream_port in connections:
+            upstream_key = self._keys.get(upstream_id)
+            if upstream_key is None:
+                return
+            upstream_keys.append([port_name, upstream_key, upstream_port])
+        properties = [node.disabled(), node.model.custom_properties]
+        try:
+            return self._result_cache.hash_key(
+                node.type_, properties, upstream_keys
+            )
+        except TypeError:
+            # nodes with unhashable properties are always computed.
+            return
+
+    def _cached_outputs(self, node, connections):
+        """
+        Look up the node outputs from the result cache.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            connections (tuple): input port connections.
+
+        Returns:
+            tuple(str, dict): cache key, cached outputs or None.
+        """
+        if self._result_cache is None:
+            return None, None
+        key = self._result_key(node, connections)
+        if key is None:
+            return None, None
+        return key, self._result_cache.get(key, node.id)
+
+    def _cache_outputs(self, key, outputs, compute_time=0.0):
+        """
+        Add the computed node outputs to the result cache.
+
+        Args:
+            key (str): cache key.
+            outputs (dict): {<port_name>: <value>}
+            compute_time (float): seconds it took to compute the outputs.
+        """
+        if self._result_cache is not None and key is not None:
+            self._result_cache.set(key, outputs, compute_time)
+
+    def _compute(self, node, inputs):
+        """
+        Compute the node outputs.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            inputs (dict): {<port_name>: <value>}
+
+        Returns:
+            dict: {<port_name>: <value>}
+        """
+        if node.disabled():
+            return self._pass_through(node, inputs)
+        func, args = self._compute_call(node, inputs)
+        try:
+            outputs = func(*args)
+        except NodeEvaluationError:
+            raise
+        except Exception as e:
+            raise NodeEvaluationError(
+                'Failed to compute node "{}": {}'.format(node.name(), e)
+            ) from e
+        return dict(outputs or {})
+
+    @staticmethod
+    def _compute_call(node, inputs):
+        """
+        Returns the function that computes the node outputs and its
+        arguments for the node :attr:`BaseNode.COMPUTE_EXECUTOR`, so the
+        evaluator and the scheduler compute a node the same way.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            inputs (dict): {<port_name>: <value>}
+
+        Returns:
+            tuple(callable, tuple): compute function, arguments.
+        """
+        if node.COMPUTE_EXECUTOR == NodeExecutorEnum.PROCESS.value:
+            return (type(node).process_compute,
+                    (dict(node.model.custom_properties), inputs))
+        return node.compute, (inputs,)
+
+    @staticmethod
+    def _pass_through(node, inputs):
+        """
+        Outputs for a disabled node, the input values are passed through to
+        the output ports by index and the first input value to the remaining
+        output ports.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            inputs (dict): {<port_name>: <value>}
+
+        Returns:
+            dict: {<port_name>: <value>}
+        """
+        values = list(inputs.values())
+        outputs = {}
+        for idx, port in enumerate(node.output_ports()):
+            if idx < len(values):
+                outputs[port.name()] = values[idx]
+            else:
+                outputs[port.name()] = values[0] if values else None
+        return outputs
@@ -1,7 +1,63 @@
 #!/usr/bin/python
+import importlib
+
+from NodeGraphQt.constants import NODE_ENTRY_POINT_GROUP
 from NodeGraphQt.errors import NodeRegistrationError
 
 
+class LazyNode(object):
+    """
+    Placeholder for a node type registered with
+    :meth:`NodeFactory.register_lazy_node` that hasn't been imported yet.
+
+    It has the same ``type_`` and ``NODE_NAME`` attributes as the node class
+    so it can be displayed in the node widgets before the node class module
+    is imported.
+
+    Args:
+        node_type (str): node type identifier.
+        path (str): import path to the node class eg. ``"my_pkg.nodes:MyNode"``
+        name (str): node display name.
+    """
+
+    def __init__(self, node_type, path, name=None):
+        self.type_ = node_type
+        self.path = path
+        self.NODE_NAME = name or node_type.split('.')[-1]
+
+    def __repr__(self):
+        return '<{}("{}") object at {}>'.format(
+            self.__class__.__name__, self.type_, hex(id(self)))
+
+    def load(self):
+        """
+        Import the node class.
+
+        Returns:
+            type: node class.
+        """
+        if ':' in self.path:
+            module_name, class_name = self.path.split(':', 1)
+        else:
+            module_name, class_name = self.path.rsplit('.', 1)
+        try:
+            module = importlib.import_module(module_name)
+            node_cls = module
+            for attr in class_name.split('.'):
+                node_cls = getattr(node_cls, attr)
+        except (ImportError, AttributeError) as e:
+            raise NodeRegistrationError(
+                'Can\'t import node "{}" from "{}": {}'
+                .format(self.type_, self.path, e)
+            )
+        if node_cls.type_ != self.type_:
+            raise NodeRegistrationError(
+                'node "{}" imported from "{}" has the node type "{}"'
+                .format(self.type_, self.path, node_cls.type_)
+            )
+        return node_cls
+
+
 class NodeFactory(object):
     """
     Node factory that stores all the node types.
@@ -11,6 +67,43 @@ class NodeFactory(object):
         self.__aliases = {}
         self.__names = {}
         self.__nodes = {}
+        self.__lazy_nodes = {}
+
+        # true if the registry is shared with another factory.
+        self.__shared = False
+
+    def shared_copy(self):
+        """
+        Returns a new node factory that shares the registered nodes with this
+        factory instead of copying them.
+
+        The registered nodes are only copied the first time a node is
+        registered to the new factory (copy on write) so nodes registered
+        to it are not added to this factory.
+
+        Returns:
+            NodeFactory: node factory.
+        """
+        factory = NodeFactory()
+        factory.__aliases = self.__aliases
+        factory.__names = self.__names
+        factory.__nodes = self.__nodes
+        factory.__lazy_nodes = self.__lazy_nodes
+        factory.__shared = True
+        return factory
+
+    def _copy_on_write(self):
+        """
+        Copy the registered nodes if they're shared with another factory
+        before they're modified.
+        """
+        if not self.__shared:
+            return
+        self.__aliases = dict(self.__aliases)
+        self.__names = {k: list(v) for k, v in self.__names.items()}
+        self.__nodes = dict(self.__nodes)
+        self.__lazy_nodes = dict(self.__lazy_nodes)
+        self.__shared = False
 
     @property
     def names(self):
@@ -35,13 +128,60 @@ class NodeFactory(object):
     @property
     def nodes(self):
         """
-        Return all registered nodes.
+        Return all registered nodes that have been imported.
+
+        See Also:
+            :attr:`NodeFactory.lazy_nodes`
 
         Returns:
             dict: key=node identifier, value=node class
         """
         return self.__nodes
 
+    @property
+    def lazy_nodes(self):
+        """
+        Return lazy registered nodes that haven't been imported yet.
+
+        See Also:
+            :meth:`NodeFactory.register_lazy_node`
+
+        Returns:
+            dict: key=node identifier, value=LazyNode
+        """
+        return self.__lazy_nodes
+
+    def node_types(self):
+        """
+        Return all registered node type identifiers including the lazy
+        registered nodes.
+
+        Returns:
+            list[str]: node type identifiers.
+        """
+        return list(self.__nodes.keys()) + list(self.__lazy_nodes.keys())
+
+    def load_node(self, node_type):
+        """
+        Returns the registered node class and imports it if the node was
+        lazy registered.
+
+        Args:
+            node_type (str): node type or optional alias name.
+
+        Returns:
+            type: node class or None if the node type isn't registered.
+        """
+        if node_type in self.aliases:
+            node_type = self.aliases[node_type]
+
+        _NodeClass = self.__nodes.get(node_type)
+        if _NodeClass is None and node_type in self.__lazy_nodes:
+            _NodeClass = self.__lazy_nodes[node_type].load()
+            self.__lazy_nodes.pop(node_type)
+            self.__nodes[node_type] = _NodeClass
+        return _NodeClass
+
     def create_node_instance(self, node_type=None):
         # sourcery skip: use-named-expression
         """
@@ -56,7 +196,7 @@ class NodeFactory(object):
         if node_type in self.aliases:
             node_type = self.aliases[node_type]
 
-        _NodeClass = self.__nodes.get(node_type)
+        _NodeClass = self.load_node(node_type)
         if _NodeClass:
             return _NodeClass()
 
@@ -74,12 +214,92 @@ class NodeFactory(object):
         name = node.NODE_NAME
         node_type = node.type_
 
-        if self.__nodes.get(node_type):
+        registered = self.__nodes.get(node_type) or \
+            self.__lazy_nodes.get(node_type)
+        if registered:
             raise NodeRegistrationError(
-                f'node type "{node_type}" already registered to "{self.__nodes[node_type]}"! Please specify a new plugin class name or __identifier__.'
+                f'node type "{node_type}" already registered to "{registered}"! Please specify a new plugin class name or __identifier__.'
             )
+        self._copy_on_write()
         self.__nodes[node_type] = node
+        self._register_name(name, node_type, alias)
+
+    def register_lazy_node(self, node_type, path, name=None, alias=None):
+        """
+        register a node without importing the node class, the node class is
+        imported the first time the node is created.
+
+        .. code-block:: python
+            :linenos:
+
+            factory.register_lazy_node(
+                'io.github.jchanvfx.MyNode',
+                'my_package.nodes:MyNode',
+                name='My Node'
+            )
+
+        Args:
+            node_type (str): node type identifier
+                (``__identifier__.__className__``).
+            path (str): import path to the node class
+                ``"<module>:<class name>"`` or ``"<module>.<class name>"``.
+            name (str): node display name (default: the node class name).
+            alias (str): custom alias for the node identifier (optional).
+
+        Returns:
+            LazyNode: placeholder for the node class.
+        """
+        registered = self.__nodes.get(node_type) or \
+            self.__lazy_nodes.get(node_type)
+        if registered:
+            raise NodeRegistrationError(
+                f'node type "{node_type}" already registered to "{registered}"! Please specify a new plugin class name or __identifier__.'
+            )
+        lazy_node = LazyNode(node_type, path, name)
+        self._copy_on_write()
+        self.__lazy_nodes[node_type] = lazy_node
+        self._register_name(lazy_node.NODE_NAME, node_type, alias)
+        return lazy_node
 
+    def register_entry_points(self, group=NODE_ENTRY_POINT_GROUP):
+        """
+        lazy register the nodes from the installed package entry points.
+
+        The entry point name is the node type identifier and the value is the
+        import path to the node class.
+
+        .. code-block:: ini
+
+            [options.entry_points]
+            nodegraphqt.nodes =
+                io.github.jchanvfx.MyNode = my_package.nodes:MyNode
+
+        Args:
+            group (str): entry point group name.
+
+        Returns:
+            list[LazyNode]: placeholders for the registered node classes.
+        """
+        from importlib import metadata
+
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=group)
+        else:
+            entry_points = entry_points.get(group, [])
+
+        return [self.register_lazy_node(ep.name, ep.value)
+                for ep in entry_points]
+
+    def _register_name(self, name, node_type, alias=None):
+        """
+        register the node name and alias for the node type.
+
+        Args:
+            name (str): node name.
+            node_type (str): node type identifier.
+            alias (str): custom alias for the node identifier (optional).
+        """
         if self.__names.get(name):
             self.__names[name].append(node_type)
         else:
@@ -91,11 +311,14 @@ class NodeFactory(object):
                     f'Alias: "{alias}" already registered to "{self.__aliases.get(alias)}"'
                 )
             self.__aliases[alias] = node_type
-            
+
     def clear_registered_nodes(self):
         """
         clear out registered nodes, to prevent conflicts on reset.
         """
-        self.__nodes.clear()
-        self.__names.clear()
-        self.__aliases.clear()
+        # new registries so factories sharing the nodes aren't cleared.
+        self.__nodes = {}
+        self.__lazy_nodes = {}
+        self.__names = {}
+        self.__aliases = {}
+        self.__shared = False
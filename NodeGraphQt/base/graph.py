@@ -1,26 +1,37 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
-import copy
 import json
 import os
 import re
+from collections import OrderedDict
 
 from PySide6 import QtCore, QtWidgets,QtGui
 
+from NodeGraphQt.base.clipboard import NodeClipboard
 from NodeGraphQt.base.commands import (NodeAddedCmd,
-                                       NodesRemovedCmd,
+                                       NodesDeletedCmd,
                                        NodeMovedCmd,
                                        PortConnectedCmd)
+from NodeGraphQt.base.evaluator import NodeGraphEvaluator
 from NodeGraphQt.base.factory import NodeFactory
 from NodeGraphQt.base.menu import NodeGraphMenu, NodesMenu
-from NodeGraphQt.base.model import NodeGraphModel
+from NodeGraphQt.base.model import (
+    NodeGraphModel,
+    NodeIdAllocator,
+    SubGraphSession
+)
+from NodeGraphQt.base.profiler import NodeGraphProfiler
+from NodeGraphQt.base.scheduler import NodeGraphScheduler
 from NodeGraphQt.base.node import NodeObject
 from NodeGraphQt.base.port import Port
 from NodeGraphQt.constants import (
     MIME_TYPE,
+    NODE_ENTRY_POINT_GROUP,
+    SUB_GRAPH_CACHE_LIMIT,
     URI_SCHEME,
     URN_SCHEME,
     LayoutDirectionEnum,
+    NodeAlignEnum,
     PipeLayoutEnum,
     PortTypeEnum,
     ViewerEnum
@@ -35,6 +46,184 @@ from NodeGraphQt.widgets.viewer import NodeViewer
 from NodeGraphQt.widgets.viewer_nav import NodeNavigationWidget
 
 
+class SubGraphCache(object):
+    """
+    LRU cache that keeps collapsed :class:`SubGraph` instances and their
+    scenes alive so re-expanding a group node doesn't rebuild its session.
+
+    A cached sub graph is only serialized back to its group node when it's
+    evicted or when the group node session is requested (eg. saving the
+    session), cached sub graphs are evicted oldest first when the total
+    node count exceeds the cache limit.
+    """
+
+    def __init__(self, limit=SUB_GRAPH_CACHE_LIMIT):
+        # {<node_id>: (<sub_graph>, <subgraph_session>)}
+        self._sub_graphs = OrderedDict()
+        self._limit = limit
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def __contains__(self, node_id):
+        return node_id in self._sub_graphs
+
+    def __len__(self):
+        return len(self._sub_graphs)
+
+    @property
+    def limit(self):
+        """
+        Max number of nodes kept alive by the cached sub graphs.
+
+        Returns:
+            int: node count limit.
+        """
+        return self._limit
+
+    def set_limit(self, limit):
+        """
+        Set the max number of nodes kept alive by the cached sub graphs
+        (set to 0 to disable the cache).
+
+        Args:
+            limit (int): node count limit.
+        """
+        self._limit = max(0, int(limit))
+        self._trim()
+
+    def node_count(self):
+        """
+        Returns the total number of nodes in the cached sub graphs.
+
+        Returns:
+            int: node count.
+        """
+        return sum(len(sg.model.nodes) for sg, _ in self._sub_graphs.values())
+
+    def sub_graphs(self):
+        """
+        Returns the cached sub graphs from least to most recently used.
+
+        Returns:
+            list[NodeGraphQt.SubGraph]: sub graphs.
+        """
+        return [sg for sg, _ in self._sub_graphs.values()]
+
+    def add(self, sub_graph):
+        """
+        Add a collapsed sub graph to the cache.
+
+        Args:
+            sub_graph (NodeGraphQt.SubGraph): collapsed sub graph.
+        """
+        node = sub_graph.node
+        self._sub_graphs[node.id] = (sub_graph, node.model.subgraph_session)
+        self._sub_graphs.move_to_end(node.id)
+        self._trim()
+
+    def take(self, node, parent_graph):
+        """
+        Remove and return the cached sub graph for the group node.
+
+        Cached sub graphs that no longer match the group node (eg. the
+        sub graph session was set since it was collapsed) are discarded.
+
+        Args:
+            node (NodeGraphQt.GroupNode): group node.
+            parent_graph (NodeGraphQt.NodeGraph): graph expanding the node.
+
+        Returns:
+            NodeGraphQt.SubGraph: cached sub graph or None.
+        """
+        if node.id not in self._sub_graphs:
+            return
+        sub_graph, session = self._sub_graphs[node.id]
+        if (sub_graph.node is not node or
+                sub_graph.parent_graph is not parent_graph or
+                node.model.subgraph_session is not session):
+            self.evict(node.id, flush=False)
+            return
+        del self._sub_graphs[node.id]
+        return sub_graph
+
+    def flush(self, node):
+        """
+        Serialize the cached sub graph session to its group node.
+
+        Args:
+            node (NodeGraphQt.GroupNode): group node.
+        """
+        if node.id not in self._sub_graphs:
+            return
+        sub_graph, session = self._sub_graphs[node.id]
+        if sub_graph.node is not node:
+            return
+        node.set_sub_graph_session(
+            sub_graph._serialize(sub_graph.all_nodes(), lazy_sessions=True))
+        self._sub_graphs[node.id] = (sub_graph, node.model.subgraph_session)
+
+    def evict(self, node_id, flush=True):
+        """
+        Remove the cached sub graph and clear its session.
+
+        Args:
+            node_id (int): group node id.
+            flush (bool): serialize the session to the group node first.
+        """
+        if node_id not in self._sub_graphs:
+            return
+        sub_graph, session = self._sub_graphs.pop(node_id)
+
+        # cached child sub graphs first so their group nodes are updated
+        # before the parent sub graph is serialized.
+        self.evict_children(sub_graph, flush=flush)
+
+        if flush and sub_graph.node.model.subgraph_session is session:
+            sub_graph.node.set_sub_graph_session(sub_graph._serialize(
+                sub_graph.all_nodes(), lazy_sessions=True))
+        sub_graph.clear_session()
+        sub_graph.subviewer_widget.deleteLater()
+        if sub_graph.parent_graph.is_root and sub_graph._widget:
+            # top level sub graph widget that was removed from the tabs.
+            sub_graph._widget.deleteLater()
+
+    def evict_children(self, graph, flush=True):
+        """
+        Evict the cached sub graphs that were expanded from the graph.
+
+        Args:
+            graph (NodeGraphQt.NodeGraph): parent graph.
+            flush (bool): serialize the sessions to the group nodes first.
+        """
+        node_ids = [node_id for node_id, (sg, _) in self._sub_graphs.items()
+                    if sg.parent_graph is graph]
+        for node_id in node_ids:
+            self.evict(node_id, flush=flush)
+
+    def clear(self, flush=True):
+        """
+        Evict all the cached sub graphs.
+
+        Args:
+            flush (bool): serialize the sessions to the group nodes first.
+        """
+        for node_id in list(self._sub_graphs.keys()):
+            self.evict(node_id, flush=flush)
+
+    def _trim(self):
+        """
+        Evict the least recently used sub graphs until the cache is within
+        the node count limit.
+        """
+        count = self.node_count()
+        while self._sub_graphs and count > self._limit:
+            node_id = next(iter(self._sub_graphs))
+            self.evict(node_id)
+            count = self.node_count()
+
+
 class NodeGraph(QtCore.QObject):
     """
     The ``NodeGraph`` class is the main controller for managing all nodes
@@ -50,6 +239,7 @@ class NodeGraph(QtCore.QObject):
     nodes_registered = QtCore.Signal(list)
     """
     Signal triggered when a node is registered into the node graph.
+    (lazy registered nodes are emitted as ``LazyNode`` placeholders)
 
     :parameters: list[:class:`NodeGraphQt.NodeObject`]
     :emits: registered nodes
@@ -66,7 +256,7 @@ class NodeGraph(QtCore.QObject):
     """
     Signal triggered when nodes have been deleted from the node graph.
 
-    :parameters: list[str]
+    :parameters: list[int]
     :emits: list of deleted node ids.
     """
     node_selected = QtCore.Signal(NodeObject)
@@ -154,6 +344,10 @@ class NodeGraph(QtCore.QObject):
         )
         self._widget = None
         self._sub_graphs = {}
+        self._sub_graph_cache = SubGraphCache()
+        self._evaluator = None
+        self._scheduler = None
+        NodeGraphProfiler.instance().add_graph(self)
         self._viewer = (
             kwargs.get('viewer') or NodeViewer(undo_stack=self._undo_stack)
         )
@@ -223,6 +417,7 @@ class NodeGraph(QtCore.QObject):
         self._viewer.node_backdrop_updated.connect(
             self._on_node_backdrop_updated)
         self._viewer.insert_node.connect(self._on_insert_node)
+        self.nodes_deleted.connect(self._on_nodes_deleted)
 
         # pass through translated signals.
         self._viewer.node_selected.connect(self._on_node_selected)
@@ -237,7 +432,7 @@ class NodeGraph(QtCore.QObject):
 
         Args:
             menu_name (str): context menu name.
-            node_id (str): node id if triggered from the nodes context menu.
+            node_id (int): node id if triggered from the nodes context menu.
         """
         node = self.get_node_by_id(node_id)
         menu = self.get_context_menu(menu_name)
@@ -249,7 +444,7 @@ class NodeGraph(QtCore.QObject):
 
         Args:
             pipe (Pipe): collided pipe item.
-            node_id (str): selected node id to insert.
+            node_id (int): selected node id to insert.
             prev_node_pos (dict): previous node position. {NodeItem: [prev_x, prev_y]}
         """
         node = self.get_node_by_id(node_id)
@@ -281,7 +476,7 @@ class NodeGraph(QtCore.QObject):
         (emits the node object, property name, property value)
 
         Args:
-            node_id (str): node id.
+            node_id (int): node id.
             prop_name (str): node property name.
             prop_value (object): python built in types.
         """
@@ -297,7 +492,7 @@ class NodeGraph(QtCore.QObject):
         (sets the name through the node object so undo commands are registered.)
 
         Args:
-            node_id (str): node id emitted by the viewer.
+            node_id (int): node id emitted by the viewer.
             name (str): new node name.
         """
         node = self.get_node_by_id(node_id)
@@ -312,7 +507,7 @@ class NodeGraph(QtCore.QObject):
         (emits the node object when the node is clicked)
 
         Args:
-            node_id (str): node id emitted by the viewer.
+            node_id (int): node id emitted by the viewer.
         """
         node = self.get_node_by_id(node_id)
         self.node_double_clicked.emit(node)
@@ -323,7 +518,7 @@ class NodeGraph(QtCore.QObject):
         (emits the node object when the node is clicked)
 
         Args:
-            node_id (str): node id emitted by the viewer.
+            node_id (int): node id emitted by the viewer.
         """
         node = self.get_node_by_id(node_id)
         self.node_selected.emit(node)
@@ -334,8 +529,8 @@ class NodeGraph(QtCore.QObject):
         (emits node objects <selected nodes>, <deselected nodes>)
 
         Args:
-            sel_ids (list[str]): new selected node ids.
-            desel_ids (list[str]): deselected node ids.
+            sel_ids (list[int]): new selected node ids.
+            desel_ids (list[int]): deselected node ids.
         """
         sel_nodes = [self.get_node_by_id(nid) for nid in sel_ids]
         unsel_nodes = [self.get_node_by_id(nid) for nid in desel_ids]
@@ -410,12 +605,29 @@ class NodeGraph(QtCore.QObject):
             self._undo_stack.push(NodeMovedCmd(node, node.pos(), prev_pos))
         self._undo_stack.endMacro()
 
+    def _on_nodes_deleted(self, node_ids):
+        """
+        called when nodes have been removed from the node graph.
+
+        The cached sub graphs of the deleted group nodes are evicted into
+        their group node sessions, so undoing the deletion rebuilds them
+        from the session when they're expanded again.
+
+        Args:
+            node_ids (list[int]): deleted node ids.
+        """
+        sub_graph_cache = self.sub_graph_cache
+        if not len(sub_graph_cache):
+            return
+        for node_id in node_ids:
+            sub_graph_cache.evict(node_id)
+
     def _on_node_backdrop_updated(self, node_id, update_property, value):
         """
         called when a BackdropNode is updated.
 
         Args:
-            node_id (str): backdrop node id.
+            node_id (int): backdrop node id.
             value (str): update type.
         """
         backdrop = self.get_node_by_id(node_id)
@@ -505,6 +717,134 @@ class NodeGraph(QtCore.QObject):
         """
         return self._node_factory
 
+    @property
+    def evaluator(self):
+        """
+        Return the evaluator used to compute the nodes in the node graph.
+
+        See Also:
+            :meth:`BaseNode.compute`
+
+        Returns:
+            NodeGraphEvaluator: node graph evaluator.
+        """
+        if self._evaluator is None:
+            self._evaluator = NodeGraphEvaluator(self)
+        return self._evaluator
+
+    @property
+    def scheduler(self):
+        """
+        Return the scheduler used to compute the nodes in worker threads or
+        processes without blocking the node graph.
+
+        See Also:
+            :attr:`NodeGraph.evaluator`,
+            :attr:`BaseNode.COMPUTE_EXECUTOR`
+
+        Returns:
+            NodeGraphScheduler: node graph scheduler.
+        """
+        if self._scheduler is None:
+            self._scheduler = NodeGraphScheduler(self.evaluator, parent=self)
+        return self._scheduler
+
+    @property
+    def profiler(self):
+        """
+        Return the profiler that records the time spent in the node graph
+        operations, undo commands, signals and paint passes.
+
+        Note:
+            The profiler is shared by all node graphs and is disabled by
+            default.
+
+        See Also:
+            :meth:`NodeGraph.set_profiler_overlay_visible`
+
+        Returns:
+            NodeGraphProfiler: node graph profiler.
+        """
+        return NodeGraphProfiler.instance()
+
+    def profiler_overlay_visible(self):
+        """
+        Returns true if the profiler overlay is shown in the node graph.
+
+        Returns:
+            bool: true if visible.
+        """
+        return self._viewer.profiler_overlay_visible()
+
+    def set_profiler_overlay_visible(self, visible=True):
+        """
+        Show the recorded profiler stats in an overlay on top of the node
+        graph.
+
+        .. code-block:: python
+            :linenos:
+
+            graph = NodeGraph()
+            graph.profiler.enable()
+            graph.set_profiler_overlay_visible(True)
+
+        Args:
+            visible (bool): true to show the overlay.
+        """
+        self._viewer.set_profiler_overlay_visible(visible)
+
+    def paint_heat_map_visible(self):
+        """
+        Returns true if the paint cost heat map is shown in the node graph.
+
+        Returns:
+            bool: true if visible.
+        """
+        return self._viewer.paint_heat_map().is_enabled()
+
+    def set_paint_heat_map_visible(self, visible=True):
+        """
+        Measure the paint time of the nodes and pipes and tint them from
+        green to red by their cost with the most expensive node types listed
+        in the top right corner.
+
+        .. code-block:: python
+            :linenos:
+
+            graph = NodeGraph()
+            graph.set_paint_heat_map_visible(True)
+            ...
+            print(graph.paint_cost_node_types(limit=5))
+
+        Args:
+            visible (bool): true to show the heat map.
+        """
+        heat_map = self._viewer.paint_heat_map()
+        if visible == heat_map.is_enabled():
+            return
+        if visible:
+            heat_map.reset()
+            self.nodes_deleted.connect(heat_map.remove_nodes)
+        else:
+            self.nodes_deleted.disconnect(heat_map.remove_nodes)
+        heat_map.set_enabled(visible)
+
+    def paint_cost_node_types(self, limit=None):
+        """
+        Returns the node types with the most expensive paint time measured
+        by the paint cost heat map.
+
+        See Also:
+            :meth:`NodeGraph.set_paint_heat_map_visible`
+
+        Args:
+            limit (int): max number of node types.
+
+        Returns:
+            list[tuple]: (<node_type>, <total_seconds>, <paint_count>)
+        """
+        return self._viewer.paint_heat_map().node_type_costs(limit)
+
     @property
     def widget(self):
         """
@@ -1102,7 +1442,8 @@ class NodeGraph(QtCore.QObject):
         nodes = self.selected_nodes() or self.all_nodes()
         if not nodes:
             return
-        self._viewer.zoom_to_nodes([n.view for n in nodes])
+        self._viewer.zoom_to_rect(
+            QtCore.QRectF(*self.nodes_bounding_rect(nodes)))
 
     def reset_zoom(self):
         """
@@ -1135,8 +1476,97 @@ class NodeGraph(QtCore.QObject):
         Args:
             nodes (list[NodeGraphQt.BaseNode]): a list of nodes.
         """
-        nodes = nodes or []
-        self._viewer.center_selection([n.view for n in nodes])
+        nodes = nodes or self.selected_nodes() or self.all_nodes()
+        if not nodes:
+            return
+        self._viewer.center_on_rect(
+            QtCore.QRectF(*self.nodes_bounding_rect(nodes)))
+
+    def nodes_bounding_rect(self, nodes=None):
+        """
+        Returns the combined bounding rect of the nodes.
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes (default: all nodes).
+
+        Returns:
+            list[float]: x, y, width, height or None if there's no nodes.
+        """
+        node_ids = None if nodes is None else [n.id for n in nodes]
+        return self._model.geometry.bounding_rect(node_ids)
+
+    def nearest_node(self, pos, nodes=None):
+        """
+        Returns the node with the center closest to the position.
+
+        Args:
+            pos (list[float]): x, y scene position.
+            nodes (list[NodeGraphQt.NodeObject]): nodes to search
+                (default: all nodes).
+
+        Returns:
+            NodeGraphQt.NodeObject: closest node or None if there's no nodes.
+        """
+        node_ids = None if nodes is None else [n.id for n in nodes]
+        node_id = self._model.geometry.nearest(pos[0], pos[1], node_ids)
+        if node_id is not None:
+            return self._model.nodes[node_id]
+
+    def _set_nodes_pos(self, nodes, positions, undo_text):
+        """
+        Set the node positions in one undo macro.
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes.
+            positions (list[list[float]]): x, y positions.
+            undo_text (str): undo macro text.
+        """
+        self._undo_stack.beginMacro(undo_text)
+        for node, (x, y) in zip(nodes, positions):
+            if node.model.pos != [x, y]:
+                node.set_pos(x, y)
+        self._undo_stack.endMacro()
+
+    def align_nodes(self, nodes=None, alignment=NodeAlignEnum.LEFT.value):
+        """
+        Align the nodes to an edge or the center of their combined
+        bounding rect.
+
+        See Also:
+            :attr:`NodeGraphQt.constants.NodeAlignEnum`
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes
+                (default: selected nodes).
+            alignment (str): node alignment.
+        """
+        nodes = nodes or self.selected_nodes()
+        if len(nodes) < 2:
+            return
+        positions = self._model.geometry.aligned_positions(
+            [n.id for n in nodes], alignment)
+        self._set_nodes_pos(nodes, positions, 'align nodes')
+
+    def distribute_nodes(self, nodes=None,
+                         direction=LayoutDirectionEnum.HORIZONTAL.value):
+        """
+        Evenly space the nodes between the first and last node.
+
+        See Also:
+            :attr:`NodeGraphQt.constants.LayoutDirectionEnum`
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes
+                (default: selected nodes).
+            direction (int): horizontal distributes the nodes along the x axis
+                and vertical along the y axis.
+        """
+        nodes = nodes or self.selected_nodes()
+        if len(nodes) < 3:
+            return
+        positions = self._model.geometry.distributed_positions(
+            [n.id for n in nodes], direction)
+        self._set_nodes_pos(nodes, positions, 'distribute nodes')
 
     def center_selection(self):
         """
@@ -1155,7 +1585,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[str]: list of node type identifiers.
         """
-        return sorted(self._node_factory.nodes.keys())
+        return sorted(self._node_factory.node_types())
 
     def register_node(self, node, alias=None):
         """
@@ -1166,7 +1596,7 @@ class NodeGraph(QtCore.QObject):
             alias (str): custom alias name for the node type.
         """
         self._node_factory.register_node(node, alias)
-        self._viewer.rebuild_tab_search()
+        self._viewer.tab_search_add_nodes({node.NODE_NAME: [node.type_]})
         self.nodes_registered.emit([node])
 
     def register_nodes(self, nodes):
@@ -1176,10 +1606,113 @@ class NodeGraph(QtCore.QObject):
         Args:
             nodes (list): list of nodes.
         """
-        [self._node_factory.register_node(n) for n in nodes]
-        self._viewer.rebuild_tab_search()
+        node_names = {}
+        for n in nodes:
+            self._node_factory.register_node(n)
+            node_names.setdefault(n.NODE_NAME, []).append(n.type_)
+        self._viewer.tab_search_add_nodes(node_names)
         self.nodes_registered.emit(nodes)
 
+    def register_lazy_node(self, node_type, path, name=None, alias=None):
+        """
+        Register a node to the :meth:`NodeGraph.node_factory` without
+        importing the node class, the node class is only imported the first
+        time the node is created.
+
+        See Also:
+            :meth:`NodeGraph.register_entry_points`
+
+        Args:
+            node_type (str): node type identifier
+                (``__identifier__.__className__``).
+            path (str): import path to the node class
+                ``"<module>:<class name>"`` or ``"<module>.<class name>"``.
+            name (str): node display name (default: the node class name).
+            alias (str): custom alias name for the node type.
+        """
+        lazy_node = self._node_factory.register_lazy_node(
+            node_type, path, name, alias
+        )
+        self._viewer.tab_search_add_nodes({lazy_node.NODE_NAME: [node_type]})
+        self.nodes_registered.emit([lazy_node])
+
+    def register_entry_points(self, group=None):
+        """
+        Lazy register the node plugins declared as package entry points to
+        the :meth:`NodeGraph.node_factory`.
+
+        See Also:
+            :meth:`NodeFactory.register_entry_points`
+
+        Args:
+            group (str): entry point group name
+                (default: ``"nodegraphqt.nodes"``).
+        """
+        group = group or NODE_ENTRY_POINT_GROUP
+        lazy_nodes = self._node_factory.register_entry_points(group)
+        node_names = {}
+        for n in lazy_nodes:
+            node_names.setdefault(n.NODE_NAME, []).append(n.type_)
+        self._viewer.tab_search_add_nodes(node_names)
+        self.nodes_registered.emit(lazy_nodes)
+
+    def _register_node_attributes(self, node):
+        """
+        Register the node type common properties and the port connection
+        constrains from a new node instance to the node graph model.
+
+        The common properties are only registered for the first instance of
+        a node type added to the graph, the connection constrains are
+        registered for every instance.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        model = node.model
+        if self.model.get_node_common_properties(node.type_) is None:
+            node_attrs = {node.type_: {
+                n: {'widget_type': wt}
+                for n, wt in model._TEMP_property_widget_types.items()
+            }}
+            for pname, pattrs in model._TEMP_property_attrs.items():
+                node_attrs[node.type_][pname].update(pattrs)
+            self.model.set_node_common_properties(node_attrs)
+
+        accept_types = model._TEMP_accept_connection_types or {}
+        for ptype, pdata in accept_types.get(node.type_, {}).items():
+            for pname, accept_data in pdata.items():
+                for accept_ntype, accept_ndata in accept_data.items():
+                    for accept_ptype, accept_pnames in accept_ndata.items():
+                        for accept_pname in accept_pnames:
+                            self._model.add_port_accept_connection_type(
+                                port_name=pname,
+                                port_type=ptype,
+                                node_type=node.type_,
+                                accept_pname=accept_pname,
+                                accept_ptype=accept_ptype,
+                                accept_ntype=accept_ntype
+                            )
+        reject_types = model._TEMP_reject_connection_types or {}
+        for ptype, pdata in reject_types.get(node.type_, {}).items():
+            for pname, reject_data in pdata.items():
+                for reject_ntype, reject_ndata in reject_data.items():
+                    for reject_ptype, reject_pnames in reject_ndata.items():
+                        for reject_pname in reject_pnames:
+                            self._model.add_port_reject_connection_type(
+                                port_name=pname,
+                                port_type=ptype,
+                                node_type=node.type_,
+                                reject_pname=reject_pname,
+                                reject_ptype=reject_ptype,
+                                reject_ntype=reject_ntype
+                            )
+
+        # the temp attributes are only used before the node is added.
+        model._TEMP_property_widget_types = None
+        model._TEMP_property_attrs = None
+        model._TEMP_accept_connection_types = None
+        model._TEMP_reject_connection_types = None
+
     def create_node(self, node_type, name=None, selected=True, color=None,
                     text_color=None, pos=None, push_undo=True):
         """
@@ -1204,50 +1737,9 @@ class NodeGraph(QtCore.QObject):
         if node:
             node._graph = self
             node.model._graph_model = self.model
+            node.model.id = self._model.node_id_allocator.allocate()
 
-            wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-            prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
-
-            if self.model.get_node_common_properties(node.type_) is None:
-                node_attrs = {node.type_: {
-                    n: {'widget_type': wt} for n, wt in wid_types.items()
-                }}
-                for pname, pattrs in prop_attrs.items():
-                    node_attrs[node.type_][pname].update(pattrs)
-                self.model.set_node_common_properties(node_attrs)
-
-            accept_types = node.model.__dict__.pop(
-                '_TEMP_accept_connection_types'
-            )
-            for ptype, pdata in accept_types.get(node.type_, {}).items():
-                for pname, accept_data in pdata.items():
-                    for accept_ntype, accept_ndata in accept_data.items():
-                        for accept_ptype, accept_pnames in accept_ndata.items():
-                            for accept_pname in accept_pnames:
-                                self._model.add_port_accept_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    accept_pname=accept_pname,
-                                    accept_ptype=accept_ptype,
-                                    accept_ntype=accept_ntype
-                                )
-            reject_types = node.model.__dict__.pop(
-                '_TEMP_reject_connection_types'
-            )
-            for ptype, pdata in reject_types.get(node.type_, {}).items():
-                for pname, reject_data in pdata.items():
-                    for reject_ntype, reject_ndata in reject_data.items():
-                        for reject_ptype, reject_pnames in reject_ndata.items():
-                            for reject_pname in reject_pnames:
-                                self._model.add_port_reject_connection_type(
-                                    port_name=pname,
-                                    port_type=ptype,
-                                    node_type=node.type_,
-                                    reject_pname=reject_pname,
-                                    reject_ptype=reject_ptype,
-                                    reject_ntype=reject_ntype
-                                )
+            self._register_node_attributes(node)
 
             node.NODE_NAME = self.get_unique_name(name or node.NODE_NAME)
             node.model.name = node.NODE_NAME
@@ -1304,54 +1796,13 @@ class NodeGraph(QtCore.QObject):
         """
         assert isinstance(node, NodeObject), 'node must be a Node instance.'
 
-        wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
-        prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
-
-        if self.model.get_node_common_properties(node.type_) is None:
-            node_attrs = {node.type_: {
-                n: {'widget_type': wt} for n, wt in wid_types.items()
-            }}
-            for pname, pattrs in prop_attrs.items():
-                node_attrs[node.type_][pname].update(pattrs)
-            self.model.set_node_common_properties(node_attrs)
-
-        accept_types = node.model.__dict__.pop(
-            '_TEMP_accept_connection_types'
-        )
-        for ptype, pdata in accept_types.get(node.type_, {}).items():
-            for pname, accept_data in pdata.items():
-                for accept_ntype, accept_ndata in accept_data.items():
-                    for accept_ptype, accept_pnames in accept_ndata.items():
-                        for accept_pname in accept_pnames:
-                            self._model.add_port_accept_connection_type(
-                                port_name=pname,
-                                port_type=ptype,
-                                node_type=node.type_,
-                                accept_pname=accept_pname,
-                                accept_ptype=accept_ptype,
-                                accept_ntype=accept_ntype
-                            )
-        reject_types = node.model.__dict__.pop(
-            '_TEMP_reject_connection_types'
-        )
-        for ptype, pdata in reject_types.get(node.type_, {}).items():
-            for pname, reject_data in pdata.items():
-                for reject_ntype, reject_ndata in reject_data.items():
-                    for reject_ptype, reject_pnames in reject_ndata.items():
-                        for reject_pname in reject_pnames:
-                            self._model.add_port_reject_connection_type(
-                                port_name=pname,
-                                port_type=ptype,
-                                node_type=node.type_,
-                                reject_pname=reject_pname,
-                                reject_ptype=reject_ptype,
-                                reject_ntype=reject_ntype
-                            )
+        self._register_node_attributes(node)
 
         node._graph = self
         node.NODE_NAME = self.get_unique_name(node.NODE_NAME)
         node.model._graph_model = self.model
         node.model.name = node.NODE_NAME
+        node.model.id = self._model.node_id_allocator.allocate()
 
         # initial node direction layout.
         node.model.layout_direction = self.layout_direction()
@@ -1379,34 +1830,12 @@ class NodeGraph(QtCore.QObject):
         """
         assert isinstance(node, NodeObject), \
             'node must be a instance of a NodeObject.'
-        node_id = node.id
-        if push_undo:
-            self._undo_stack.beginMacro('delete node: "{}"'.format(node.name()))
-
-        if isinstance(node, BaseNode):
-            for p in node.input_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-            for p in node.output_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-
-        # collapse group node before removing.
-        if isinstance(node, GroupNode) and node.is_expanded:
-            node.collapse()
-
-        undo_cmd = NodesRemovedCmd(self, [node], emit_signal=True)
-        if push_undo:
-            self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+        self._delete_nodes(
+            [node],
+            push_undo=push_undo,
+            emit_signal=True,
+            undo_text='delete node: "{}"'.format(node.name())
+        )
 
     def remove_node(self, node, push_undo=True):
         """
@@ -1421,82 +1850,60 @@ class NodeGraph(QtCore.QObject):
 
         """
         assert isinstance(node, NodeObject), 'node must be a Node instance.'
-
-        if push_undo:
-            self._undo_stack.beginMacro('delete node: "{}"'.format(node.name()))
-
-        # collapse group node before removing.
-        if isinstance(node, GroupNode) and node.is_expanded:
-            node.collapse()
-
-        if isinstance(node, BaseNode):
-            for p in node.input_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-            for p in node.output_ports():
-                if p.locked():
-                    p.set_locked(False,
-                                 connected_ports=False,
-                                 push_undo=push_undo)
-                p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, [node], emit_signal=False)
-        if push_undo:
-            self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+        self._delete_nodes(
+            [node],
+            push_undo=push_undo,
+            emit_signal=False,
+            undo_text='delete node: "{}"'.format(node.name())
+        )
 
     def delete_nodes(self, nodes, push_undo=True):
         """
         Remove a list of specified nodes from the node graph.
 
+        The nodes and their pipe connections are removed in one pass with a
+        single undo command and a single :attr:`NodeGraph.nodes_deleted`
+        signal.
+
         Args:
             nodes (list[NodeGraphQt.BaseNode]): list of node instances.
             push_undo (bool): register the command to the undo stack. (default: True)
         """
         if not nodes:
             return
-        if len(nodes) == 1:
-            self.delete_node(nodes[0], push_undo=push_undo)
-            return
-        node_ids = [n.id for n in nodes]
-        if push_undo:
-            self._undo_stack.beginMacro(
-                'deleted "{}" node(s)'.format(len(nodes))
-            )
-        for node in nodes:
+        self._delete_nodes(
+            nodes,
+            push_undo=push_undo,
+            emit_signal=True,
+            undo_text='deleted "{}" node(s)'.format(len(nodes))
+        )
+
+    def _delete_nodes(self, nodes, push_undo=True, emit_signal=True,
+                      undo_text=None):
+        """
+        Remove the nodes and their connections with a bulk delete command.
+        (used internally by the node graph)
 
-            # collapse group node before removing.
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of node instances.
+            push_undo (bool): register the command to the undo stack.
+            emit_signal (bool): emit the :attr:`NodeGraph.nodes_deleted`
+                signal.
+            undo_text (str): undo command text.
+        """
+        # collapse group node before removing.
+        for node in nodes:
             if isinstance(node, GroupNode) and node.is_expanded:
                 node.collapse()
 
-            if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=push_undo)
-                    p.clear_connections(push_undo=push_undo)
-
-        undo_cmd = NodesRemovedCmd(self, nodes, emit_signal=True)
+        undo_cmd = NodesDeletedCmd(self, nodes, emit_signal=emit_signal)
+        if undo_text:
+            undo_cmd.setText(undo_text)
         if push_undo:
             self._undo_stack.push(undo_cmd)
-            self._undo_stack.endMacro()
         else:
             undo_cmd.redo()
 
-        self.nodes_deleted.emit(node_ids)
-
     def extract_nodes(self, nodes, push_undo=True, prompt_warning=True):
         """
         Extract select nodes from its connections.
@@ -1597,14 +2004,17 @@ class NodeGraph(QtCore.QObject):
 
     def get_node_by_id(self, node_id=None):
         """
-        Returns the node from the node id string.
+        Returns the node from the node id.
 
         Args:
-            node_id (str): node id (:attr:`NodeObject.id`)
+            node_id (int or str): node id (:attr:`NodeObject.id`) or the
+                string form of the node id.
 
         Returns:
             NodeGraphQt.NodeObject: node object.
         """
+        if isinstance(node_id, str):
+            node_id = NodeIdAllocator.from_str(node_id)
         return self._model.nodes.get(node_id, None)
 
     def get_node_by_name(self, name):
@@ -1676,28 +2086,37 @@ class NodeGraph(QtCore.QObject):
         """
         Clears the current node graph session.
         """
+        # the nodes are removed without any undo data as the undo stack is
+        # cleared anyway.
         nodes = self.all_nodes()
-        for n in nodes:
-            if isinstance(n, BaseNode):
-                for p in n.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-                for p in n.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
+        node_ids = [n.id for n in nodes]
+        self.scene().remove_items(
+            self._viewer.all_pipes() + [n.view for n in nodes])
+        for node in nodes:
+            for port_view in getattr(node.view, 'inputs', []):
+                del port_view.connected_pipes[:]
+            for port_view in getattr(node.view, 'outputs', []):
+                del port_view.connected_pipes[:]
+        self._model.clear_nodes()
+
+        # cached sub graphs of the removed group nodes.
+        self.sub_graph_cache.evict_children(self, flush=False)
+
+        if node_ids:
+            self.nodes_deleted.emit(node_ids)
+
         self._undo_stack.clear()
         self._model.session = ''
 
-    def _serialize(self, nodes):
+    def _serialize(self, nodes, lazy_sessions=False):
         """
         serialize nodes to a dict.
         (used internally by the node graph)
 
         Args:
             nodes (list[NodeGraphQt.Nodes]): list of node instances.
+            lazy_sessions (bool): keep the group node sessions that haven't
+                been decoded as :class:`SubGraphSession` objects.
 
         Returns:
             dict: serialized data.
@@ -1716,15 +2135,21 @@ class NodeGraph(QtCore.QObject):
         serial_data['graph']['accept_connection_types'] = self.model.accept_connection_types
         serial_data['graph']['reject_connection_types'] = self.model.reject_connection_types
 
+        # node ids are only resolved to existing nodes in the same id space.
+        serial_data['graph']['node_id_space'] = \
+            self._model.node_id_allocator.uid
+
         # serialize nodes.
         for n in nodes:
             # update the node model.
             n.update_model()
 
-            node_dict = n.model.to_dict
+            node_dict = n.model._to_dict(lazy_sessions)
             nodes_data.update(node_dict)
 
+        to_str = NodeIdAllocator.to_str
         for n_id, n_data in nodes_data.items():
+            n_id = to_str(n_id)
             serial_data['nodes'][n_id] = n_data
 
             # serialize connections
@@ -1736,7 +2161,7 @@ class NodeGraph(QtCore.QObject):
                     for conn_prt in prt_names:
                         pipe = {
                             PortTypeEnum.IN.value: [n_id, pname],
-                            PortTypeEnum.OUT.value: [conn_id, conn_prt]
+                            PortTypeEnum.OUT.value: [to_str(conn_id), conn_prt]
                         }
                         if pipe not in serial_data['connections']:
                             serial_data['connections'].append(pipe)
@@ -1746,7 +2171,7 @@ class NodeGraph(QtCore.QObject):
                     for conn_prt in prt_names:
                         pipe = {
                             PortTypeEnum.OUT.value: [n_id, pname],
-                            PortTypeEnum.IN.value: [conn_id, conn_prt]
+                            PortTypeEnum.IN.value: [to_str(conn_id), conn_prt]
                         }
                         if pipe not in serial_data['connections']:
                             serial_data['connections'].append(pipe)
@@ -1769,6 +2194,9 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
         """
+        # nested group node sessions are decoded when they're expanded.
+        data = SubGraphSession.unpack(data)
+
         # update node graph properties.
         for attr_name, attr_value in data.get('graph', {}).items():
             if attr_name == 'layout_direction':
@@ -1815,16 +2243,25 @@ class NodeGraph(QtCore.QObject):
                         'output_ports': n_data['output_ports']
                     })
 
+        # nodes get new ids, connections to nodes that are not in the data
+        # are only made to existing nodes from the same id space.
+        id_space = data.get('graph', {}).get('node_id_space')
+        same_id_space = id_space == self._model.node_id_allocator.uid
+
         # build the connections.
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
-            in_node = nodes.get(nid) or self.get_node_by_id(nid)
+            in_node = nodes.get(nid)
+            if in_node is None and same_id_space:
+                in_node = self.get_node_by_id(nid)
             if not in_node:
                 continue
             in_port = in_node.inputs().get(pname) if in_node else None
 
             nid, pname = connection.get('out', ('', ''))
-            out_node = nodes.get(nid) or self.get_node_by_id(nid)
+            out_node = nodes.get(nid)
+            if out_node is None and same_id_space:
+                out_node = self.get_node_by_id(nid)
             if not out_node:
                 continue
             out_port = out_node.outputs().get(pname) if out_node else None
@@ -1833,7 +2270,7 @@ class NodeGraph(QtCore.QObject):
                 # only connect if input port is not connected yet or input port
                 # can have multiple connections.
                 # important when duplicating nodes.
-                allow_connection = any([not in_port.model.connected_ports,
+                allow_connection = any([not in_port.model.connections(),
                                         in_port.model.multi_connection])
                 if allow_connection:
                     self._undo_stack.push(
@@ -1845,12 +2282,11 @@ class NodeGraph(QtCore.QObject):
                 in_node.on_input_connected(in_port, out_port)
 
         node_objs = nodes.values()
-        if relative_pos:
-            self._viewer.move_nodes([n.view for n in node_objs])
-            [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
-        elif pos:
-            self._viewer.move_nodes([n.view for n in node_objs], pos=pos)
-            [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
+        if relative_pos or pos:
+            offset = self._viewer.move_nodes(
+                [n.view for n in node_objs], pos=None if relative_pos else pos)
+            self._model.geometry.translate(
+                [n.id for n in node_objs], offset[0], offset[1])
 
         return node_objs
 
@@ -1902,21 +2338,20 @@ class NodeGraph(QtCore.QObject):
         Args:
             file_path (str): path to the saved node layout.
         """
-        serialized_data = self.serialize_session()
+        # group node sessions are saved to a side-car chunk so they're only
+        # decoded when expanded after the session is loaded.
+        serialized_data = SubGraphSession.pack(
+            self._serialize(self.all_nodes(), lazy_sessions=True)
+        )
         file_path = file_path.strip()
 
-        def default(obj):
-            if isinstance(obj, set):
-                return list(obj)
-            return obj
-
         with open(file_path, 'w') as file_out:
             json.dump(
                 serialized_data,
                 file_out,
                 indent=2,
                 separators=(',', ':'),
-                default=default
+                default=SubGraphSession.json_default
             )
 
     def load_session(self, file_path):
@@ -1971,7 +2406,10 @@ class NodeGraph(QtCore.QObject):
 
     def copy_nodes(self, nodes=None):
         """
-        Copy nodes to the clipboard as a JSON formatted ``str``.
+        Copy nodes to the clipboard.
+
+        The nodes are copied as a compact binary payload with a private MIME
+        type and also as ``JSON`` formatted text for small selections.
 
         See Also:
             :meth:`NodeGraph.cut_nodes`
@@ -1983,17 +2421,13 @@ class NodeGraph(QtCore.QObject):
         nodes = nodes or self.selected_nodes()
         if not nodes:
             return False
-        clipboard = QtWidgets.QApplication.clipboard()
-        serial_data = self._serialize(nodes)
-        serial_str = json.dumps(serial_data)
-        if serial_str:
-            clipboard.setText(serial_str)
-            return True
-        return False
+        return NodeClipboard.set_data(
+            self._serialize(nodes, lazy_sessions=True), len(nodes)
+        )
 
     def cut_nodes(self, nodes=None):
         """
-        Cut nodes to the clipboard as a JSON formatted ``str``.
+        Cut nodes to the clipboard.
 
         Note:
             This function doesn't trigger the
@@ -2007,30 +2441,10 @@ class NodeGraph(QtCore.QObject):
                 list of nodes (default: selected nodes).
         """
         nodes = nodes or self.selected_nodes()
+        if not nodes:
+            return
         self.copy_nodes(nodes)
-        self._undo_stack.beginMacro('cut nodes')
-
-        for node in nodes:
-            if isinstance(node, BaseNode):
-                for p in node.input_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=True)
-                    p.clear_connections()
-                for p in node.output_ports():
-                    if p.locked():
-                        p.set_locked(False,
-                                     connected_ports=False,
-                                     push_undo=True)
-                    p.clear_connections()
-
-            # collapse group node before removing.
-            if isinstance(node, GroupNode) and node.is_expanded:
-                node.collapse()
-
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
-        self._undo_stack.endMacro()
+        self._delete_nodes(nodes, undo_text='cut nodes')
 
     def paste_nodes(self):
         """
@@ -2039,16 +2453,8 @@ class NodeGraph(QtCore.QObject):
         Returns:
             list[NodeGraphQt.BaseNode]: list of pasted node instances.
         """
-        clipboard = QtWidgets.QApplication.clipboard()
-        cb_text = clipboard.text()
-        if not cb_text:
-            return
-
-        try:
-            serial_data = json.loads(cb_text)
-        except json.decoder.JSONDecodeError as e:
-            print('ERROR: Can\'t Decode Clipboard Data:\n'
-                  '"{}"'.format(cb_text))
+        serial_data = NodeClipboard.data()
+        if not serial_data:
             return
 
         self._undo_stack.beginMacro('pasted nodes')
@@ -2073,7 +2479,7 @@ class NodeGraph(QtCore.QObject):
         self._undo_stack.beginMacro('duplicate nodes')
 
         self.clear_selection()
-        serial = self._serialize(nodes)
+        serial = self._serialize(nodes, lazy_sessions=True)
         new_nodes = self._deserialize(serial)
         offset = 50
         for n in new_nodes:
@@ -2219,8 +2625,9 @@ class NodeGraph(QtCore.QObject):
         if not start_nodes:
             return
 
-        node_views = [n.view for n in nodes]
-        nodes_center_0 = self.viewer().nodes_rect_center(node_views)
+        geometry = self._model.geometry
+        node_ids = [n.id for n in nodes]
+        nodes_center_0 = geometry.center(node_ids)
 
         nodes_rank = NodeGraph._compute_node_rank(start_nodes, down_stream)
 
@@ -2264,7 +2671,7 @@ class NodeGraph(QtCore.QObject):
 
                 current_y += max_height * 0.5 + 100
 
-        nodes_center_1 = self.viewer().nodes_rect_center(node_views)
+        nodes_center_1 = geometry.center(node_ids)
         dx = nodes_center_0[0] - nodes_center_1[0]
         dy = nodes_center_0[1] - nodes_center_1[1]
         [n.set_pos(n.x_pos() + dx, n.y_pos() + dy) for n in nodes]
@@ -2392,6 +2799,16 @@ class NodeGraph(QtCore.QObject):
         """
         return self._sub_graphs
 
+    @property
+    def sub_graph_cache(self):
+        """
+        Returns the cache that keeps collapsed group node sub graphs alive.
+
+        Returns:
+            SubGraphCache: sub graph cache.
+        """
+        return self._sub_graph_cache
+
     # def graph_rect(self):
     #     """
     #     Get the graph viewer range (scene size).
@@ -2434,21 +2851,29 @@ class NodeGraph(QtCore.QObject):
             self._widget.setCurrentIndex(tab_index)
             return sub_graph
 
-        # build new sub graph.
-        node_factory = copy.deepcopy(self.node_factory)
-        layout_direction = self.layout_direction()
-        kwargs = {
-            'layout_direction': self.layout_direction(),
-            'pipe_style': self.pipe_style(),
-        }
-        sub_graph = SubGraph(self,
-                             node=node,
-                             node_factory=node_factory,
-                             **kwargs)
-
-        # populate the sub graph.
-        session = node.get_sub_graph_session()
-        sub_graph.deserialize_session(session)
+        # re-use the sub graph if it's still cached from the last collapse.
+        sub_graph = self.sub_graph_cache.take(node, self)
+        if sub_graph:
+            sub_graph._sub_graphs[node.id] = sub_graph
+            sub_graph._initialized_graphs = [sub_graph]
+            sub_graph.widget.add_viewer(sub_graph.subviewer_widget,
+                                        node.name(),
+                                        node.id)
+        else:
+            # build new sub graph.
+            node_factory = self.node_factory.shared_copy()
+            kwargs = {
+                'layout_direction': self.layout_direction(),
+                'pipe_style': self.pipe_style(),
+            }
+            sub_graph = SubGraph(self,
+                                 node=node,
+                                 node_factory=node_factory,
+                                 **kwargs)
+
+            # populate the sub graph.
+            session = node._sub_graph_session()
+            sub_graph.deserialize_session(session)
 
         # store reference to expanded.
         self._sub_graphs[node.id] = sub_graph
@@ -2515,6 +2940,10 @@ class SubGraph(NodeGraph):
         self._parent_graph = parent
         self._subviewer_widget = None
 
+        # node ids are allocated from the root node graph.
+        self._model.node_id_allocator = \
+            self._parent_graph.model.node_id_allocator
+
         if self._parent_graph.is_root:
             self._initialized_graphs = [self]
             self._sub_graphs[self._node.id] = self
@@ -2523,6 +2952,9 @@ class SubGraph(NodeGraph):
             del self._widget
             del self._sub_graphs
 
+        # sub graphs share the cache from the root node graph.
+        del self._sub_graph_cache
+
         # clone context menu from the parent node graph.
         self._clone_context_menu_from_parent()
 
@@ -2639,6 +3071,9 @@ class SubGraph(NodeGraph):
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
         """
+        # nested group node sessions are decoded when they're expanded.
+        data = SubGraphSession.unpack(data)
+
         # update node graph properties.
         for attr_name, attr_value in data.get('graph', {}).items():
             if attr_name == 'acyclic':
@@ -2705,12 +3140,11 @@ class SubGraph(NodeGraph):
                 )
 
         node_objs = list(nodes.values())
-        if relative_pos:
-            self._viewer.move_nodes([n.view for n in node_objs])
-            [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
-        elif pos:
-            self._viewer.move_nodes([n.view for n in node_objs], pos=pos)
-            [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
+        if relative_pos or pos:
+            offset = self._viewer.move_nodes(
+                [n.view for n in node_objs], pos=None if relative_pos else pos)
+            self._model.geometry.translate(
+                [n.id for n in node_objs], offset[0], offset[1])
 
         return node_objs
 
@@ -2719,8 +3153,8 @@ class SubGraph(NodeGraph):
         Slot when the node navigation widget has changed.
 
         Args:
-            node_id (str): selected group node id.
-            rm_node_ids (list[str]): list of group node id to remove.
+            node_id (int): selected group node id.
+            rm_node_ids (list[int]): list of group node id to remove.
         """
         # collapse child sub graphs.
         for rm_node_id in rm_node_ids:
@@ -2755,6 +3189,17 @@ class SubGraph(NodeGraph):
             return self._sub_graphs
         return self.parent_graph.sub_graphs
 
+    @property
+    def sub_graph_cache(self):
+        """
+        Returns the cache that keeps collapsed group node sub graphs alive
+        from the root node graph.
+
+        Returns:
+            SubGraphCache: sub graph cache.
+        """
+        return self.parent_graph.sub_graph_cache
+
     @property
     def initialized_graphs(self):
         """
@@ -2891,10 +3336,6 @@ class SubGraph(NodeGraph):
         Args:
             clear_session (bool): clear the current session.
         """
-        # update the group node.
-        serialized_session = self.serialize_session()
-        self.node.set_sub_graph_session(serialized_session)
-
         # close the visible widgets.
         if self._undo_view:
             self._undo_view.close()
@@ -2903,6 +3344,10 @@ class SubGraph(NodeGraph):
             self.widget.hide_viewer(self._subviewer_widget)
 
         if clear_session:
+            # update the group node.
+            serialized_session = self._serialize(
+                self.all_nodes(), lazy_sessions=True)
+            self.node.set_sub_graph_session(serialized_session)
             self.clear_session()
 
     def expand_group_node(self, node):
@@ -2938,16 +3383,19 @@ class SubGraph(NodeGraph):
             # close the widgets
             grp_sub_graph.collapse_graph(clear_session=False)
 
-        # build new sub graph.
-        node_factory = copy.deepcopy(self.node_factory)
-        sub_graph = SubGraph(self,
-                             node=node,
-                             node_factory=node_factory,
-                             layout_direction=self.layout_direction())
+        # re-use the sub graph if it's still cached from the last collapse.
+        sub_graph = self.sub_graph_cache.take(node, self)
+        if sub_graph is None:
+            # build new sub graph.
+            node_factory = self.node_factory.shared_copy()
+            sub_graph = SubGraph(self,
+                                 node=node,
+                                 node_factory=node_factory,
+                                 layout_direction=self.layout_direction())
 
-        # populate the sub graph.
-        serialized_session = node.get_sub_graph_session()
-        sub_graph.deserialize_session(serialized_session)
+            # populate the sub graph.
+            serialized_session = node._sub_graph_session()
+            sub_graph.deserialize_session(serialized_session)
 
         # open new sub graph view.
         self.widget.add_viewer(sub_graph.subviewer_widget,
@@ -2983,12 +3431,22 @@ class SubGraph(NodeGraph):
         for child_id in child_ids:
             if self.sub_graphs.get(child_id):
                 child_graph = self.sub_graphs.pop(child_id)
-                child_graph.collapse_graph(clear_session=True)
-                # remove child viewer widget.
-                self.widget.remove_viewer(child_graph.subviewer_widget)
+                self._release_sub_graph(child_graph)
 
-        sub_graph.collapse_graph(clear_session=True)
-        self.widget.remove_viewer(sub_graph.subviewer_widget)
+        self._release_sub_graph(sub_graph)
+
+    def _release_sub_graph(self, sub_graph):
+        """
+        Collapse the sub graph and hand it to the sub graph cache, the
+        session is only serialized and cleared once it's evicted.
+
+        Args:
+            sub_graph (NodeGraphQt.SubGraph): sub graph to collapse.
+        """
+        sub_graph.collapse_graph(clear_session=False)
+        # remove the viewer widget without deleting it.
+        self.widget.remove_viewer(sub_graph.subviewer_widget, delete=False)
+        self.sub_graph_cache.add(sub_graph)
 
     def get_input_port_nodes(self):
         """
@@ -0,0 +1,88 @@
+#!/usr/bin/python
+import functools
+import time
+
+# {(<class>, <method name>): (<original function>, [<callbacks>])}
+_HOOKS = {}
+# (<object id>, <method name>) of the hooked calls in progress.
+_ACTIVE = set()
+
+
+def class_tree(cls):
+    """
+    Returns the class and all of its sub classes.
+
+    Args:
+        cls (type): base class.
+
+    Returns:
+        list[type]: classes.
+    """
+    classes = [cls]
+    for sub_cls in cls.__subclasses__():
+        for c in class_tree(sub_cls):
+            if c not in classes:
+                classes.append(c)
+    return classes
+
+
+def add_method_hook(cls, name, callback):
+    """
+    Time the calls to a method defined on the class and call the callback
+    with ``(<object>, <seconds>, <args>)`` after each call.
+
+    The timed wrapper is only installed while the method has callbacks and
+    calls to the super class method from an override are part of the outer
+    call's time.
+
+    Args:
+        cls (type): class that defines the method.
+        name (str): method name.
+        callback (function): hook function.
+    """
+    key = (cls, name)
+    if key in _HOOKS:
+        _HOOKS[key][1].append(callback)
+        return
+
+    func = cls.__dict__[name]
+    callbacks = [callback]
+
+    @functools.wraps(func)
+    def wrapper(obj, *args, **kwargs):
+        call_key = (id(obj), name)
+        if call_key in _ACTIVE:
+            return func(obj, *args, **kwargs)
+        _ACTIVE.add(call_key)
+        start = time.perf_counter()
+        try:
+            return func(obj, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            _ACTIVE.discard(call_key)
+            for hook in list(callbacks):
+                hook(obj, seconds, args)
+
+    _HOOKS[key] = (func, callbacks)
+    setattr(cls, name, wrapper)
+
+
+def remove_method_hook(cls, name, callback):
+    """
+    Remove a hook added with :func:`add_method_hook`, the original method is
+    restored when there are no hooks left.
+
+    Args:
+        cls (type): class that defines the method.
+        name (str): method name.
+        callback (function): hook function.
+    """
+    key = (cls, name)
+    if key not in _HOOKS:
+        return
+    func, callbacks = _HOOKS[key]
+    if callback in callbacks:
+        callbacks.remove(callback)
+    if not callbacks:
+        del _HOOKS[key]
+        setattr(cls, name, func)
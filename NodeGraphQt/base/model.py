@@ -1,34 +1,206 @@
 #!/usr/bin/python
 import json
-from collections import defaultdict
+import sys
+import uuid
+from array import array
+from collections.abc import Mapping
+from types import MappingProxyType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from NodeGraphQt.constants import (
     LayoutDirectionEnum,
+    NodeAlignEnum,
     NodePropWidgetEnum,
-    PipeLayoutEnum
+    PipeLayoutEnum,
+    PortTypeEnum
 )
 from NodeGraphQt.errors import NodePropertyError
 
 
+# max number of shared attribute templates kept in a template cache.
+_TEMPLATE_CACHE_LIMIT = 4096
+
+
+def _share_template(template, cache):
+    """
+    Returns the shared attribute template equal to the template.
+
+    Templates with unhashable values (eg. a color list) aren't shared.
+
+    Args:
+        template (tuple): attribute values.
+        cache (dict): template cache.
+
+    Returns:
+        tuple: shared attribute values.
+    """
+    try:
+        shared = cache.get(template)
+    except TypeError:
+        return template
+    if shared is None:
+        if len(cache) >= _TEMPLATE_CACHE_LIMIT:
+            cache.clear()
+        shared = cache[template] = template
+    return shared
+
+
+def _template_property(index, doc):
+    """
+    Returns a property for a value in the shared attribute template of a
+    model, setting the value swaps the model to another shared template.
+
+    Args:
+        index (int): value index in the template.
+        doc (str): property docstring.
+
+    Returns:
+        property: template value property.
+    """
+    def fget(self):
+        return self._template[index]
+
+    def fset(self, value):
+        template = self._template
+        self._template = _share_template(
+            template[:index] + (value,) + template[index + 1:],
+            self._TEMPLATES
+        )
+
+    return property(fget, fset, doc=doc)
+
+
 class PortModel(object):
     """
     Data dump for a port object.
+
+    The port attributes are kept in a template shared by all the ports with
+    the same attributes (eg. the same port on every node of a type) and the
+    connections are stored as a flat list of ``<node_id>, <port_name>``
+    values (see :meth:`PortModel.add_connection`).
     """
 
+    __slots__ = ('node', '_template', '_connections', '_connected_view')
+
+    # shared attribute templates.
+    _TEMPLATES = {}
+
     def __init__(self, node):
         self.node = node
-        self.type_ = ''
-        self.name = 'port'
-        self.display_name = True
-        self.multi_connection = False
-        self.visible = True
-        self.locked = False
-        self.connected_ports = defaultdict(list)
+        # (type_, name, display_name, multi_connection, visible, locked)
+        self._template = _share_template(
+            ('', 'port', True, False, True, False), self._TEMPLATES
+        )
+        # flat list of connections or None if the port isn't connected.
+        self._connections = None
+        # cached read only "connected_ports" mapping.
+        self._connected_view = None
 
     def __repr__(self):
         return '<{}(\'{}\') object at {}>'.format(
             self.__class__.__name__, self.name, hex(id(self)))
 
+    type_ = _template_property(0, 'str: port type.')
+    name = _template_property(1, 'str: port name.')
+    display_name = _template_property(2, 'bool: display the port name.')
+    multi_connection = _template_property(
+        3, 'bool: port allows more than one connection.')
+    visible = _template_property(4, 'bool: port visibility.')
+    locked = _template_property(5, 'bool: port lock state.')
+
+    @property
+    def connected_ports(self):
+        """
+        Connected ports grouped by node id.
+        (use :meth:`PortModel.add_connection` and
+        :meth:`PortModel.remove_connection` to change the connections)
+
+        Returns:
+            mappingproxy: read only {<node_id>: (<port_name>, <port_name>)}
+        """
+        if self._connected_view is None:
+            self._connected_view = MappingProxyType({
+                node_id: tuple(port_names)
+                for node_id, port_names in self._connected_ports().items()
+            })
+        return self._connected_view
+
+    @connected_ports.setter
+    def connected_ports(self, connected_ports):
+        self._connections = [
+            value
+            for node_id, port_names in connected_ports.items()
+            for port_name in port_names
+            for value in (node_id, sys.intern(port_name))
+        ] or None
+        self._connected_view = None
+
+    def _connected_ports(self):
+        """
+        Returns:
+            dict: {<node_id>: [<port_name>, <port_name>]}
+        """
+        connected_ports = {}
+        connections = self._connections or ()
+        for i in range(0, len(connections), 2):
+            node_id = connections[i]
+            if node_id in connected_ports:
+                connected_ports[node_id].append(connections[i + 1])
+            else:
+                connected_ports[node_id] = [connections[i + 1]]
+        return connected_ports
+
+    def connections(self):
+        """
+        Returns the port connections.
+
+        Returns:
+            tuple: ((<node_id>, <port_name>), ...)
+        """
+        connections = self._connections
+        if not connections:
+            return ()
+        return tuple(zip(connections[0::2], connections[1::2]))
+
+    def add_connection(self, node_id, port_name):
+        """
+        Add a connection to a port.
+
+        Args:
+            node_id (int): connected node id.
+            port_name (str): connected port name.
+        """
+        if self._connections is None:
+            self._connections = [node_id, sys.intern(port_name)]
+        else:
+            self._connections += (node_id, sys.intern(port_name))
+        self._connected_view = None
+
+    def remove_connection(self, node_id, port_name):
+        """
+        Remove a connection to a port.
+
+        Args:
+            node_id (int): connected node id.
+            port_name (str): connected port name.
+
+        Returns:
+            bool: true if the connection was removed.
+        """
+        connections = self._connections or ()
+        for i in range(0, len(connections), 2):
+            if connections[i] == node_id and connections[i + 1] == port_name:
+                del connections[i:i + 2]
+                if not connections:
+                    self._connections = None
+                self._connected_view = None
+                return True
+        return False
+
     @property
     def to_dict(self):
         """
@@ -46,40 +218,130 @@ class PortModel(object):
                     'connected_ports': {<node_id>: [<port_name>, <port_name>]}
                 }
         """
-        props = self.__dict__.copy()
-        props.pop('node')
-        props['connected_ports'] = dict(props.pop('connected_ports'))
-        return props
+        return {
+            'type_': self.type_,
+            'name': self.name,
+            'display_name': self.display_name,
+            'multi_connection': self.multi_connection,
+            'visible': self.visible,
+            'locked': self.locked,
+            'connected_ports': self._connected_ports(),
+        }
+
+
+class _PortModels(Mapping):
+    """
+    Read only ``{<port_name>: <PortModel>}`` mapping over the port models of
+    a node (use :meth:`NodeModel.add_port` and :meth:`NodeModel.remove_port`
+    to change the ports).
+
+    Args:
+        ports (tuple[PortModel]): port models.
+    """
+
+    __slots__ = ('_ports',)
+
+    def __init__(self, ports):
+        self._ports = ports
+
+    def __repr__(self):
+        return '<{}({}) object at {}>'.format(
+            self.__class__.__name__, list(self), hex(id(self)))
+
+    def __getitem__(self, name):
+        for port in self._ports:
+            if port.name == name:
+                return port
+        raise KeyError(name)
+
+    def __iter__(self):
+        return (port.name for port in self._ports)
+
+    def __len__(self):
+        return len(self._ports)
 
 
 class NodeModel(object):
     """
     Data dump for a node object.
+
+    The node model has no instance ``__dict__`` the default properties are
+    stored in slots and the values that are usually the same for all the
+    nodes of a type (type, icon, colors, flags...) are kept in a template
+    shared by all the nodes with the same values.
+
+    The ``pos``, ``width`` and ``height`` are kept in the
+    :class:`NodeGeometryStore` of the node graph while the node is in a
+    graph.
     """
 
+    #: default node properties in serialization order.
+    DEFAULT_PROPERTIES = (
+        'type_', 'id', 'icon', 'name', 'color', 'border_color', 'text_color',
+        'disabled', 'selected', 'visible', 'width', 'height', 'pos',
+        'layout_direction', 'inputs', 'outputs', 'port_deletion_allowed',
+        'subgraph_session',
+    )
+
+    _DEFAULT_PROPERTY_NAMES = frozenset(DEFAULT_PROPERTIES)
+
+    __slots__ = (
+        'id', 'name', 'selected', '_template',
+        '_pos', '_width', '_height', '_geometry',
+        '_inputs', '_outputs', '_subgraph_session',
+        '_custom_prop', '_graph_model',
+        '_TEMP_property_attrs', '_TEMP_property_widget_types',
+        '_TEMP_accept_connection_types', '_TEMP_reject_connection_types',
+    )
+
+    # shared attribute templates.
+    _TEMPLATES = {}
+
+    # default property widget types shared by the nodes until a custom
+    # property is added.
+    _DEFAULT_WIDGET_TYPES = {
+        'type_': NodePropWidgetEnum.QLABEL.value,
+        'id': NodePropWidgetEnum.QLABEL.value,
+        'icon': NodePropWidgetEnum.HIDDEN.value,
+        'name': NodePropWidgetEnum.QLINE_EDIT.value,
+        'color': NodePropWidgetEnum.COLOR_PICKER.value,
+        'border_color': NodePropWidgetEnum.COLOR_PICKER.value,
+        'text_color': NodePropWidgetEnum.COLOR_PICKER.value,
+        'disabled': NodePropWidgetEnum.QCHECK_BOX.value,
+        'selected': NodePropWidgetEnum.HIDDEN.value,
+        'width': NodePropWidgetEnum.HIDDEN.value,
+        'height': NodePropWidgetEnum.HIDDEN.value,
+        'pos': NodePropWidgetEnum.HIDDEN.value,
+        'layout_direction': NodePropWidgetEnum.HIDDEN.value,
+        'inputs': NodePropWidgetEnum.HIDDEN.value,
+        'outputs': NodePropWidgetEnum.HIDDEN.value,
+    }
+
     def __init__(self):
-        self.type_ = None
-        self.id = hex(id(self))
-        self.icon = None
+        # (type_, icon, color, border_color, text_color, disabled, visible,
+        #  layout_direction, port_deletion_allowed)
+        self._template = _share_template(
+            (None, None, (13, 18, 23, 255), (74, 84, 85, 255),
+             (255, 255, 255, 180), False, True,
+             LayoutDirectionEnum.HORIZONTAL.value, False),
+            self._TEMPLATES
+        )
+        # compact integer id allocated by the node graph the node is added to.
+        self.id = None
         self.name = 'node'
-        self.color = (13, 18, 23, 255)
-        self.border_color = (74, 84, 85, 255)
-        self.text_color = (255, 255, 255, 180)
-        self.disabled = False
         self.selected = False
-        self.visible = True
+        # geometry store the pos, width and height are kept in.
+        self._geometry = None
         self.width = 100.0
         self.height = 80.0
         self.pos = [0.0, 0.0]
-        self.layout_direction = LayoutDirectionEnum.HORIZONTAL.value
 
         # BaseNode attrs.
-        self.inputs = {}
-        self.outputs = {}
-        self.port_deletion_allowed = False
+        self._inputs = ()
+        self._outputs = ()
 
-        # GroupNode attrs.
-        self.subgraph_session = {}
+        # GroupNode attrs (the empty session isn't stored).
+        self._subgraph_session = None
 
         # Custom
         self._custom_prop = {}
@@ -88,31 +350,16 @@ class NodeModel(object):
         self._graph_model = None
 
         # store the property attributes.
-        # (deleted when node is added to the graph)
+        # (cleared when node is added to the graph)
         self._TEMP_property_attrs = {}
 
-        # temp store the property widget types.
-        # (deleted when node is added to the graph)
-        self._TEMP_property_widget_types = {
-            'type_': NodePropWidgetEnum.QLABEL.value,
-            'id': NodePropWidgetEnum.QLABEL.value,
-            'icon': NodePropWidgetEnum.HIDDEN.value,
-            'name': NodePropWidgetEnum.QLINE_EDIT.value,
-            'color': NodePropWidgetEnum.COLOR_PICKER.value,
-            'border_color': NodePropWidgetEnum.COLOR_PICKER.value,
-            'text_color': NodePropWidgetEnum.COLOR_PICKER.value,
-            'disabled': NodePropWidgetEnum.QCHECK_BOX.value,
-            'selected': NodePropWidgetEnum.HIDDEN.value,
-            'width': NodePropWidgetEnum.HIDDEN.value,
-            'height': NodePropWidgetEnum.HIDDEN.value,
-            'pos': NodePropWidgetEnum.HIDDEN.value,
-            'layout_direction': NodePropWidgetEnum.HIDDEN.value,
-            'inputs': NodePropWidgetEnum.HIDDEN.value,
-            'outputs': NodePropWidgetEnum.HIDDEN.value,
-        }
+        # temp store the property widget types (the shared defaults are
+        # copied when a custom property is added).
+        # (cleared when node is added to the graph)
+        self._TEMP_property_widget_types = self._DEFAULT_WIDGET_TYPES
 
         # temp store connection constrains.
-        # (deleted when node is added to the graph)
+        # (cleared when node is added to the graph)
         self._TEMP_accept_connection_types = {}
         self._TEMP_reject_connection_types = {}
 
@@ -120,6 +367,166 @@ class NodeModel(object):
         return '<{}(\'{}\') object at {}>'.format(
             self.__class__.__name__, self.name, self.id)
 
+    type_ = _template_property(0, 'str: node type.')
+    icon = _template_property(1, 'str: node icon path.')
+    color = _template_property(2, 'tuple: node color (r, g, b, a).')
+    border_color = _template_property(
+        3, 'tuple: node border color (r, g, b, a).')
+    text_color = _template_property(4, 'tuple: node text color (r, g, b, a).')
+    disabled = _template_property(5, 'bool: node disabled state.')
+    visible = _template_property(6, 'bool: node visibility.')
+    layout_direction = _template_property(7, 'int: node layout direction.')
+    port_deletion_allowed = _template_property(
+        8, 'bool: ports can be added and removed.')
+
+    @property
+    def inputs(self):
+        """
+        Input port models.
+        (use :meth:`NodeModel.add_port` and :meth:`NodeModel.remove_port` to
+        change the ports)
+
+        Returns:
+            collections.abc.Mapping: read only {<port_name>: <PortModel>}
+        """
+        return _PortModels(self._inputs)
+
+    @inputs.setter
+    def inputs(self, inputs):
+        self._inputs = tuple(inputs.values())
+
+    @property
+    def outputs(self):
+        """
+        Output port models.
+        (use :meth:`NodeModel.add_port` and :meth:`NodeModel.remove_port` to
+        change the ports)
+
+        Returns:
+            collections.abc.Mapping: read only {<port_name>: <PortModel>}
+        """
+        return _PortModels(self._outputs)
+
+    @outputs.setter
+    def outputs(self, outputs):
+        self._outputs = tuple(outputs.values())
+
+    def add_port(self, port):
+        """
+        Add a port model to the node inputs or outputs (from the port type).
+
+        Args:
+            port (PortModel): port model.
+        """
+        if port.type_ == PortTypeEnum.IN.value:
+            self._inputs += (port,)
+        else:
+            self._outputs += (port,)
+
+    def remove_port(self, port):
+        """
+        Remove a port model from the node inputs or outputs.
+
+        Args:
+            port (PortModel): port model.
+        """
+        if port.type_ == PortTypeEnum.IN.value:
+            self._inputs = tuple(p for p in self._inputs if p is not port)
+        else:
+            self._outputs = tuple(p for p in self._outputs if p is not port)
+
+    @property
+    def subgraph_session(self):
+        """
+        Returns:
+            dict: group node sub graph session.
+        """
+        if self._subgraph_session is None:
+            return {}
+        return self._subgraph_session
+
+    @subgraph_session.setter
+    def subgraph_session(self, session):
+        self._subgraph_session = session
+
+    @property
+    def pos(self):
+        """
+        Returns:
+            list[float]: x, y node position.
+        """
+        if self._geometry is not None:
+            return self._geometry.pos(self.id)
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos):
+        x, y = float(pos[0]), float(pos[1])
+        if self._geometry is not None:
+            self._geometry.set_pos(self.id, x, y)
+        else:
+            self._pos = [x, y]
+
+    @property
+    def width(self):
+        """
+        Returns:
+            float: node width.
+        """
+        if self._geometry is not None:
+            return self._geometry.width(self.id)
+        return self._width
+
+    @width.setter
+    def width(self, width):
+        if self._geometry is not None:
+            self._geometry.set_width(self.id, float(width))
+        else:
+            self._width = float(width)
+
+    @property
+    def height(self):
+        """
+        Returns:
+            float: node height.
+        """
+        if self._geometry is not None:
+            return self._geometry.height(self.id)
+        return self._height
+
+    @height.setter
+    def height(self, height):
+        if self._geometry is not None:
+            self._geometry.set_height(self.id, float(height))
+        else:
+            self._height = float(height)
+
+    def attach_geometry(self, geometry):
+        """
+        Move the node position and size into a geometry store.
+
+        Args:
+            geometry (NodeGeometryStore): geometry store.
+        """
+        if self._geometry is geometry:
+            return
+        if self._geometry is not None:
+            self.detach_geometry()
+        x, y = self._pos
+        geometry.add(self.id, x, y, self._width, self._height)
+        self._geometry = geometry
+        self._pos = self._width = self._height = None
+
+    def detach_geometry(self):
+        """
+        Move the node position and size out of the geometry store.
+        """
+        if self._geometry is None:
+            return
+        x, y, self._width, self._height = self._geometry.remove(self.id)
+        self._pos = [x, y]
+        self._geometry = None
+
     def add_property(self, name, value, items=None, range=None,
                      widget_type=None, widget_tooltip=None, tab=None):
         """
@@ -137,8 +544,9 @@ class NodeModel(object):
         """
         widget_type = widget_type or NodePropWidgetEnum.HIDDEN.value
         tab = tab or 'Properties'
+        name = sys.intern(name)
 
-        if name in self.properties.keys():
+        if self.has_default_property(name):
             raise NodePropertyError(
                 '"{}" reserved for default property.'.format(name))
         if name in self._custom_prop.keys():
@@ -148,6 +556,9 @@ class NodeModel(object):
         self._custom_prop[name] = value
 
         if self._graph_model is None:
+            if self._TEMP_property_widget_types is self._DEFAULT_WIDGET_TYPES:
+                self._TEMP_property_widget_types = dict(
+                    self._DEFAULT_WIDGET_TYPES)
             self._TEMP_property_widget_types[name] = widget_type
             self._TEMP_property_attrs[name] = {'tab': tab}
             if items:
@@ -180,9 +591,9 @@ class NodeModel(object):
             name (str): property name.
             value (object): property value.
         """
-        if name in self.properties.keys():
+        if self.has_default_property(name):
             setattr(self, name, value)
-        elif name in self._custom_prop.keys():
+        elif name in self._custom_prop:
             self._custom_prop[name] = value
         else:
             raise NodePropertyError('No property "{}"'.format(name))
@@ -195,10 +606,23 @@ class NodeModel(object):
         Returns:
             object: property value.
         """
-        if name in self.properties.keys():
-            return self.properties[name]
+        if self.has_default_property(name):
+            return getattr(self, name)
         return self._custom_prop.get(name)
 
+    def has_default_property(self, name):
+        """
+        Args:
+            name (str): property name.
+
+        Returns:
+            bool: true if it's a default (non custom) property.
+        """
+        if name in self._DEFAULT_PROPERTY_NAMES:
+            return True
+        # attributes added by a model subclass.
+        return name in getattr(self, '__dict__', ())
+
     def is_custom_property(self, name):
         """
         Args:
@@ -325,12 +749,9 @@ class NodeModel(object):
         Returns:
             dict: default node properties.
         """
-        props = self.__dict__.copy()
-        exclude = ['_custom_prop',
-                   '_graph_model',
-                   '_TEMP_property_attrs',
-                   '_TEMP_property_widget_types']
-        [props.pop(i) for i in exclude if i in props.keys()]
+        props = {name: getattr(self, name) for name in self.DEFAULT_PROPERTIES}
+        # attributes added by a model subclass.
+        props.update(getattr(self, '__dict__', {}))
         return props
 
     @property
@@ -376,31 +797,49 @@ class NodeModel(object):
                     subgraph_session: <sub graph session data>
                 }
         """
-        node_dict = self.__dict__.copy()
-        node_id = node_dict.pop('id')
+        return self._to_dict()
+
+    def _to_dict(self, lazy_sessions=False):
+        """
+        serialize model information to a dictionary.
+        (used internally by the node graph)
+
+        Args:
+            lazy_sessions (bool): keep the group node sessions that haven't
+                been decoded as :class:`SubGraphSession` objects.
+
+        Returns:
+            dict: node id as the key and properties as the values.
+        """
+        node_id = self.id
+        node_dict = {
+            name: getattr(self, name) for name in self.DEFAULT_PROPERTIES
+            if name not in ('id', 'inputs', 'outputs')
+        }
+        node_dict.update(getattr(self, '__dict__', {}))
 
         inputs = {}
         outputs = {}
         input_ports = []
         output_ports = []
-        for name, model in node_dict.pop('inputs').items():
+        for name, model in self.inputs.items():
             if self.port_deletion_allowed:
                 input_ports.append({
                     'name': name,
                     'multi_connection': model.multi_connection,
                     'display_name': model.display_name,
                 })
-            connected_ports = model.to_dict['connected_ports']
+            connected_ports = model._connected_ports()
             if connected_ports:
                 inputs[name] = connected_ports
-        for name, model in node_dict.pop('outputs').items():
+        for name, model in self.outputs.items():
             if self.port_deletion_allowed:
                 output_ports.append({
                     'name': name,
                     'multi_connection': model.multi_connection,
                     'display_name': model.display_name,
                 })
-            connected_ports = model.to_dict['connected_ports']
+            connected_ports = model._connected_ports()
             if connected_ports:
                 outputs[name] = connected_ports
         if inputs:
@@ -412,17 +851,13 @@ class NodeModel(object):
             node_dict['input_ports'] = input_ports
             node_dict['output_ports'] = output_ports
 
-        if self.subgraph_session:
-            node_dict['subgraph_session'] = self.subgraph_session
-
-        custom_props = node_dict.pop('_custom_prop', {})
-        if custom_props:
-            node_dict['custom'] = custom_props
+        if self._custom_prop:
+            node_dict['custom'] = self._custom_prop
 
-        exclude = ['_graph_model',
-                   '_TEMP_property_attrs',
-                   '_TEMP_property_widget_types']
-        [node_dict.pop(i) for i in exclude if i in node_dict.keys()]
+        if not lazy_sessions and node_dict.get('subgraph_session'):
+            node_dict['subgraph_session'] = SubGraphSession.decode_all(
+                node_dict['subgraph_session']
+            )
 
         return {node_id: node_dict}
 
@@ -438,6 +873,673 @@ class NodeModel(object):
         return json.dumps(model_dict)
 
 
+class SubGraphSession(object):
+    """
+    Group node sub graph session that's kept as an encoded ``JSON`` string
+    and only decoded when it's needed.
+
+    Saved sessions store the nested group node sessions in a side-car chunk
+    (see :meth:`SubGraphSession.pack`) so loading a session only parses the
+    top level nodes, the nested sessions are decoded when the group node is
+    expanded or :meth:`GroupNode.get_sub_graph_session` is called.
+    """
+
+    # serialized data key for the side-car chunk of encoded sessions.
+    SESSIONS_KEY = 'sub_graph_sessions'
+    # key for the reference to a session in the side-car chunk.
+    REF_KEY = 'sub_graph_session_ref'
+
+    def __init__(self, key, sessions):
+        """
+        Args:
+            key (str): session key in the side-car chunk.
+            sessions (dict): side-car chunk
+                ``{<key>: {'session': <json str>, 'children': [<key>]}}``
+        """
+        self._key = key
+        self._sessions = sessions
+
+    def __repr__(self):
+        return '<{}(\'{}\') object at {}>'.format(
+            self.__class__.__name__, self._key, hex(id(self)))
+
+    def __bool__(self):
+        return True
+
+    @property
+    def key(self):
+        """
+        Session key in the side-car chunk.
+
+        Returns:
+            str: session key.
+        """
+        return self._key
+
+    def decode(self):
+        """
+        Decode the session, nested group node sessions are kept encoded.
+
+        Returns:
+            dict: serialized sub graph session.
+        """
+        data = json.loads(self._sessions[self._key]['session'])
+        return self._unpack_nodes(data, self._sessions)
+
+    @classmethod
+    def decode_all(cls, session):
+        """
+        Decode a sub graph session and all of its nested group node sessions.
+
+        Args:
+            session (dict or SubGraphSession): sub graph session.
+
+        Returns:
+            dict: serialized sub graph session with no lazy sessions.
+        """
+        if isinstance(session, SubGraphSession):
+            session = session.decode()
+        nodes = session.get('nodes') if session else None
+        if not nodes:
+            return session
+
+        decoded_nodes = {}
+        decoded = False
+        for node_id, node_data in nodes.items():
+            sub_session = node_data.get('subgraph_session')
+            if sub_session:
+                decoded_session = cls.decode_all(sub_session)
+                if decoded_session is not sub_session:
+                    node_data = dict(node_data)
+                    node_data['subgraph_session'] = decoded_session
+                    decoded = True
+            decoded_nodes[node_id] = node_data
+        if not decoded:
+            return session
+        session = dict(session)
+        session['nodes'] = decoded_nodes
+        return session
+
+    @staticmethod
+    def json_default(obj):
+        """
+        ``default`` function for ``json.dump`` that decodes the sub graph
+        sessions that are still encoded.
+
+        Args:
+            obj (object): object that isn't JSON serializable.
+
+        Returns:
+            object: JSON serializable object.
+        """
+        if isinstance(obj, SubGraphSession):
+            return obj.decode()
+        if isinstance(obj, set):
+            return list(obj)
+        return obj
+
+    @classmethod
+    def pack(cls, data):
+        """
+        Move the group node sub graph sessions from the serialized nodes to a
+        side-car chunk of encoded sessions.
+
+        Args:
+            data (dict): serialized session.
+
+        Returns:
+            dict: serialized session with the side-car chunk.
+        """
+        sessions = {}
+        data, _ = cls._pack_nodes(data, sessions)
+        if sessions:
+            data[cls.SESSIONS_KEY] = sessions
+        return data
+
+    @classmethod
+    def unpack(cls, data):
+        """
+        Replace the group node session references in serialized data that
+        was packed with :meth:`SubGraphSession.pack` with lazy sessions.
+
+        Args:
+            data (dict): serialized session.
+
+        Returns:
+            dict: serialized session.
+        """
+        sessions = data.get(cls.SESSIONS_KEY)
+        if not sessions:
+            return data
+        data = {k: v for k, v in data.items() if k != cls.SESSIONS_KEY}
+        return cls._unpack_nodes(data, sessions)
+
+    @classmethod
+    def _pack_nodes(cls, data, sessions):
+        """
+        Args:
+            data (dict): serialized session.
+            sessions (dict): side-car chunk to populate.
+
+        Returns:
+            tuple(dict, list[str]): serialized session, child session keys.
+        """
+        nodes = {}
+        children = []
+        for node_id, node_data in data.get('nodes', {}).items():
+            session = node_data.get('subgraph_session')
+            if session:
+                key = cls._pack_session(session, sessions)
+                node_data = dict(node_data)
+                node_data['subgraph_session'] = {cls.REF_KEY: key}
+                children.append(key)
+            nodes[node_id] = node_data
+        data = dict(data)
+        data['nodes'] = nodes
+        return data, children
+
+    @classmethod
+    def _pack_session(cls, session, sessions):
+        """
+        Args:
+            session (dict or SubGraphSession): sub graph session.
+            sessions (dict): side-car chunk to populate.
+
+        Returns:
+            str: session key.
+        """
+        if isinstance(session, SubGraphSession):
+            # copy the encoded sessions as is.
+            keys = [session.key]
+            while keys:
+                key = keys.pop()
+                if key not in sessions:
+                    sessions[key] = session._sessions[key]
+                    keys.extend(sessions[key]['children'])
+            return session.key
+
+        session, children = cls._pack_nodes(session, sessions)
+        key = uuid.uuid4().hex
+        sessions[key] = {
+            'session': json.dumps(session, default=cls.json_default),
+            'children': children
+        }
+        return key
+
+    @classmethod
+    def _unpack_nodes(cls, data, sessions):
+        """
+        Args:
+            data (dict): serialized session.
+            sessions (dict): side-car chunk.
+
+        Returns:
+            dict: serialized session.
+        """
+        nodes = {}
+        for node_id, node_data in data.get('nodes', {}).items():
+            session = node_data.get('subgraph_session')
+            if isinstance(session, dict) and cls.REF_KEY in session:
+                node_data = dict(node_data)
+                node_data['subgraph_session'] = cls(
+                    session[cls.REF_KEY], sessions
+                )
+            nodes[node_id] = node_data
+        data['nodes'] = nodes
+        return data
+
+
+class NodeIdAllocator(object):
+    """
+    Allocates the compact integer node ids for a node graph, ids are
+    monotonic and never reused (sub graphs share the allocator from the root
+    node graph so ids are unique across the graph hierarchy).
+
+    Node ids are written to serialized sessions in their string form and new
+    ids are allocated when a session is imported or nodes are pasted.
+    """
+
+    def __init__(self, start=1):
+        """
+        Args:
+            start (int): first node id.
+        """
+        self._next_id = start
+        # identifies the id space in serialized data.
+        self.uid = uuid.uuid4().hex
+
+    def __repr__(self):
+        return '<{}({}) object at {}>'.format(
+            self.__class__.__name__, self._next_id, hex(id(self)))
+
+    def allocate(self):
+        """
+        Returns a new node id.
+
+        Returns:
+            int: node id.
+        """
+        node_id = self._next_id
+        self._next_id += 1
+        return node_id
+
+    def next_id(self):
+        """
+        Returns the node id that will be allocated next.
+
+        Returns:
+            int: node id.
+        """
+        return self._next_id
+
+    @staticmethod
+    def to_str(node_id):
+        """
+        Returns the string form of a node id (used for display and in
+        serialized data).
+
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            str: node id string.
+        """
+        return str(node_id)
+
+    @staticmethod
+    def from_str(node_id):
+        """
+        Returns the node id from its string form.
+
+        Args:
+            node_id (str or int): node id string.
+
+        Returns:
+            int: node id or None if it's not a valid node id
+                (eg. the memory address ids from older sessions).
+        """
+        if isinstance(node_id, int):
+            return node_id
+        try:
+            return int(node_id)
+        except (TypeError, ValueError):
+            return None
+
+
+class NodeGeometryStore(object):
+    """
+    Columnar store for the node positions and sizes of a node graph.
+
+    The x, y, width and height of the nodes are kept in contiguous float
+    arrays indexed by a node slot (slots of removed nodes are reused), the
+    bulk queries are vectorized with ``numpy`` when it's installed and fall
+    back to plain python otherwise.
+    """
+
+    # {<alignment>: <offset factor of the free space in the bounding rect>}
+    _ALIGN_FACTORS = {
+        NodeAlignEnum.LEFT.value: 0.0,
+        NodeAlignEnum.TOP.value: 0.0,
+        NodeAlignEnum.CENTER_X.value: 0.5,
+        NodeAlignEnum.CENTER_Y.value: 0.5,
+        NodeAlignEnum.RIGHT.value: 1.0,
+        NodeAlignEnum.BOTTOM.value: 1.0,
+    }
+    _ALIGN_X = frozenset([NodeAlignEnum.LEFT.value,
+                          NodeAlignEnum.CENTER_X.value,
+                          NodeAlignEnum.RIGHT.value])
+
+    def __init__(self):
+        self._x = array('d')
+        self._y = array('d')
+        self._width = array('d')
+        self._height = array('d')
+        # {<node_id>: <slot>}
+        self._slots = {}
+        self._free_slots = []
+
+    def __repr__(self):
+        return '<{}({}) object at {}>'.format(
+            self.__class__.__name__, len(self._slots), hex(id(self)))
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, node_id):
+        return node_id in self._slots
+
+    def add(self, node_id, x=0.0, y=0.0, width=0.0, height=0.0):
+        """
+        Add a node to the store.
+
+        Args:
+            node_id (int): node id.
+            x (float): node x position.
+            y (float): node y position.
+            width (float): node width.
+            height (float): node height.
+
+        Returns:
+            int: node slot.
+        """
+        slot = self._slots.get(node_id)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self._x)
+                self._x.append(0.0)
+                self._y.append(0.0)
+                self._width.append(0.0)
+                self._height.append(0.0)
+            self._slots[node_id] = slot
+        self._x[slot] = x
+        self._y[slot] = y
+        self._width[slot] = width
+        self._height[slot] = height
+        return slot
+
+    def remove(self, node_id):
+        """
+        Remove a node from the store.
+
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            tuple(float, float, float, float): x, y, width, height of the
+                removed node.
+        """
+        slot = self._slots.pop(node_id)
+        self._free_slots.append(slot)
+        return (self._x[slot], self._y[slot],
+                self._width[slot], self._height[slot])
+
+    def clear(self):
+        """
+        Remove all the nodes from the store.
+        """
+        self.__init__()
+
+    def node_ids(self):
+        """
+        Returns:
+            list[int]: ids of the nodes in the store.
+        """
+        return list(self._slots.keys())
+
+    def pos(self, node_id):
+        """
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            list[float]: x, y node position.
+        """
+        slot = self._slots[node_id]
+        return [self._x[slot], self._y[slot]]
+
+    def set_pos(self, node_id, x, y):
+        """
+        Args:
+            node_id (int): node id.
+            x (float): node x position.
+            y (float): node y position.
+        """
+        slot = self._slots[node_id]
+        self._x[slot] = x
+        self._y[slot] = y
+
+    def width(self, node_id):
+        """
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            float: node width.
+        """
+        return self._width[self._slots[node_id]]
+
+    def set_width(self, node_id, width):
+        """
+        Args:
+            node_id (int): node id.
+            width (float): node width.
+        """
+        self._width[self._slots[node_id]] = width
+
+    def height(self, node_id):
+        """
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            float: node height.
+        """
+        return self._height[self._slots[node_id]]
+
+    def set_height(self, node_id, height):
+        """
+        Args:
+            node_id (int): node id.
+            height (float): node height.
+        """
+        self._height[self._slots[node_id]] = height
+
+    def _slots_of(self, node_ids):
+        """
+        Args:
+            node_ids (list[int]): node ids (default: all the nodes).
+
+        Returns:
+            list[int]: node slots.
+        """
+        if node_ids is None:
+            return list(self._slots.values())
+        slots = self._slots
+        return [slots[node_id] for node_id in node_ids]
+
+    def _columns(self, slots):
+        """
+        Returns the geometry columns for the node slots, numpy arrays when
+        numpy is available otherwise lists.
+
+        Args:
+            slots (list[int]): node slots.
+
+        Returns:
+            tuple: x, y, width, height columns.
+        """
+        if numpy is not None:
+            index = numpy.asarray(slots, dtype=numpy.intp)
+            # the buffer views are released straight away as the arrays
+            # can't be resized while they're exported.
+            return tuple(
+                numpy.frombuffer(column, dtype=numpy.float64)[index]
+                for column in (self._x, self._y, self._width, self._height)
+            )
+        return tuple(
+            [column[slot] for slot in slots]
+            for column in (self._x, self._y, self._width, self._height)
+        )
+
+    def bounding_rect(self, node_ids=None):
+        """
+        Returns the combined bounding rect of the nodes.
+
+        Args:
+            node_ids (list[int]): node ids (default: all the nodes).
+
+        Returns:
+            list[float]: x, y, width, height or None if there's no nodes.
+        """
+        slots = self._slots_of(node_ids)
+        if not slots:
+            return
+        x, y, width, height = self._columns(slots)
+        if numpy is not None:
+            left, top = float(x.min()), float(y.min())
+            right = float((x + width).max())
+            bottom = float((y + height).max())
+        else:
+            left, top = min(x), min(y)
+            right = max(map(float.__add__, x, width))
+            bottom = max(map(float.__add__, y, height))
+        return [left, top, right - left, bottom - top]
+
+    def center(self, node_ids=None):
+        """
+        Returns the center of the combined bounding rect of the nodes.
+
+        Args:
+            node_ids (list[int]): node ids (default: all the nodes).
+
+        Returns:
+            list[float]: x, y center position or None if there's no nodes.
+        """
+        rect = self.bounding_rect(node_ids)
+        if rect is None:
+            return
+        return [rect[0] + rect[2] * 0.5, rect[1] + rect[3] * 0.5]
+
+    def translate(self, node_ids, dx, dy):
+        """
+        Offset the node positions.
+
+        Args:
+            node_ids (list[int]): node ids (default: all the nodes).
+            dx (float): x offset.
+            dy (float): y offset.
+        """
+        slots = self._slots_of(node_ids)
+        if not slots:
+            return
+        if numpy is not None:
+            index = numpy.asarray(slots, dtype=numpy.intp)
+            x = numpy.frombuffer(self._x, dtype=numpy.float64)
+            y = numpy.frombuffer(self._y, dtype=numpy.float64)
+            x[index] += dx
+            y[index] += dy
+            del x, y
+            return
+        column_x, column_y = self._x, self._y
+        for slot in slots:
+            column_x[slot] += dx
+            column_y[slot] += dy
+
+    def nearest(self, x, y, node_ids=None):
+        """
+        Returns the node with the center closest to the position.
+
+        Args:
+            x (float): x position.
+            y (float): y position.
+            node_ids (list[int]): node ids to search (default: all the nodes).
+
+        Returns:
+            int: node id or None if there's no nodes.
+        """
+        if node_ids is None:
+            node_ids = self.node_ids()
+        if not node_ids:
+            return
+        pos_x, pos_y, width, height = self._columns(self._slots_of(node_ids))
+        if numpy is not None:
+            dist = ((pos_x + width * 0.5 - x) ** 2 +
+                    (pos_y + height * 0.5 - y) ** 2)
+            return node_ids[int(dist.argmin())]
+        dist = [
+            (px + w * 0.5 - x) ** 2 + (py + h * 0.5 - y) ** 2
+            for px, py, w, h in zip(pos_x, pos_y, width, height)
+        ]
+        return node_ids[dist.index(min(dist))]
+
+    def aligned_positions(self, node_ids, alignment):
+        """
+        Returns the node positions aligned to the combined bounding rect.
+
+        Args:
+            node_ids (list[int]): node ids.
+            alignment (str): :attr:`NodeGraphQt.constants.NodeAlignEnum`
+                value.
+
+        Returns:
+            list[list[float]]: x, y positions in the order of the node ids.
+        """
+        factor = self._ALIGN_FACTORS.get(alignment)
+        if factor is None:
+            raise ValueError('Invalid node alignment: "{}"'.format(alignment))
+        if not node_ids:
+            return []
+        x, y, width, height = self._columns(self._slots_of(node_ids))
+        left, top, rect_width, rect_height = self.bounding_rect(node_ids)
+
+        # aligned position = rect start + (rect size - node size) * factor
+        if alignment in self._ALIGN_X:
+            start, extent, size = left, rect_width, width
+        else:
+            start, extent, size = top, rect_height, height
+        if numpy is not None:
+            column = start + (extent - size) * factor
+        else:
+            column = [start + (extent - s) * factor for s in size]
+
+        if alignment in self._ALIGN_X:
+            x = column
+        else:
+            y = column
+        return [[float(px), float(py)] for px, py in zip(x, y)]
+
+    def distributed_positions(self, node_ids, direction):
+        """
+        Returns the node positions evenly spaced between the first and last
+        node (the order of the nodes along the axis is kept).
+
+        Args:
+            node_ids (list[int]): node ids.
+            direction (int): :attr:`NodeGraphQt.constants.LayoutDirectionEnum`
+                value, horizontal distributes along the x axis and vertical
+                along the y axis.
+
+        Returns:
+            list[list[float]]: x, y positions in the order of the node ids.
+        """
+        if not node_ids:
+            return []
+        x, y, width, height = self._columns(self._slots_of(node_ids))
+        if direction == LayoutDirectionEnum.VERTICAL.value:
+            axis, size = y, height
+        else:
+            axis, size = x, width
+
+        count = len(node_ids)
+        if numpy is not None:
+            order = numpy.argsort(axis, kind='stable')
+            sizes = size[order]
+            start = float(axis[order[0]])
+            end = float(axis[order[-1]] + sizes[-1])
+            gap = (end - start - float(sizes.sum())) / max(count - 1, 1)
+            offsets = numpy.concatenate(([0.0], numpy.cumsum(sizes[:-1] + gap)))
+            axis = axis.copy()
+            axis[order] = start + offsets
+        else:
+            order = sorted(range(count), key=axis.__getitem__)
+            start = axis[order[0]]
+            end = axis[order[-1]] + size[order[-1]]
+            gap = (end - start - sum(size)) / max(count - 1, 1)
+            axis = list(axis)
+            current = start
+            for index in order:
+                axis[index] = current
+                current += size[index] + gap
+
+        if direction == LayoutDirectionEnum.VERTICAL.value:
+            y = axis
+        else:
+            x = axis
+        return [[float(px), float(py)] for px, py in zip(x, y)]
+
+
 class NodeGraphModel(object):
     """
     Data dump for a node graph.
@@ -450,6 +1552,8 @@ class NodeGraphModel(object):
         self.reject_connection_types = {}
 
         self.nodes = {}
+        self.node_id_allocator = NodeIdAllocator()
+        self.geometry = NodeGeometryStore()
         self.session = ''
         self.acyclic = True
         self.pipe_collision = False
@@ -457,6 +1561,44 @@ class NodeGraphModel(object):
         self.pipe_style = PipeLayoutEnum.CURVED.value
         self.layout_direction = LayoutDirectionEnum.HORIZONTAL.value
 
+    def add_node(self, node):
+        """
+        Add a node to the graph model and its position and size to the
+        geometry store.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        self.nodes[node.id] = node
+        node.model.attach_geometry(self.geometry)
+        # the node view pushes its size changes to the store.
+        node.view.set_geometry_store(self.geometry)
+
+    def remove_node(self, node_id):
+        """
+        Remove a node from the graph model.
+
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            NodeGraphQt.NodeObject: removed node.
+        """
+        node = self.nodes.pop(node_id)
+        node.view.set_geometry_store(None)
+        node.model.detach_geometry()
+        return node
+
+    def clear_nodes(self):
+        """
+        Remove all the nodes from the graph model.
+        """
+        for node in self.nodes.values():
+            node.view.set_geometry_store(None)
+            node.model.detach_geometry()
+        self.nodes.clear()
+        self.geometry.clear()
+
     def common_properties(self):
         """
         Return all common node properties.
@@ -615,7 +1757,7 @@ if __name__ == '__main__':
     # print(p.to_dict)
 
     n = NodeModel()
-    n.inputs[p.name] = p
+    n.add_port(p)
     n.add_property('foo', 'bar')
 
     print('-'*100)
@@ -1,4 +1,6 @@
 #!/usr/bin/python
+import sys
+
 from NodeGraphQt.base.commands import PropertyChangedCmd
 from NodeGraphQt.base.model import NodeModel
 from NodeGraphQt.constants import NodePropWidgetEnum
@@ -109,15 +111,16 @@ class NodeObject(object):
         Returns:
             str: node type (``__identifier__.__className__``)
         """
-        return cls.__identifier__ + '.' + cls.__name__
+        return sys.intern(cls.__identifier__ + '.' + cls.__name__)
 
     @property
     def id(self):
         """
-        The node unique id.
+        The node unique id allocated by the node graph when the node is
+        added (``None`` until then).
 
         Returns:
-            str: unique identifier string to the node.
+            int: unique identifier to the node.
         """
         return self.model.id
 
@@ -150,8 +153,11 @@ class NodeObject(object):
         Args:
             item (NodeGraphQt.qgraphics.node_abstract.AbstractNodeItem): node item.
         """
+        geometry = None
         if self._view:
             old_view = self._view
+            geometry = old_view._geometry
+            old_view.set_geometry_store(None)
             scene = self._view.scene()
             scene.removeItem(old_view)
             self._view = item
@@ -162,6 +168,7 @@ class NodeObject(object):
 
         # update the view.
         self.update()
+        self._view.set_geometry_store(geometry)
 
     @property
     def model(self):
@@ -192,11 +199,12 @@ class NodeObject(object):
         """
         Update the node model from view.
         """
+        custom_properties = self.model.custom_properties
         for name, val in self.view.properties.items():
-            if name in self.model.properties.keys():
+            if self.model.has_default_property(name):
                 setattr(self.model, name, val)
-            if name in self.model.custom_properties.keys():
-                self.model.custom_properties[name] = val
+            if name in custom_properties:
+                custom_properties[name] = val
 
     def update(self):
         """
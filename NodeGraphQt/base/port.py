@@ -200,14 +200,17 @@ class Port(object):
             list[NodeGraphQt.Port]: list of connected ports.
         """
         ports = []
-        graph = self.node().graph
-        for node_id, port_names in self.model.connected_ports.items():
-            for port_name in port_names:
-                node = graph.get_node_by_id(node_id)
-                if self.type_() == PortTypeEnum.IN.value:
-                    ports.append(node.outputs()[port_name])
-                elif self.type_() == PortTypeEnum.OUT.value:
-                    ports.append(node.inputs()[port_name])
+        connections = self.model.connections()
+        if not connections:
+            return ports
+        nodes = self.node().graph.model.nodes
+        is_input = self.type_() == PortTypeEnum.IN.value
+        for node_id, port_name in connections:
+            node = nodes[node_id]
+            if is_input:
+                ports.append(node.outputs()[port_name])
+            else:
+                ports.append(node.inputs()[port_name])
         return ports
 
     def connect_to(self, port=None, push_undo=True, emit_signal=True):
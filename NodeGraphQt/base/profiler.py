@@ -0,0 +1,426 @@
+#!/usr/bin/python
+import bisect
+import functools
+import time
+import weakref
+from contextlib import contextmanager
+
+from PySide6 import QtCore, QtGui
+
+from NodeGraphQt.base.hooks import (
+    add_method_hook,
+    class_tree,
+    remove_method_hook,
+)
+
+#: public node graph operations timed by the profiler.
+GRAPH_OPERATIONS = (
+    'create_node', 'add_node', 'delete_node', 'delete_nodes', 'remove_node',
+    'extract_nodes', 'copy_nodes', 'cut_nodes', 'paste_nodes',
+    'duplicate_nodes', 'disable_nodes', 'select_all', 'clear_selection',
+    'invert_selection', 'auto_layout_nodes', 'fit_to_selection', 'center_on',
+    'clear_session', 'save_session', 'load_session', 'import_session',
+    'serialize_session', 'deserialize_session', 'expand_group_node',
+    'collapse_group_node',
+)
+
+#: serialization functions timed by the profiler {<method>: <operation>}
+SERIALIZE_OPERATIONS = {
+    '_serialize': 'serialize',
+    '_deserialize': 'deserialize',
+}
+
+#: node graph signals counted by the profiler.
+GRAPH_SIGNALS = (
+    'nodes_registered', 'node_created', 'nodes_deleted', 'node_selected',
+    'node_selection_changed', 'node_double_clicked', 'port_connected',
+    'port_disconnected', 'property_changed', 'data_dropped',
+    'session_changed', 'context_menu_prompt',
+)
+
+#: upper bounds in seconds of the timing histogram buckets (the last bucket
+#: counts everything slower).
+HISTOGRAM_BUCKETS = (1e-05, 1e-04, 1e-03, 1e-02, 1e-01, 1.0)
+
+
+class _OperationStats(object):
+    """
+    Timing stats for an operation.
+    """
+
+    __slots__ = ('count', 'total', 'min', 'max', 'histogram', 'node_types')
+
+    def __init__(self, node_types=True):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.node_types = {} if node_types else None
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BUCKETS, seconds)] += 1
+
+    def to_dict(self):
+        data = {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min or 0.0,
+            'max': self.max,
+            'histogram': list(self.histogram),
+        }
+        if self.node_types is not None:
+            data['node_types'] = {
+                t: s.to_dict() for t, s in self.node_types.items()
+            }
+        return data
+
+
+def _node_type(obj):
+    """
+    Returns the node type from an argument, node, node item or undo command.
+
+    Args:
+        obj (object): object.
+
+    Returns:
+        str: node type or None.
+    """
+    if isinstance(obj, str):
+        return obj
+    node_type = getattr(obj, 'type_', None)
+    if isinstance(node_type, str):
+        return node_type
+    node = getattr(obj, 'node', None)
+    node_type = getattr(node, 'type_', None)
+    if isinstance(node_type, str):
+        return node_type
+
+
+class _PaintPassTimer(QtCore.QObject):
+    """
+    Event filter installed on the node viewer viewports while the profiler
+    is enabled that times the viewer paint passes.
+
+    (a ``paintEvent`` hook can't be added to the viewers that already exist
+    as the missing python overrides are cached per Qt object)
+
+    Args:
+        callback (function): called with ``(<viewer>, <seconds>)``.
+    """
+
+    def __init__(self, callback):
+        super(_PaintPassTimer, self).__init__()
+        self._callback = callback
+
+    def eventFilter(self, obj, event):
+        if event.type() != QtCore.QEvent.Paint:
+            return False
+        viewer = obj.parentWidget()
+        start = time.perf_counter()
+        # paint the viewport here so the paint pass can be timed.
+        viewer.viewportEvent(event)
+        self._callback(viewer, time.perf_counter() - start)
+        return True
+
+
+class NodeGraphProfiler(object):
+    """
+    The ``NodeGraphProfiler`` is an opt-in instrumentation layer that times
+    the public :class:`NodeGraphQt.NodeGraph` operations, the undo command
+    redo/undo calls, the viewer paint passes, the node, port and pipe item
+    paint calls, serialization and counts the node graph signal emissions.
+
+    The timing hooks are only installed on the classes while the profiler is
+    enabled so there's no cost when it's disabled, the stats are aggregated
+    per operation and node type with a histogram of the timings.
+
+    The profiler is shared by all node graphs in the process.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph
+
+        graph = NodeGraph()
+        graph.profiler.enable()
+        ...
+        print(graph.profiler.report())
+        graph.profiler.disable()
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._enabled = False
+        self._stats = {}
+        self._hooks = []
+        self._graphs = weakref.WeakSet()
+        self._connections = []
+        self._paint_timer = _PaintPassTimer(self._on_paint_pass)
+        self._viewports = []
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    @classmethod
+    def instance(cls):
+        """
+        Returns the profiler shared by all node graphs.
+
+        Returns:
+            NodeGraphProfiler: profiler.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def is_enabled(self):
+        """
+        Returns true if the profiler is enabled.
+
+        Returns:
+            bool: true if enabled.
+        """
+        return self._enabled
+
+    def enable(self):
+        """
+        Install the timing hooks and start recording.
+        """
+        if self._enabled:
+            return
+        self._enabled = True
+        self._install()
+        for graph in list(self._graphs):
+            self._connect_signals(graph)
+
+    def disable(self):
+        """
+        Remove the timing hooks and stop recording (the recorded stats are
+        kept until :meth:`NodeGraphProfiler.reset` is called).
+        """
+        if not self._enabled:
+            return
+        self._enabled = False
+        for cls, name, callback in self._hooks:
+            remove_method_hook(cls, name, callback)
+        self._hooks = []
+        for signal, slot in self._connections:
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+        self._connections = []
+        for viewport in self._viewports:
+            try:
+                viewport.removeEventFilter(self._paint_timer)
+            except RuntimeError:
+                pass
+        self._viewports = []
+
+    def add_graph(self, graph):
+        """
+        Add a node graph to count the signal emissions from.
+        (called by the node graph when it's created)
+
+        Args:
+            graph (NodeGraphQt.NodeGraph): node graph.
+        """
+        self._graphs.add(graph)
+        if self._enabled:
+            self._connect_signals(graph)
+
+    def record(self, operation, seconds, node_type=None):
+        """
+        Record a timing for an operation.
+
+        Args:
+            operation (str): operation name.
+            seconds (float): time in seconds.
+            node_type (str): node type the operation was run on.
+        """
+        stats = self._stats.get(operation)
+        if stats is None:
+            stats = self._stats[operation] = _OperationStats()
+        stats.add(seconds)
+        if node_type:
+            type_stats = stats.node_types.get(node_type)
+            if type_stats is None:
+                type_stats = stats.node_types[node_type] = \
+                    _OperationStats(node_types=False)
+            type_stats.add(seconds)
+
+    @contextmanager
+    def timer(self, operation, node_type=None):
+        """
+        Context manager that records the time of the code block when the
+        profiler is enabled.
+
+        .. code-block:: python
+            :linenos:
+
+            with graph.profiler.timer('my_tool.build'):
+                ...
+
+        Args:
+            operation (str): operation name.
+            node_type (str): node type the operation is run on.
+        """
+        if not self._enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(operation, time.perf_counter() - start, node_type)
+
+    def stats(self, operation=None):
+        """
+        Returns the recorded stats.
+
+        Args:
+            operation (str): operation name (default: all operations).
+
+        Returns:
+            dict: ``{'count': int, 'total': float, 'mean': float,
+                'min': float, 'max': float, 'histogram': list[int],
+                'node_types': dict}`` or ``{<operation>: <stats>}`` if no
+                operation is specified.
+        """
+        if operation is not None:
+            stats = self._stats.get(operation)
+            return stats.to_dict() if stats else {}
+        return {op: s.to_dict() for op, s in self._stats.items()}
+
+    def reset(self):
+        """
+        Clear the recorded stats.
+        """
+        self._stats.clear()
+
+    def report(self, limit=20, sort_key='total'):
+        """
+        Returns the recorded stats as a text table.
+
+        Args:
+            limit (int): max number of operations.
+            sort_key (str): "total", "count", "mean" or "max".
+
+        Returns:
+            str: report.
+        """
+        stats = self.stats()
+        rows = sorted(stats.items(), key=lambda i: i[1][sort_key],
+                      reverse=True)[:limit]
+        lines = ['{:<36} {:>8} {:>10} {:>10} {:>10}'.format(
+            'operation', 'count', 'total ms', 'mean ms', 'max ms')]
+        for operation, s in rows:
+            lines.append('{:<36} {:>8} {:>10.2f} {:>10.3f} {:>10.3f}'.format(
+                operation[:36], s['count'], s['total'] * 1000.0,
+                s['mean'] * 1000.0, s['max'] * 1000.0))
+        return '\n'.join(lines)
+
+    def _hook(self, cls, name, operation, type_arg=None):
+        """
+        Add a hook that records the time of the calls to a method.
+
+        Args:
+            cls (type): class.
+            name (str): method name.
+            operation (str): operation name.
+            type_arg (int): index of the argument (0 is self) to record the
+                node type from.
+        """
+        def callback(obj, seconds, args):
+            node_type = None
+            if type_arg == 0:
+                node_type = _node_type(obj)
+            elif type_arg and len(args) >= type_arg:
+                node_type = _node_type(args[type_arg - 1])
+            self.record(operation, seconds, node_type)
+
+        add_method_hook(cls, name, callback)
+        self._hooks.append((cls, name, callback))
+
+    def _install(self):
+        """
+        Install the timing hooks on the node graph, undo command, viewer and
+        graphics item classes.
+        """
+        from NodeGraphQt.base.graph import NodeGraph
+        from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
+        from NodeGraphQt.qgraphics.pipe import PipeItem
+        from NodeGraphQt.qgraphics.port import PortItem
+        from NodeGraphQt.widgets.scene import NodeScene
+
+        for cls in class_tree(NodeGraph):
+            for name in GRAPH_OPERATIONS:
+                if name in cls.__dict__:
+                    self._hook(cls, name, 'graph.' + name, type_arg=1)
+            for name, operation in SERIALIZE_OPERATIONS.items():
+                if name in cls.__dict__:
+                    self._hook(cls, name, 'graph.' + operation)
+
+        for cls in class_tree(QtGui.QUndoCommand):
+            for name in ('redo', 'undo'):
+                if name in cls.__dict__:
+                    self._hook(cls, name, 'command.{}.{}'.format(
+                        cls.__name__, name), type_arg=0)
+
+        self._hook(NodeScene, 'drawBackground', 'viewer.draw_background')
+        for base, operation, type_arg in ((AbstractNodeItem, 'paint.node', 0),
+                                          (PortItem, 'paint.port', None),
+                                          (PipeItem, 'paint.pipe', None)):
+            for cls in class_tree(base):
+                if 'paint' in cls.__dict__:
+                    self._hook(cls, 'paint', operation, type_arg)
+
+    def _connect_signals(self, graph):
+        """
+        Count the signal emissions from the node graph and time the paint
+        passes of its viewer.
+
+        Args:
+            graph (NodeGraphQt.NodeGraph): node graph.
+        """
+        viewport = graph.viewer().viewport()
+        viewport.installEventFilter(self._paint_timer)
+        self._viewports.append(viewport)
+
+        for name in GRAPH_SIGNALS:
+            signal = getattr(graph, name, None)
+            if signal is None:
+                continue
+            slot = functools.partial(self._on_signal, 'signal.' + name)
+            signal.connect(slot)
+            self._connections.append((signal, slot))
+
+    def _on_paint_pass(self, viewer, seconds):
+        """
+        Records the time of a viewer paint pass.
+
+        Args:
+            viewer (NodeGraphQt.widgets.viewer.NodeViewer): node viewer.
+            seconds (float): paint time.
+        """
+        self.record('viewer.paint', seconds)
+
+    def _on_signal(self, operation, *args):
+        """
+        Slot function that records a signal emission (signals are only
+        counted so the recorded time is zero).
+
+        Args:
+            operation (str): operation name.
+        """
+        node_type = _node_type(args[0]) if args else None
+        self.record(operation, 0.0, node_type)
+
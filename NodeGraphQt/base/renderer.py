@@ -0,0 +1,528 @@
+#!/usr/bin/python
+import glob
+import json
+import multiprocessing
+import os
+
+from PySide6 import QtCore, QtGui, QtSvg
+
+from NodeGraphQt.constants import (
+    SESSION_THUMBNAIL_SIZE,
+    LayoutDirectionEnum,
+    NodeEnum,
+    PipeEnum,
+    PipeLayoutEnum,
+    PortEnum,
+    ViewerEnum
+)
+
+# node header height used to offset the ports in the horizontal layout.
+_HEADER_HEIGHT = 26.0
+
+# gui application of a render worker process.
+_worker_app = None
+
+
+class SessionRenderer(object):
+    """
+    Renders a serialized node graph session straight to a ``QPainter``
+    without creating a node graph or a viewer.
+
+    The nodes, ports and pipes are drawn with simplified shapes from the
+    serialized data (only the connected ports or the ports stored with the
+    node are drawn), this only needs a ``QGuiApplication`` so it runs under
+    the ``offscreen`` platform.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt.base.renderer import SessionRenderer
+
+        renderer = SessionRenderer(size=(256, 256))
+        session = renderer.load('/path/to/session.json')
+        renderer.save(session, '/path/to/thumbnail.png')
+
+    Args:
+        size (tuple(int, int)): width, height of the rendered images.
+        background_color (tuple): background color (r, g, b, a).
+        margin (float): margin around the nodes in pixels.
+        draw_text (bool): draw the node names when they're large enough
+            to read.
+    """
+
+    def __init__(self, size=SESSION_THUMBNAIL_SIZE,
+                 background_color=ViewerEnum.BACKGROUND_COLOR.value,
+                 margin=10.0, draw_text=True):
+        self._size = (int(size[0]), int(size[1]))
+        self._background_color = background_color
+        self._margin = margin
+        self._draw_text = draw_text
+
+    def __repr__(self):
+        return '<{}({}x{}) object at {}>'.format(
+            self.__class__.__name__, self._size[0], self._size[1],
+            hex(id(self)))
+
+    @property
+    def size(self):
+        """
+        Returns:
+            tuple(int, int): width, height of the rendered images.
+        """
+        return self._size
+
+    @staticmethod
+    def load(file_path):
+        """
+        Read a saved session file.
+
+        Args:
+            file_path (str): path to the session file.
+
+        Returns:
+            dict: serialized session.
+        """
+        with open(file_path) as data_file:
+            return json.load(data_file)
+
+    @staticmethod
+    def _is_backdrop(node_data):
+        """
+        Args:
+            node_data (dict): serialized node.
+
+        Returns:
+            bool: true if the node is a backdrop.
+        """
+        return 'backdrop_text' in (node_data.get('custom') or {})
+
+    @staticmethod
+    def _port_names(session):
+        """
+        Returns the port names of the serialized nodes, taken from the port
+        lists stored with the node or from the connections (in the order
+        they're found).
+
+        Args:
+            session (dict): serialized session.
+
+        Returns:
+            dict: {<node_id>: ([<input_name>, ...], [<output_name>, ...])}
+        """
+        port_names = {}
+        for node_id, node_data in (session.get('nodes') or {}).items():
+            port_names[node_id] = tuple(
+                [p['name'] for p in node_data.get(key) or []]
+                for key in ('input_ports', 'output_ports')
+            )
+        for connection in session.get('connections') or []:
+            for key, index in (('in', 0), ('out', 1)):
+                node_id, port_name = connection[key]
+                names = port_names.get(node_id)
+                if names is not None and port_name not in names[index]:
+                    names[index].append(port_name)
+        return port_names
+
+    @staticmethod
+    def _port_positions(node_data, port_names, layout_direction):
+        """
+        Returns the port centers of a serialized node.
+
+        Args:
+            node_data (dict): serialized node.
+            port_names (tuple(list, list)): input, output port names.
+            layout_direction (int): graph layout direction.
+
+        Returns:
+            tuple(dict, dict): {<port_name>: (x, y)} input, output positions.
+        """
+        x, y = node_data.get('pos') or (0.0, 0.0)
+        width = node_data.get('width') or NodeEnum.WIDTH.value
+        height = node_data.get('height') or NodeEnum.HEIGHT.value
+        port_size = PortEnum.SIZE.value
+
+        positions = []
+        for is_input, names in zip((True, False), port_names):
+            if layout_direction == LayoutDirectionEnum.VERTICAL.value:
+                delta = width / (len(names) + 1)
+                port_y = y if is_input else y + height
+                positions.append({
+                    name: (x + delta * (i + 1), port_y)
+                    for i, name in enumerate(names)
+                })
+            else:
+                port_x = x if is_input else x + width
+                port_y = y + _HEADER_HEIGHT + port_size * 0.5
+                positions.append({
+                    name: (port_x, port_y + (port_size + 1) * i)
+                    for i, name in enumerate(names)
+                })
+        return positions[0], positions[1]
+
+    @staticmethod
+    def _pipe_path(start, end, pipe_style, layout_direction):
+        """
+        Returns the path of a pipe from an output to an input port.
+
+        Args:
+            start (tuple(float, float)): output port position.
+            end (tuple(float, float)): input port position.
+            pipe_style (int): pipe layout style.
+            layout_direction (int): graph layout direction.
+
+        Returns:
+            QtGui.QPainterPath: pipe path.
+        """
+        path = QtGui.QPainterPath(QtCore.QPointF(*start))
+        if pipe_style == PipeLayoutEnum.STRAIGHT.value:
+            path.lineTo(*end)
+            return path
+
+        vertical = layout_direction == LayoutDirectionEnum.VERTICAL.value
+        axis = 1 if vertical else 0
+        if pipe_style == PipeLayoutEnum.ANGLE.value:
+            mid = (start[axis] + end[axis]) * 0.5
+        else:
+            mid = None
+        offset = abs(start[axis] - end[axis])
+        if vertical:
+            if mid is not None:
+                path.lineTo(start[0], mid)
+                path.lineTo(end[0], mid)
+                path.lineTo(*end)
+            else:
+                path.cubicTo(start[0], start[1] + offset,
+                             end[0], end[1] - offset, end[0], end[1])
+        else:
+            if mid is not None:
+                path.lineTo(mid, start[1])
+                path.lineTo(mid, end[1])
+                path.lineTo(*end)
+            else:
+                path.cubicTo(start[0] + offset, start[1],
+                             end[0] - offset, end[1], end[0], end[1])
+        return path
+
+    @staticmethod
+    def bounding_rect(session):
+        """
+        Returns the combined rect of the nodes in a serialized session.
+
+        Args:
+            session (dict): serialized session.
+
+        Returns:
+            QtCore.QRectF: scene rect.
+        """
+        rect = QtCore.QRectF()
+        for node_data in (session.get('nodes') or {}).values():
+            x, y = node_data.get('pos') or (0.0, 0.0)
+            rect |= QtCore.QRectF(
+                x, y,
+                node_data.get('width') or NodeEnum.WIDTH.value,
+                node_data.get('height') or NodeEnum.HEIGHT.value)
+        return rect
+
+    def render(self, painter, session, target_rect=None):
+        """
+        Draw a serialized session with a painter, the nodes are scaled to
+        fit the target rect.
+
+        Args:
+            painter (QtGui.QPainter): active painter.
+            session (dict): serialized session.
+            target_rect (QtCore.QRectF): rect to draw into
+                (default: the renderer size).
+        """
+        if target_rect is None:
+            target_rect = QtCore.QRectF(0, 0, *self._size)
+        painter.fillRect(target_rect, QtGui.QColor(*self._background_color))
+
+        nodes = session.get('nodes') or {}
+        scene_rect = self.bounding_rect(session)
+        if not nodes or scene_rect.isEmpty():
+            return
+
+        graph_data = session.get('graph') or {}
+        layout_direction = graph_data.get(
+            'layout_direction', LayoutDirectionEnum.HORIZONTAL.value)
+        pipe_style = graph_data.get('pipe_style', PipeLayoutEnum.CURVED.value)
+
+        # fit the scene rect to the target rect.
+        margin = self._margin
+        scale = min(
+            max(target_rect.width() - margin * 2, 1.0) / scene_rect.width(),
+            max(target_rect.height() - margin * 2, 1.0) / scene_rect.height()
+        )
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.translate(target_rect.center())
+        painter.scale(scale, scale)
+        painter.translate(-scene_rect.center())
+
+        backdrops = []
+        regular_nodes = []
+        for node_id, node_data in nodes.items():
+            if self._is_backdrop(node_data):
+                backdrops.append(node_data)
+            else:
+                regular_nodes.append((node_id, node_data))
+
+        for node_data in backdrops:
+            self._draw_node(painter, node_data, scale, backdrop=True)
+
+        # pipes.
+        port_names = self._port_names(session)
+        ports = {}
+        for node_id, node_data in regular_nodes:
+            ports[node_id] = self._port_positions(
+                node_data, port_names[node_id], layout_direction)
+        pipe_pen = QtGui.QPen(QtGui.QColor(*PipeEnum.COLOR.value),
+                              PipeEnum.WIDTH.value)
+        pipe_pen.setCosmetic(True)
+        painter.setPen(pipe_pen)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        for connection in session.get('connections') or []:
+            out_id, out_name = connection['out']
+            in_id, in_name = connection['in']
+            if out_id not in ports or in_id not in ports:
+                continue
+            start = ports[out_id][1].get(out_name)
+            end = ports[in_id][0].get(in_name)
+            if start and end:
+                painter.drawPath(self._pipe_path(
+                    start, end, pipe_style, layout_direction))
+
+        for node_id, node_data in regular_nodes:
+            self._draw_node(painter, node_data, scale, ports[node_id])
+
+        painter.restore()
+
+    def _draw_node(self, painter, node_data, scale, ports=None,
+                   backdrop=False):
+        """
+        Draw a serialized node.
+
+        Args:
+            painter (QtGui.QPainter): active painter.
+            node_data (dict): serialized node.
+            scale (float): current painter scale.
+            ports (tuple(dict, dict)): input, output port positions.
+            backdrop (bool): draw the node as a backdrop.
+        """
+        x, y = node_data.get('pos') or (0.0, 0.0)
+        rect = QtCore.QRectF(
+            x, y,
+            node_data.get('width') or NodeEnum.WIDTH.value,
+            node_data.get('height') or NodeEnum.HEIGHT.value)
+
+        color = QtGui.QColor(*node_data.get('color', (13, 18, 23, 255)))
+        border_pen = QtGui.QPen(
+            QtGui.QColor(*node_data.get('border_color', (74, 84, 85, 255))),
+            0.8)
+        border_pen.setCosmetic(True)
+        if backdrop:
+            color.setAlpha(min(color.alpha(), 50))
+        painter.setPen(border_pen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(rect, 4.0, 4.0)
+
+        if ports:
+            painter.setPen(QtCore.Qt.NoPen)
+            painter.setBrush(QtGui.QColor(*PortEnum.BORDER_COLOR.value))
+            radius = PortEnum.SIZE.value * 0.25
+            for positions in ports:
+                for port_x, port_y in positions.values():
+                    painter.drawEllipse(
+                        QtCore.QPointF(port_x, port_y), radius, radius)
+
+        # only draw the names that are large enough to read.
+        font = painter.font()
+        if not self._draw_text or font.pointSizeF() * scale < 4.0:
+            return
+        text_color = node_data.get('text_color', (255, 255, 255, 180))
+        painter.setPen(QtGui.QColor(*text_color))
+        text_rect = QtCore.QRectF(rect.x() + 4.0, rect.y() + 2.0,
+                                  rect.width() - 8.0, _HEADER_HEIGHT - 4.0)
+        painter.drawText(
+            text_rect,
+            QtCore.Qt.AlignLeft if backdrop else QtCore.Qt.AlignCenter,
+            node_data.get('name', ''))
+
+    def render_image(self, session):
+        """
+        Render a serialized session to an image.
+
+        Args:
+            session (dict): serialized session.
+
+        Returns:
+            QtGui.QImage: rendered image.
+        """
+        image = QtGui.QImage(self._size[0], self._size[1],
+                             QtGui.QImage.Format_ARGB32_Premultiplied)
+        painter = QtGui.QPainter(image)
+        try:
+            self.render(painter, session)
+        finally:
+            painter.end()
+        return image
+
+    def render_svg(self, session, file_path):
+        """
+        Render a serialized session to a SVG file.
+
+        Args:
+            session (dict): serialized session.
+            file_path (str): SVG file path.
+        """
+        generator = QtSvg.QSvgGenerator()
+        generator.setFileName(file_path)
+        generator.setSize(QtCore.QSize(*self._size))
+        generator.setViewBox(QtCore.QRect(0, 0, *self._size))
+        generator.setTitle(os.path.basename(file_path))
+        painter = QtGui.QPainter(generator)
+        try:
+            self.render(painter, session)
+        finally:
+            painter.end()
+
+    def save(self, session, file_path):
+        """
+        Render a serialized session to a file, the format is taken from the
+        file extension (``.svg`` or any image format supported by Qt).
+
+        Args:
+            session (dict): serialized session.
+            file_path (str): output file path.
+
+        Returns:
+            bool: true if the file was written.
+        """
+        if file_path.lower().endswith('.svg'):
+            self.render_svg(session, file_path)
+            return os.path.exists(file_path)
+        return self.render_image(session).save(file_path)
+
+
+def _offscreen_app():
+    """
+    Create an offscreen gui application if the process doesn't have an
+    application yet.
+
+    Returns:
+        PySide6.QtGui.QGuiApplication: new application or None.
+    """
+    if QtCore.QCoreApplication.instance() is not None:
+        return
+    return QtGui.QGuiApplication(['NodeGraphQt', '-platform', 'offscreen'])
+
+
+def _init_render_worker():
+    """
+    Initialize a render worker process with an offscreen gui application.
+    """
+    global _worker_app
+    _worker_app = _offscreen_app()
+
+
+def _render_session_file(job):
+    """
+    Render a session file (runs in a render worker process).
+
+    Args:
+        job (tuple): session file path, output file path, renderer kwargs.
+
+    Returns:
+        tuple(str, str, str): session file path, output file path or None,
+            error message or None.
+    """
+    file_path, output_path, kwargs = job
+    try:
+        renderer = SessionRenderer(**kwargs)
+        if not renderer.save(renderer.load(file_path), output_path):
+            return file_path, None, 'failed to write "{}"'.format(output_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return file_path, None, '{}: {}'.format(type(e).__name__, e)
+    return file_path, output_path, None
+
+
+def render_sessions(file_paths, output_dir, ext='png', processes=None,
+                    **kwargs):
+    """
+    Render session files to thumbnails in parallel with a process pool.
+
+    Each worker process runs its own offscreen ``QGuiApplication`` (the
+    workers are spawned so scripts calling this need the
+    ``if __name__ == '__main__':`` guard).
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt.base.renderer import render_sessions
+
+        results = render_sessions(session_files, '/tmp/thumbs', ext='svg')
+
+    Args:
+        file_paths (list[str]): session file paths.
+        output_dir (str): directory the thumbnails are written to.
+        ext (str): thumbnail file extension (eg. ``"png"`` or ``"svg"``).
+        processes (int): number of worker processes
+            (default: number of cpus, ``1`` renders in this process).
+        **kwargs: :class:`SessionRenderer` arguments.
+
+    Returns:
+        dict: {<session file path>: (<thumbnail path>, <error message>)}
+    """
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    jobs = []
+    for file_path in file_paths:
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        output_path = os.path.join(
+            output_dir, '{}.{}'.format(name, ext.lstrip('.')))
+        jobs.append((file_path, output_path, kwargs))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(jobs) < 2:
+        # the application is only created for the render so the caller can
+        # still create its own application afterwards.
+        app = _offscreen_app()
+        try:
+            results = [_render_session_file(job) for job in jobs]
+        finally:
+            if app is not None:
+                app.shutdown()
+    else:
+        # spawn as forking a process that has loaded Qt isn't safe.
+        context = multiprocessing.get_context('spawn')
+        pool = context.Pool(min(processes, len(jobs)),
+                            initializer=_init_render_worker)
+        try:
+            results = pool.map(_render_session_file, jobs, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+    return {path: (output, error) for path, output, error in results}
+
+
+def render_directory(directory, output_dir=None, ext='png', pattern='*.json',
+                     processes=None, **kwargs):
+    """
+    Render all the session files in a directory to thumbnails in parallel.
+
+    Args:
+        directory (str): directory with the session files.
+        output_dir (str): directory the thumbnails are written to
+            (default: the session directory).
+        ext (str): thumbnail file extension (eg. ``"png"`` or ``"svg"``).
+        pattern (str): session file name pattern.
+        processes (int): number of worker processes (default: number of cpus).
+        **kwargs: :class:`SessionRenderer` arguments.
+
+    Returns:
+        dict: {<session file path>: (<thumbnail path>, <error message>)}
+    """
+    file_paths = sorted(glob.glob(os.path.join(directory, pattern)))
+    return render_sessions(file_paths, output_dir or directory, ext,
+                           processes, **kwargs)
@@ -0,0 +1,328 @@
+#!/usr/bin/python
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+
+class NodeResultCache(object):
+    """
+    Cache for the node outputs computed by the :class:`NodeGraphEvaluator`
+    keyed by a content hash of the node type, its custom properties and the
+    hashes of the upstream nodes so a node is only recomputed when something
+    it depends on has changed.
+
+    Outputs are kept in an in-memory LRU and optionally written to a disk
+    directory with a size limit, hits and misses are recorded per node.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph
+        from NodeGraphQt.base.result_cache import NodeResultCache
+
+        graph = NodeGraph()
+        graph.evaluator.set_result_cache(
+            NodeResultCache(disk_path='/tmp/node_cache')
+        )
+        ...
+        graph.evaluator.evaluate()
+        print(graph.evaluator.result_cache().stats())
+    """
+
+    #: default max number of outputs kept in memory.
+    MAX_ENTRIES = 512
+    #: default disk cache size limit in bytes.
+    DISK_LIMIT = 512 * 1024 * 1024
+
+    def __init__(self, max_entries=MAX_ENTRIES, disk_path=None,
+                 disk_limit=DISK_LIMIT):
+        """
+        Args:
+            max_entries (int): max number of outputs kept in memory.
+            disk_path (str): directory for the disk cache (default: no disk
+                cache).
+            disk_limit (int): disk cache size limit in bytes.
+        """
+        # {<key>: (<outputs>, <compute_time>)}
+        self._memory = OrderedDict()
+        self._max_entries = max_entries
+        self._disk_path = None
+        self._disk_limit = disk_limit
+        # {<key>: <file_size>} from least to most recently used.
+        self._disk_index = OrderedDict()
+        self._disk_size = 0
+        self._stats = {}
+        if disk_path:
+            self.set_disk_path(disk_path, disk_limit)
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def __len__(self):
+        return len(self._memory)
+
+    @staticmethod
+    def _json_cache_key(value):
+        """
+        Returns the JSON data hashed for a property value that isn't JSON
+        serializable from its ``__cache_key__()`` method.
+
+        Args:
+            value (object): property value.
+
+        Returns:
+            list: type name and the value cache key.
+        """
+        cache_key = getattr(value, '__cache_key__', None)
+        if cache_key is None:
+            raise TypeError(
+                'Object of type {} can\'t be hashed for the result cache, '
+                'implement "__cache_key__()" to return JSON data that '
+                'identifies the value.'.format(type(value).__name__)
+            )
+        return [type(value).__name__, cache_key()]
+
+    @staticmethod
+    def hash_key(node_type, properties, upstream_keys):
+        """
+        Returns the content hash for a node.
+
+        Note:
+            Property values that aren't JSON serializable must implement
+            a ``__cache_key__()`` method that returns JSON data, so the
+            keys stay the same across processes.
+
+        Args:
+            node_type (str): node type.
+            properties (dict): node properties the outputs depend on.
+            upstream_keys (list): upstream connections and their keys.
+
+        Raises:
+            TypeError: a property value can't be hashed.
+
+        Returns:
+            str: hash key.
+        """
+        data = json.dumps([node_type, properties, upstream_keys],
+                          sort_keys=True,
+                          default=NodeResultCache._json_cache_key)
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def disk_path(self):
+        """
+        Returns the disk cache directory.
+
+        Returns:
+            str: directory path or None.
+        """
+        return self._disk_path
+
+    def set_disk_path(self, path=None, limit=None):
+        """
+        Set the directory for the disk cache tier.
+
+        Args:
+            path (str): directory path (set to None to disable the disk cache).
+            limit (int): disk cache size limit in bytes.
+        """
+        if limit is not None:
+            self._disk_limit = limit
+        self._disk_index.clear()
+        self._disk_size = 0
+        self._disk_path = path
+        if not path:
+            return
+        os.makedirs(path, exist_ok=True)
+
+        # index the existing cache files from the oldest to newest used.
+        entries = []
+        for entry in os.scandir(path):
+            if entry.is_file() and entry.name.endswith('.pkl'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk_index[key] = size
+            self._disk_size += size
+        self._trim_disk()
+
+    def get(self, key, node_id=None):
+        """
+        Returns the cached outputs for the key.
+
+        Args:
+            key (str): hash key.
+            node_id (int): node id to record the hit or miss for.
+
+        Returns:
+            dict: {<port_name>: <value>} outputs or None if not cached.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        else:
+            entry = self._read_disk(key)
+            if entry is not None:
+                self._set_memory(key, entry)
+
+        if node_id is not None:
+            stats = self._node_stats(node_id)
+            if entry is None:
+                stats['misses'] += 1
+            else:
+                stats['hits'] += 1
+                stats['time_saved'] += entry[1]
+        return None if entry is None else entry[0]
+
+    def set(self, key, outputs, compute_time=0.0):
+        """
+        Cache the node outputs.
+
+        Args:
+            key (str): hash key.
+            outputs (dict): {<port_name>: <value>}
+            compute_time (float): seconds it took to compute the outputs.
+        """
+        entry = (outputs, compute_time)
+        self._set_memory(key, entry)
+        self._write_disk(key, entry)
+
+    def stats(self, node_id=None):
+        """
+        Returns the cache hit and miss stats.
+
+        Args:
+            node_id (int): node id (default: stats for all nodes).
+
+        Returns:
+            dict: ``{'hits': int, 'misses': int, 'time_saved': float}`` or
+                ``{<node_id>: <stats>}`` if no node id is specified.
+        """
+        if node_id is not None:
+            return dict(self._node_stats(node_id))
+        return {i: dict(s) for i, s in self._stats.items()}
+
+    def reset_stats(self):
+        """
+        Clear the hit and miss stats.
+        """
+        self._stats.clear()
+
+    def clear(self, disk=False):
+        """
+        Clear the cached outputs.
+
+        Args:
+            disk (bool): also delete the disk cache files.
+        """
+        self._memory.clear()
+        if disk and self._disk_path:
+            for key in list(self._disk_index.keys()):
+                self._remove_disk(key)
+
+    def _node_stats(self, node_id):
+        """
+        Returns the hit and miss stats for the node.
+
+        Args:
+            node_id (int): node id.
+
+        Returns:
+            dict: node stats.
+        """
+        if node_id not in self._stats:
+            self._stats[node_id] = {'hits': 0, 'misses': 0, 'time_saved': 0.0}
+        return self._stats[node_id]
+
+    def _set_memory(self, key, entry):
+        """
+        Add the entry to the in-memory tier and evict the least recently
+        used entries over the max entries.
+
+        Args:
+            key (str): hash key.
+            entry (tuple): outputs, compute time.
+        """
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _file_path(self, key):
+        """
+        Args:
+            key (str): hash key.
+
+        Returns:
+            str: disk cache file path.
+        """
+        return os.path.join(self._disk_path, key + '.pkl')
+
+    def _read_disk(self, key):
+        """
+        Read the entry from the disk tier.
+
+        Args:
+            key (str): hash key.
+
+        Returns:
+            tuple: outputs, compute time or None.
+        """
+        if not self._disk_path or key not in self._disk_index:
+            return
+        file_path = self._file_path(key)
+        try:
+            with open(file_path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(file_path)
+        except Exception:
+            self._remove_disk(key)
+            return
+        self._disk_index.move_to_end(key)
+        return entry
+
+    def _write_disk(self, key, entry):
+        """
+        Write the entry to the disk tier.
+
+        Args:
+            key (str): hash key.
+            entry (tuple): outputs, compute time.
+        """
+        if not self._disk_path:
+            return
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # outputs that can't be pickled are only cached in memory.
+            return
+        if len(data) > self._disk_limit:
+            return
+        with open(self._file_path(key), 'wb') as f:
+            f.write(data)
+        self._disk_size += len(data) - self._disk_index.get(key, 0)
+        self._disk_index[key] = len(data)
+        self._disk_index.move_to_end(key)
+        self._trim_disk()
+
+    def _remove_disk(self, key):
+        """
+        Delete the entry from the disk tier.
+
+        Args:
+            key (str): hash key.
+        """
+        self._disk_size -= self._disk_index.pop(key, 0)
+        try:
+            os.remove(self._file_path(key))
+        except OSError:
+            pass
+
+    def _trim_disk(self):
+        """
+        Delete the least recently used disk entries over the size limit.
+        """
+        while self._disk_index and self._disk_size > self._disk_limit:
+            self._remove_disk(next(iter(self._disk_index)))
@@ -0,0 +1,394 @@
+#!/usr/bin/python
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PySide6 import QtCore
+
+from NodeGraphQt.constants import NodeExecutorEnum, NodeStatusEnum
+from NodeGraphQt.errors import NodeEvaluationError
+
+
+def _timed_compute(func, *args):
+    """
+    Call the node compute function in a worker and time it.
+
+    Returns:
+        tuple(dict, float): outputs, seconds it took to compute.
+    """
+    start = time.perf_counter()
+    outputs = func(*args)
+    return outputs, time.perf_counter() - start
+
+
+class NodeGraphScheduler(QtCore.QObject):
+    """
+    The ``NodeGraphScheduler`` runs the :class:`NodeGraphEvaluator` without
+    blocking the Qt event loop by dispatching the nodes that are ready to a
+    thread or process pool.
+
+    The executor is chosen per node class with the
+    :attr:`BaseNode.COMPUTE_EXECUTOR` attribute and independent branches of
+    the graph are computed in parallel up to the max concurrency.
+
+    .. code-block:: python
+        :linenos:
+
+        from NodeGraphQt import NodeGraph
+
+        graph = NodeGraph()
+        ...
+        scheduler = graph.scheduler
+        scheduler.finished.connect(lambda results: print(results))
+        scheduler.run()
+    """
+
+    node_status_changed = QtCore.Signal(object, str)
+    """
+    Signal triggered when the compute status of a node has changed.
+
+    :parameters: str, str
+    :emits: node id, :attr:`NodeGraphQt.constants.NodeStatusEnum` value
+    """
+    finished = QtCore.Signal(dict)
+    """
+    Signal triggered when a run has finished or has been cancelled.
+
+    :parameters: dict
+    :emits: {<node_id>: {<port_name>: <value>}} computed node outputs.
+    """
+
+    # internal signal to send completed tasks back to the main thread.
+    _task_done = QtCore.Signal(object)
+
+    def __init__(self, evaluator, max_concurrency=None, parent=None):
+        """
+        Args:
+            evaluator (NodeGraphEvaluator): evaluator to run.
+            max_concurrency (int): max number of nodes computed at once
+                (default: cpu count).
+            parent (QtCore.QObject): object parent.
+        """
+        super(NodeGraphScheduler, self).__init__(parent)
+        self._evaluator = evaluator
+        self._max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._pools = {}
+        self._running = False
+        self._node_map = {}
+        self._upstream = {}
+        self._downstream = {}
+        self._in_degree = {}
+        self._ready = deque()
+        self._tasks = {}
+        self._recomputed = set()
+        self._results = {}
+        self._errors = {}
+
+        self._task_done.connect(self._on_task_done,
+                                QtCore.Qt.QueuedConnection)
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def _on_task_done(self, future):
+        """
+        Slot when a pool task has finished (called from the main thread).
+
+        Args:
+            future (concurrent.futures.Future): node compute task.
+        """
+        # tasks from a cancelled run are ignored.
+        if future not in self._tasks:
+            return
+        node, connections, key = self._tasks.pop(future)
+        if future.cancelled():
+            self._set_status(node, NodeStatusEnum.CANCELLED.value)
+        elif future.exception() is not None:
+            e = future.exception()
+            self._fail(node, NodeEvaluationError(
+                'Failed to compute node "{}": {}'.format(node.name(), e)
+            ))
+        else:
+            outputs, compute_time = future.result()
+            outputs = dict(outputs or {})
+            self._evaluator._cache_outputs(key, outputs, compute_time)
+            self._complete(node, outputs, connections, key)
+        self._dispatch()
+
+    @property
+    def evaluator(self):
+        """
+        The evaluator the scheduler runs.
+
+        Returns:
+            NodeGraphEvaluator: node graph evaluator.
+        """
+        return self._evaluator
+
+    @property
+    def errors(self):
+        """
+        Errors from the nodes that failed to compute in the last run.
+
+        Returns:
+            dict: {<node_id>: <NodeEvaluationError>}
+        """
+        return self._errors
+
+    def is_running(self):
+        """
+        Returns true if the scheduler is running.
+
+        Returns:
+            bool: true if running.
+        """
+        return self._running
+
+    def max_concurrency(self):
+        """
+        Returns the max number of nodes computed at once.
+
+        Returns:
+            int: max concurrency.
+        """
+        return self._max_concurrency
+
+    def set_max_concurrency(self, count):
+        """
+        Set the max number of nodes computed at once.
+
+        Args:
+            count (int): max concurrency.
+        """
+        count = max(1, int(count))
+        if count == self._max_concurrency:
+            return
+        self._max_concurrency = count
+        # pools are created again with the new worker count.
+        self.shutdown(wait=False)
+
+    def run(self, nodes=None):
+        """
+        Start computing the nodes and the nodes upstream from them, a run
+        that's already in progress is cancelled first.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]):
+                nodes to compute (default: all nodes).
+        """
+        if self._running:
+            self.cancel()
+
+        node_map, upstream = self._evaluator.dependencies(nodes)
+        # raises an error before anything is computed if there's a cycle.
+        self._evaluator.schedule(list(node_map.values()))
+
+        self._node_map = node_map
+        self._upstream = upstream
+        self._downstream = {node_id: [] for node_id in node_map}
+        for node_id, upstream_ids in upstream.items():
+            for upstream_id in upstream_ids:
+                self._downstream[upstream_id].append(node_id)
+        self._in_degree = {i: len(ids) for i, ids in upstream.items()}
+        self._ready = deque(i for i, d in self._in_degree.items() if d == 0)
+        self._tasks = {}
+        self._recomputed = set()
+        self._results = {}
+        self._errors = {}
+        self._running = True
+
+        for node in node_map.values():
+            self._set_status(node, NodeStatusEnum.QUEUED.value)
+        self._dispatch()
+
+    def cancel(self):
+        """
+        Cancel the current run, nodes that are already being computed in a
+        worker finish but their outputs are discarded.
+        """
+        if not self._running:
+            return
+        for future in self._tasks.keys():
+            future.cancel()
+        for node_id, node in self._node_map.items():
+            if node_id not in self._results:
+                self._set_status(node, NodeStatusEnum.CANCELLED.value)
+        self._tasks = {}
+        self._ready.clear()
+        self._finish()
+
+    def wait(self):
+        """
+        Block until the current run has finished while processing Qt events.
+
+        Returns:
+            dict: {<node_id>: {<port_name>: <value>}} computed node outputs.
+        """
+        if self._running:
+            loop = QtCore.QEventLoop()
+            self.finished.connect(loop.quit)
+            loop.exec()
+            self.finished.disconnect(loop.quit)
+        return self._results
+
+    def shutdown(self, wait=True):
+        """
+        Shutdown the worker pools.
+
+        Args:
+            wait (bool): wait for the running tasks to finish.
+        """
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+        self._pools = {}
+
+    def clear_status(self, nodes=None):
+        """
+        Clear the compute status indicator from the nodes.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): nodes (default: all nodes).
+        """
+        nodes = self._node_map.values() if nodes is None else nodes
+        for node in nodes:
+            if hasattr(node.view, 'compute_status'):
+                node.view.compute_status = None
+
+    def _pool(self, executor):
+        """
+        Returns the worker pool for the executor type.
+
+        Args:
+            executor (str): NodeGraphQt.constants.NodeExecutorEnum value.
+
+        Returns:
+            concurrent.futures.Executor: worker pool.
+        """
+        if executor not in self._pools:
+            if executor == NodeExecutorEnum.PROCESS.value:
+                pool = ProcessPoolExecutor(max_workers=self._max_concurrency)
+            else:
+                pool = ThreadPoolExecutor(max_workers=self._max_concurrency)
+            self._pools[executor] = pool
+        return self._pools[executor]
+
+    def _set_status(self, node, status):
+        """
+        Update the node status indicator and emit the status signal.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            status (str): NodeGraphQt.constants.NodeStatusEnum value.
+        """
+        if hasattr(node.view, 'compute_status'):
+            node.view.compute_status = status
+        self.node_status_changed.emit(node.id, status)
+
+    def _dispatch(self):
+        """
+        Compute the nodes that are ready until the max concurrency has been
+        reached.
+        """
+        evaluator = self._evaluator
+        while self._running and self._ready:
+            if len(self._tasks) >= self._max_concurrency:
+                return
+
+            node = self._node_map[self._ready.popleft()]
+            inputs, connections = evaluator._node_inputs(node)
+            upstream_changed = bool(
+                self._recomputed.intersection(self._upstream[node.id])
+            )
+            if not evaluator._needs_compute(node, connections,
+                                            upstream_changed):
+                self._complete(node, None, connections)
+                continue
+
+            key, outputs = evaluator._cached_outputs(node, connections)
+            if outputs is not None:
+                self._complete(node, outputs, connections, key,
+                               NodeStatusEnum.CACHED.value)
+                continue
+
+            executor = node.COMPUTE_EXECUTOR
+            if node.disabled() or executor == NodeExecutorEnum.MAIN.value:
+                start = time.perf_counter()
+                try:
+                    outputs = evaluator._compute(node, inputs)
+                except NodeEvaluationError as e:
+                    self._fail(node, e)
+                    continue
+                evaluator._cache_outputs(key, outputs,
+                                         time.perf_counter() - start)
+                self._complete(node, outputs, connections, key)
+                # let the event loop process between main thread nodes.
+                if self._ready:
+                    QtCore.QTimer.singleShot(0, self._dispatch)
+                    return
+                continue
+
+            func, args = evaluator._compute_call(node, inputs)
+            future = self._pool(executor).submit(_timed_compute, func, *args)
+            self._tasks[future] = (node, connections, key)
+            self._set_status(node, NodeStatusEnum.RUNNING.value)
+            future.add_done_callback(self._task_done.emit)
+
+        if self._running and not self._tasks and not self._ready:
+            self._finish()
+
+    def _complete(self, node, outputs, connections, key=None,
+                  status=NodeStatusEnum.DONE.value):
+        """
+        Store the node outputs and queue the downstream nodes that are ready.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            outputs (dict): computed outputs or None if the outputs from the
+                last evaluation are up to date.
+            connections (tuple): input port connections.
+            key (str): result cache key.
+            status (str): NodeGraphQt.constants.NodeStatusEnum value.
+        """
+        if outputs is None:
+            self._set_status(node, NodeStatusEnum.CACHED.value)
+        else:
+            self._evaluator._store_result(node, outputs, connections, key)
+            self._recomputed.add(node.id)
+            self._set_status(node, status)
+        self._results[node.id] = self._evaluator.result(node)
+
+        for downstream_id in self._downstream[node.id]:
+            self._in_degree[downstream_id] -= 1
+            if self._in_degree[downstream_id] == 0:
+                self._ready.append(downstream_id)
+
+    def _fail(self, node, error):
+        """
+        Mark the node as failed and cancel the nodes downstream from it.
+
+        Args:
+            node (NodeGraphQt.BaseNode): node object.
+            error (NodeEvaluationError): compute error.
+        """
+        self._errors[node.id] = error
+        self._set_status(node, NodeStatusEnum.FAILED.value)
+
+        stack = list(self._downstream[node.id])
+        cancelled = set()
+        while stack:
+            node_id = stack.pop()
+            if node_id in cancelled:
+                continue
+            cancelled.add(node_id)
+            self._set_status(self._node_map[node_id],
+                             NodeStatusEnum.CANCELLED.value)
+            stack.extend(self._downstream[node_id])
+
+    def _finish(self):
+        """
+        End the current run.
+        """
+        self._running = False
+        self.finished.emit(self._results)
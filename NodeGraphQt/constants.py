@@ -18,6 +18,25 @@ MIME_TYPE = 'nodegraphqt/nodes'
 URI_SCHEME = 'nodegraphqt://'
 URN_SCHEME = 'nodegraphqt::'
 
+# entry point group for node plugins registered with the node factory.
+NODE_ENTRY_POINT_GROUP = 'nodegraphqt.nodes'
+
+# max number of nodes kept alive by collapsed sub graphs.
+SUB_GRAPH_CACHE_LIMIT = 20000
+
+# private clipboard MIME types for copied nodes.
+CLIPBOARD_MIME_TYPE = 'application/x-nodegraphqt-nodes'
+CLIPBOARD_TOKEN_MIME_TYPE = 'application/x-nodegraphqt-nodes-token'
+
+# max number of copied nodes that are also written to the clipboard as text.
+CLIPBOARD_TEXT_NODE_LIMIT = 200
+
+# max number of idle embedded widgets recycled per node widget type.
+NODE_WIDGET_POOL_LIMIT = 8
+
+# default width, height of the session thumbnails.
+SESSION_THUMBNAIL_SIZE = (512, 512)
+
 # PATHS
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 ICON_PATH = os.path.join(BASE_PATH, 'widgets', 'icons')
@@ -117,6 +136,58 @@ class NodeEnum(Enum):
     #: default node border color when selected.
     SELECTED_BORDER_COLOR = (254, 207, 42, 255)
 
+
+class NodeAlignEnum(Enum):
+    """
+    Node alignment used by :meth:`NodeGraphQt.NodeGraph.align_nodes`:
+    :py:mod:`NodeGraphQt.constants.NodeAlignEnum`
+    """
+    #: align the left edge of the nodes.
+    LEFT = 'left'
+    #: align the right edge of the nodes.
+    RIGHT = 'right'
+    #: align the top edge of the nodes.
+    TOP = 'top'
+    #: align the bottom edge of the nodes.
+    BOTTOM = 'bottom'
+    #: align the horizontal center of the nodes.
+    CENTER_X = 'center_x'
+    #: align the vertical center of the nodes.
+    CENTER_Y = 'center_y'
+
+
+class NodeExecutorEnum(Enum):
+    """
+    Executor used to compute the node when the graph is run with the
+    node graph scheduler:
+    :py:mod:`NodeGraphQt.constants.NodeExecutorEnum`
+    """
+    #: compute the node in the main (GUI) thread.
+    MAIN = 'main'
+    #: compute the node in a worker thread.
+    THREAD = 'thread'
+    #: compute the node in a worker process.
+    PROCESS = 'process'
+
+
+class NodeStatusEnum(Enum):
+    """
+    Node compute status when the graph is run with the node graph scheduler:
+    :py:mod:`NodeGraphQt.constants.NodeStatusEnum`
+    """
+    #: node is waiting for the upstream nodes.
+    QUEUED = 'queued'
+    #: node is being computed.
+    RUNNING = 'running'
+    #: node has been computed.
+    DONE = 'done'
+    #: node outputs were up to date and not recomputed.
+    CACHED = 'cached'
+    #: node failed to compute.
+    FAILED = 'failed'
+    #: node was cancelled or an upstream node failed.
+    CANCELLED = 'cancelled'
+
 # ==================================== PORT ====================================
 
 
@@ -305,8 +305,8 @@ class NodePropEditorWidget(QtWidgets.QWidget):
     """
 
     #: signal (node_id, prop_name, prop_value)
-    property_changed = QtCore.Signal(str, str, object)
-    property_closed = QtCore.Signal(str)
+    property_changed = QtCore.Signal(object, str, object)
+    property_closed = QtCore.Signal(object)
 
     def __init__(self, parent=None, node=None):
         super(NodePropEditorWidget, self).__init__(parent)
@@ -443,7 +443,7 @@ class NodePropEditorWidget(QtWidgets.QWidget):
             'text_color': 'Node text color.',
             'border_color': 'Node border color.',
             'disabled': 'Disable/Enable node state.',
-            'id': 'Unique identifier string to the node.'
+            'id': 'Unique identifier to the node.'
         }
         prop_window = self.__tab_windows['Node']
         for prop_name, tooltip in default_props.items():
@@ -495,7 +495,7 @@ class NodePropEditorWidget(QtWidgets.QWidget):
         Returns the node id linked to the widget.
 
         Returns:
-            str: node id
+            int: node id
         """
         return self.__node_id
 
@@ -622,7 +622,7 @@ class PropertiesBinWidget(QtWidgets.QWidget):
     """
 
     #: Signal emitted (node_id, prop_name, prop_value)
-    property_changed = QtCore.Signal(str, str, object)
+    property_changed = QtCore.Signal(object, str, object)
 
     def __init__(self, parent=None, node_graph=None):
         super(PropertiesBinWidget, self).__init__(parent)
@@ -679,11 +679,11 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         resize the property list table row.
 
         Args:
-            node_id (str): node id.
+            node_id (int): node id.
             visible (bool): visibility state.
             tree_widget (QtWidgets.QTreeWidget): ports tree widget.
         """
-        items = self._prop_list.findItems(node_id, QtCore.Qt.MatchExactly)
+        items = self._prop_list.findItems(str(node_id), QtCore.Qt.MatchExactly)
         if items:
             tree_widget.setVisible(visible)
             widget = self._prop_list.cellWidget(items[0].row(), 0)
@@ -699,9 +699,9 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         the property list widget.
 
         Args:
-            node_id (str): node id.
+            node_id (int): node id.
         """
-        items = self._prop_list.findItems(node_id, QtCore.Qt.MatchFlag.MatchExactly)
+        items = self._prop_list.findItems(str(node_id), QtCore.Qt.MatchFlag.MatchExactly)
         [self._prop_list.removeRow(i.row()) for i in items]
 
     def __on_limit_changed(self, value):
@@ -720,7 +720,7 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         Slot function when a node has been deleted.
 
         Args:
-            nodes (list[str]): list of node ids.
+            nodes (list[int]): list of node ids.
         """
         [self.__on_prop_close(n) for n in nodes]
 
@@ -749,7 +749,7 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         Slot function triggered when a property widget value has changed.
 
         Args:
-            node_id (str): node id.
+            node_id (int): node id.
             prop_name (str): node property name.
             prop_value (object): node property value.
         """
@@ -802,7 +802,7 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         if rows >= self.limit():
             self._prop_list.removeRow(rows - 1)
 
-        itm_find = self._prop_list.findItems(node.id, QtCore.Qt.MatchFlag.MatchExactly)
+        itm_find = self._prop_list.findItems(str(node.id), QtCore.Qt.MatchFlag.MatchExactly)
         if itm_find:
             self._prop_list.removeRow(itm_find[0].row())
 
@@ -826,7 +826,7 @@ class PropertiesBinWidget(QtWidgets.QWidget):
 
         self._prop_list.setCellWidget(0, 0, prop_widget)
 
-        item = QtWidgets.QTableWidgetItem(node.id)
+        item = QtWidgets.QTableWidgetItem(str(node.id))
         self._prop_list.setItem(0, 0, item)
         self._prop_list.selectRow(0)
 
@@ -835,9 +835,9 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         Remove node from the properties bin.
 
         Args:
-            node (str or NodeGraphQt.BaseNode): node id or node object.
+            node (int or NodeGraphQt.BaseNode): node id or node object.
         """
-        node_id = node if isinstance(node, str) else node.id
+        node_id = node if isinstance(node, (int, str)) else node.id
         self.__on_prop_close(node_id)
 
     def lock_bin(self):
@@ -861,13 +861,13 @@ class PropertiesBinWidget(QtWidgets.QWidget):
         Returns the node property editor widget.
 
         Args:
-            node (str or NodeGraphQt.NodeObject): node id or node object.
+            node (int or NodeGraphQt.NodeObject): node id or node object.
 
         Returns:
             NodePropEditorWidget: node property editor widget.
         """
-        node_id = node if isinstance(node, str) else node.id
-        itm_find = self._prop_list.findItems(node_id, QtCore.Qt.MatchFlag.MatchExactly)
+        node_id = node if isinstance(node, (int, str)) else node.id
+        itm_find = self._prop_list.findItems(str(node_id), QtCore.Qt.MatchFlag.MatchExactly)
         if itm_find:
             item = itm_find[0]
             return self._prop_list.cellWidget(item.row(), 0)
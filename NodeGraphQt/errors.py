@@ -24,3 +24,6 @@ class PortError(Exception): pass
 
 
 class PortRegistrationError(Exception): pass
+
+
+class NodeEvaluationError(Exception): pass
@@ -1,10 +1,15 @@
 #!/usr/bin/python
+import sys
 from collections import OrderedDict
 
 from NodeGraphQt.base.commands import NodeVisibleCmd, NodeWidgetVisibleCmd
 from NodeGraphQt.base.node import NodeObject
 from NodeGraphQt.base.port import Port
-from NodeGraphQt.constants import NodePropWidgetEnum, PortTypeEnum
+from NodeGraphQt.constants import (
+    NodeExecutorEnum,
+    NodePropWidgetEnum,
+    PortTypeEnum
+)
 from NodeGraphQt.errors import (
     PortError,
     PortRegistrationError,
@@ -56,6 +61,10 @@ class BaseNode(NodeObject):
 
     NODE_NAME = 'Node'
 
+    # executor used to compute the node with the node graph scheduler
+    # see: NodeGraphQt.constants.NodeExecutorEnum
+    COMPUTE_EXECUTOR = NodeExecutorEnum.MAIN.value
+
     def __init__(self, qgraphics_item=None):
         super(BaseNode, self).__init__(qgraphics_item or NodeItem)
         self._inputs = []
@@ -380,12 +389,12 @@ class BaseNode(NodeObject):
 
         port = Port(self, view)
         port.model.type_ = PortTypeEnum.IN.value
-        port.model.name = name
+        port.model.name = sys.intern(name)
         port.model.display_name = display_name
         port.model.multi_connection = multi_input
         port.model.locked = locked
         self._inputs.append(port)
-        self.model.inputs[port.name()] = port.model
+        self.model.add_port(port.model)
         return port
 
     def add_output(self, name='output', multi_output=True, display_name=True,
@@ -422,12 +431,12 @@ class BaseNode(NodeObject):
             view.border_color = [min([255, max([0, i + 80])]) for i in color]
         port = Port(self, view)
         port.model.type_ = PortTypeEnum.OUT.value
-        port.model.name = name
+        port.model.name = sys.intern(name)
         port.model.display_name = display_name
         port.model.multi_connection = multi_output
         port.model.locked = locked
         self._outputs.append(port)
-        self.model.outputs[port.name()] = port.model
+        self.model.add_port(port.model)
         return port
 
     def get_input(self, port):
@@ -487,7 +496,7 @@ class BaseNode(NodeObject):
         if port.locked():
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._inputs.remove(port)
-        self._model.inputs.pop(port.name())
+        self._model.remove_port(port.model)
         self._view.delete_input(port.view)
         port.model.node = None
         self._view.draw_node()
@@ -517,7 +526,7 @@ class BaseNode(NodeObject):
         if port.locked():
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._outputs.remove(port)
-        self._model.outputs.pop(port.name())
+        self._model.remove_port(port.model)
         self._view.delete_output(port.view)
         port.model.node = None
         self._view.draw_node()
@@ -870,3 +879,57 @@ class BaseNode(NodeObject):
             out_port (NodeGraphQt.Port): output port that was disconnected.
         """
         return
+
+    def compute(self, inputs):
+        """
+        Compute the node outputs from the input values when the node graph
+        is evaluated with the :attr:`NodeGraph.evaluator`.
+
+        *The default of this function returns no outputs re-implement to
+        compute the node.*
+
+        .. code-block:: python
+            :linenos:
+
+            class AddNode(BaseNode):
+
+                def __init__(self):
+                    super(AddNode, self).__init__()
+                    self.add_input('a')
+                    self.add_input('b')
+                    self.add_output('sum')
+
+                def compute(self, inputs):
+                    return {'sum': (inputs['a'] or 0) + (inputs['b'] or 0)}
+
+        Args:
+            inputs (dict): {<input_port_name>: <value>} values from the
+                connected upstream output ports (a list of values for
+                multi connection input ports).
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        return {}
+
+    @classmethod
+    def process_compute(cls, properties, inputs):
+        """
+        Compute the node outputs in a worker process when the node class
+        :attr:`BaseNode.COMPUTE_EXECUTOR` is set to
+        ``NodeExecutorEnum.PROCESS.value``.
+
+        The node object can't be sent to another process so this is called
+        with a copy of the node custom properties instead, the properties,
+        inputs and outputs must be picklable.
+
+        Args:
+            properties (dict): node custom properties.
+            inputs (dict): {<input_port_name>: <value>}
+
+        Returns:
+            dict: {<output_port_name>: <value>}
+        """
+        raise NotImplementedError(
+            '{}.process_compute() not implemented!'.format(cls.__name__)
+        )
@@ -1,4 +1,5 @@
 #!/usr/bin/python
+from NodeGraphQt.base.model import SubGraphSession
 from NodeGraphQt.nodes.base_node import BaseNode
 from NodeGraphQt.nodes.port_node import PortInputNode, PortOutputNode
 from NodeGraphQt.qgraphics.node_group import GroupNodeItem
@@ -23,6 +24,7 @@ class GroupNode(BaseNode):
 
     def __init__(self, qgraphics_item=None):
         super(GroupNode, self).__init__(qgraphics_item or GroupNodeItem)
+        self.model.subgraph_session = {}
         self._input_port_nodes = {}
         self._output_port_nodes = {}
 
@@ -55,7 +57,24 @@ class GroupNode(BaseNode):
         Returns:
             dict: serialized sub graph session.
         """
-        return self.model.subgraph_session
+        return SubGraphSession.decode_all(self._sub_graph_session())
+
+    def _sub_graph_session(self):
+        """
+        Returns the sub graph session with the nested group node sessions
+        that haven't been decoded kept as :class:`SubGraphSession` objects.
+        (used internally by the node graph)
+
+        Returns:
+            dict: serialized sub graph session.
+        """
+        self._update_sub_graph_session()
+        session = self.model.subgraph_session
+        if isinstance(session, SubGraphSession):
+            # decode the session loaded from a saved session file.
+            session = session.decode()
+            self.model.subgraph_session = session
+        return session
 
     def set_sub_graph_session(self, serialized_session):
         """
@@ -67,6 +86,25 @@ class GroupNode(BaseNode):
         serialized_session = serialized_session or {}
         self.model.subgraph_session = serialized_session
 
+    def _update_sub_graph_session(self):
+        """
+        Serialize the expanded or cached sub graph to the group node session
+        as sub graphs are only serialized when they're evicted from the
+        :attr:`NodeGraph.sub_graph_cache`.
+        """
+        if not self.graph:
+            return
+        sub_graph = self.get_sub_graph()
+        if sub_graph:
+            self.set_sub_graph_session(sub_graph._serialize(
+                sub_graph.all_nodes(), lazy_sessions=True))
+        else:
+            self.graph.sub_graph_cache.flush(self)
+
+    def update_model(self):
+        super(GroupNode, self).update_model()
+        self._update_sub_graph_session()
+
     def expand(self):
         """
         Expand the group node session.
@@ -103,7 +141,7 @@ class GroupNode(BaseNode):
                 root_graph = sub_graph.parent_graph
                 tab_bar = root_graph.widget.tabBar()
                 for idx in range(tab_bar.count()):
-                    if tab_bar.tabToolTip(idx) == self.id:
+                    if tab_bar.tabToolTip(idx) == str(self.id):
                         tab_bar.setTabText(idx, self.name())
                         break
 
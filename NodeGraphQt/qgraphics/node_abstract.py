@@ -16,7 +16,12 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
 
     def __init__(self, name='node', parent=None):
         super(AbstractNodeItem, self).__init__(parent)
-        self.setFlags(self.GraphicsItemFlag.ItemIsSelectable | self.GraphicsItemFlag.ItemIsMovable)
+        # node graph geometry store the position and size changes are
+        # pushed to.
+        self._geometry = None
+        self.setFlags(self.GraphicsItemFlag.ItemIsSelectable |
+                      self.GraphicsItemFlag.ItemIsMovable |
+                      self.GraphicsItemFlag.ItemSendsGeometryChanges)
         self.setCacheMode(ITEM_CACHE_MODE)
         self.setZValue(Z_VAL_NODE)
         self._properties = {
@@ -119,6 +124,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     @width.setter
     def width(self, width=0.0):
         self._width = width
+        self._update_geometry_size()
 
     @property
     def height(self):
@@ -127,6 +133,57 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     @height.setter
     def height(self, height=0.0):
         self._height = height
+        self._update_geometry_size()
+
+    def itemChange(self, change, value):
+        """
+        Re-implemented to push the node position to the node graph geometry
+        store when the node item is moved.
+
+        Args:
+            change:
+            value:
+        """
+        if self._geometry is not None:
+            if change == self.GraphicsItemChange.ItemPositionHasChanged:
+                self._geometry.set_pos(self.id, value.x(), value.y())
+            elif (change == self.GraphicsItemChange.ItemSceneHasChanged and
+                    value is not None):
+                self._update_geometry_pos()
+        return super(AbstractNodeItem, self).itemChange(change, value)
+
+    def set_geometry_store(self, geometry):
+        """
+        Set the node graph geometry store the node position and size are
+        kept in sync with.
+
+        Args:
+            geometry (NodeGraphQt.base.model.NodeGeometryStore):
+                geometry store or None.
+        """
+        self._geometry = geometry
+        self._update_geometry_size()
+        # the item position is pushed when it's added to a scene.
+        if self.scene() is not None:
+            self._update_geometry_pos()
+
+    def _update_geometry_pos(self):
+        """
+        Push the node position to the node graph geometry store.
+        (called when the node is added to a scene)
+        """
+        if self._geometry is not None:
+            pos = self.pos()
+            self._geometry.set_pos(self.id, pos.x(), pos.y())
+
+    def _update_geometry_size(self):
+        """
+        Push the node size to the node graph geometry store.
+        (called when the node size changes)
+        """
+        if self._geometry is not None:
+            self._geometry.set_width(self.id, float(self._width))
+            self._geometry.set_height(self.id, float(self._height))
 
     @property
     def color(self):
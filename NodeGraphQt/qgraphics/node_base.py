@@ -8,6 +8,7 @@ from NodeGraphQt.constants import (
     ICON_NODE_BASE,
     LayoutDirectionEnum,
     NodeEnum,
+    NodeStatusEnum,
     PortEnum,
     PortTypeEnum,
     Z_VAL_NODE
@@ -15,9 +16,18 @@ from NodeGraphQt.constants import (
 from NodeGraphQt.errors import NodeWidgetError
 from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
 from NodeGraphQt.qgraphics.node_overlay_disabled import XDisabledItem
-from NodeGraphQt.qgraphics.node_text_item import NodeTextItem
+from NodeGraphQt.qgraphics.node_text_item import NodeTextItem, StaticTextItem
 from NodeGraphQt.qgraphics.port import PortItem, CustomPortItem
 
+# compute status indicator colors.
+STATUS_COLORS = {
+    NodeStatusEnum.QUEUED.value: (150, 150, 150, 255),
+    NodeStatusEnum.RUNNING.value: (254, 207, 42, 255),
+    NodeStatusEnum.DONE.value: (71, 199, 95, 255),
+    NodeStatusEnum.CACHED.value: (71, 160, 199, 255),
+    NodeStatusEnum.FAILED.value: (232, 62, 62, 255),
+    NodeStatusEnum.CANCELLED.value: (90, 90, 90, 255),
+}
 
 class NodeItem(AbstractNodeItem):
     """
@@ -46,6 +56,7 @@ class NodeItem(AbstractNodeItem):
         self._widgets = OrderedDict()
         self._proxy_mode = False
         self._proxy_mode_threshold = 70
+        self._compute_status = None
 
     def post_init(self, viewer, pos=None):
         """
@@ -190,7 +201,6 @@ class NodeItem(AbstractNodeItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
-        self.auto_switch_mode()
         if self.layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
             self._paint_horizontal(painter, option, widget)
         elif self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
@@ -198,6 +208,30 @@ class NodeItem(AbstractNodeItem):
         else:
             raise RuntimeError('Node graph layout direction not valid!')
 
+        if self._compute_status:
+            self._paint_compute_status(painter)
+
+    def _paint_compute_status(self, painter):
+        """
+        Draws the compute status indicator in the top right corner.
+
+        Args:
+            painter (QtGui.QPainter): painter used for drawing the item.
+        """
+        color = STATUS_COLORS.get(self._compute_status)
+        if not color:
+            return
+        size = 8.0
+        rect = self.boundingRect()
+        status_rect = QtCore.QRectF(rect.right() - size - 4.0,
+                                    rect.top() + 4.0,
+                                    size, size)
+        painter.save()
+        painter.setPen(QtGui.QPen(QtGui.QColor(0, 0, 0, 120), 1.0))
+        painter.setBrush(QtGui.QColor(*color))
+        painter.drawEllipse(status_rect)
+        painter.restore()
+
     def mousePressEvent(self, event):
         """
         Re-implemented to ignore event if LMB is over port collision area.
@@ -241,7 +275,6 @@ class NodeItem(AbstractNodeItem):
                 items = self.scene().items(event.scenePos())
                 if self._text_item in items:
                     self._text_item.set_editable(True)
-                    self._text_item.setFocus()
                     event.ignore()
                     return
 
@@ -252,12 +285,18 @@ class NodeItem(AbstractNodeItem):
 
     def itemChange(self, change, value):
         """
-        Re-implemented to update pipes on selection changed.
+        Re-implemented to update pipes on selection changed and track the
+        node for proxy mode switching in the scene.
 
         Args:
             change:
             value:
         """
+        if change == self.GraphicsItemChange.ItemSceneChange:
+            scene = self.scene()
+            if hasattr(scene, 'track_proxy_node'):
+                scene.track_proxy_node(self, None)
+            self._track_proxy_mode(value)
         if change == self.GraphicsItemChange.ItemSelectedChange and self.scene():
             self.reset_pipes()
             if value:
@@ -294,6 +333,7 @@ class NodeItem(AbstractNodeItem):
             self._width = NodeEnum.WIDTH.value
         if self._height < NodeEnum.HEIGHT.value:
             self._height = NodeEnum.HEIGHT.value
+        self._update_geometry_size()
 
     def _set_text_color(self, color):
         """
@@ -520,13 +560,13 @@ class NodeItem(AbstractNodeItem):
             widget_rect = widget.boundingRect()
             if not inputs:
                 x = rect.left() + 10
-                widget.widget().setTitleAlign('left')
+                widget.set_title_align('left')
             elif not outputs:
                 x = rect.right() - widget_rect.width() - 10
-                widget.widget().setTitleAlign('right')
+                widget.set_title_align('right')
             else:
                 x = rect.center().x() - (widget_rect.width() / 2)
-                widget.widget().setTitleAlign('center')
+                widget.set_title_align('center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
@@ -548,7 +588,7 @@ class NodeItem(AbstractNodeItem):
                 continue
             widget_rect = widget.boundingRect()
             x = rect.center().x() - (widget_rect.width() / 2)
-            widget.widget().setTitleAlign('center')
+            widget.set_title_align('center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
@@ -716,6 +756,9 @@ class NodeItem(AbstractNodeItem):
             self._draw_node_vertical()
         else:
             raise RuntimeError('Node graph layout direction not valid!')
+        # the node width may have crossed the proxy mode threshold.
+        self._track_proxy_mode(self.scene())
+        self.auto_switch_mode()
 
     def post_init(self, viewer=None, pos=None):
         """
@@ -732,21 +775,36 @@ class NodeItem(AbstractNodeItem):
         if pos:
             self.xy_pos = pos
 
-    def auto_switch_mode(self):
+    def _track_proxy_mode(self, scene):
+        """
+        Register the zoom scale the node switches to proxy mode at with the
+        scene so the viewer only updates the nodes crossing the threshold.
+
+        Args:
+            scene (NodeGraphQt.widgets.scene.NodeScene): node scene.
+        """
+        if hasattr(scene, 'track_proxy_node'):
+            switch_scale = self._proxy_mode_threshold / max(self._width, 1.0)
+            scene.track_proxy_node(self, switch_scale)
+
+    def auto_switch_mode(self, scale=None):
         """
         Decide whether to draw the node with proxy mode.
-        (this is called at the start in the "self.paint()" function.)
+        (this is called by the viewer when the zoom level changes.)
+
+        Args:
+            scale (float): viewer zoom scale (default: current viewer scale).
         """
         if ITEM_CACHE_MODE is QtWidgets.QGraphicsItem.ItemCoordinateCache:
             return
+        if scale is None:
+            viewer = self.viewer()
+            if viewer is None:
+                return
+            scale = viewer.transform().m11()
 
-        rect = self.sceneBoundingRect()
-        l = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topLeft()))
-        r = self.viewer().mapToGlobal(
-            self.viewer().mapFromScene(rect.topRight()))
         # width is the node width in screen
-        width = r.x() - l.x()
+        width = self._width * scale
 
         self.set_proxy_mode(width < self._proxy_mode_threshold)
 
@@ -769,7 +827,7 @@ class NodeItem(AbstractNodeItem):
 
         # node widget visibility.
         for w in self._widgets.values():
-            w.widget().setVisible(visible)
+            w.set_proxy_mode(mode)
 
         # port text is not visible in vertical layout.
         if self.layout_direction is LayoutDirectionEnum.VERTICAL.value:
@@ -790,6 +848,15 @@ class NodeItem(AbstractNodeItem):
         self._text_item.setVisible(visible)
         self._icon_item.setVisible(visible)
 
+    @property
+    def compute_status(self):
+        return self._compute_status
+
+    @compute_status.setter
+    def compute_status(self, status=None):
+        self._compute_status = status
+        self.update()
+
     @property
     def icon(self):
         return self._properties['icon']
@@ -820,6 +887,7 @@ class NodeItem(AbstractNodeItem):
         w, h = self.calc_size()
         width = width if width > w else w
         AbstractNodeItem.width.fset(self, width)
+        self._track_proxy_mode(self.scene())
 
     @AbstractNodeItem.height.setter
     def height(self, height=0.0):
@@ -832,7 +900,7 @@ class NodeItem(AbstractNodeItem):
     def disabled(self, state=False):
         AbstractNodeItem.disabled.fset(self, state)
         for n, w in self._widgets.items():
-            w.widget().setDisabled(state)
+            w.set_disabled(state)
         self._tooltip_disable(state)
         self._x_item.setVisible(state)
 
@@ -911,7 +979,7 @@ class NodeItem(AbstractNodeItem):
         Returns:
             PortItem: port qgraphics item.
         """
-        text = QtWidgets.QGraphicsTextItem(port.name, self)
+        text = StaticTextItem(port.name, self)
         text.font().setPointSize(8)
         text.setFont(text.font())
         text.setVisible(port.display_name)
@@ -984,7 +1052,7 @@ class NodeItem(AbstractNodeItem):
 
         Args:
             port (PortItem): port object.
-            text (QtWidgets.QGraphicsTextItem): port text object.
+            text (StaticTextItem): port text object.
         """
         port.setParentItem(None)
         text.setParentItem(None)
@@ -1017,7 +1085,7 @@ class NodeItem(AbstractNodeItem):
             port_item (PortItem): port item.
 
         Returns:
-            QGraphicsTextItem: graphic item used for the port text.
+            StaticTextItem: graphic item used for the port text.
         """
         return self._input_items[port_item]
 
@@ -1027,7 +1095,7 @@ class NodeItem(AbstractNodeItem):
             port_item (PortItem): port item.
 
         Returns:
-            QGraphicsTextItem: graphic item used for the port text.
+            StaticTextItem: graphic item used for the port text.
         """
         return self._output_items[port_item]
 
@@ -412,13 +412,13 @@ class CircleNodeItem(NodeItem):
             widget_rect = widget.boundingRect()
             if not inputs:
                 x = rect.left() + 10
-                widget.widget().setTitleAlign('left')
+                widget.set_title_align('left')
             elif not outputs:
                 x = rect.right() - widget_rect.width() - 10
-                widget.widget().setTitleAlign('right')
+                widget.set_title_align('right')
             else:
                 x = rect.center().x() - (widget_rect.width() / 2)
-                widget.widget().setTitleAlign('center')
+                widget.set_title_align('center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
@@ -436,7 +436,7 @@ class CircleNodeItem(NodeItem):
         for widget in self._widgets.values():
             widget_rect = widget.boundingRect()
             x = rect.center().x() - (widget_rect.width() / 2)
-            widget.widget().setTitleAlign('center')
+            widget.set_title_align('center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
@@ -24,10 +24,9 @@ class PortOutputNodeItem(NodeItem):
         width, height = self.calc_size(add_w, add_h)
         self._width = width + 60
         self._height = height if height >= 60 else 60
+        self._update_geometry_size()
 
     def _paint_horizontal(self, painter, option, widget):
-        self.auto_switch_mode()
-
         painter.save()
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(QtCore.Qt.NoPen)
@@ -86,8 +85,6 @@ class PortOutputNodeItem(NodeItem):
         painter.restore()
 
     def _paint_vertical(self, painter, option, widget):
-        self.auto_switch_mode()
-
         painter.save()
         painter.setBrush(QtCore.Qt.NoBrush)
         painter.setPen(QtCore.Qt.NoPen)
@@ -164,7 +161,7 @@ class PortOutputNodeItem(NodeItem):
 
         # node widget visibility.
         for w in self._widgets.values():
-            w.widget().setVisible(visible)
+            w.set_proxy_mode(mode)
 
         # input port text visibility.
         for port, text in self._input_items.items():
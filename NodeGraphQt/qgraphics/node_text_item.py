@@ -1,16 +1,176 @@
 from PySide6 import QtWidgets, QtCore, QtGui
 
+# shared static text layouts keyed by (text, font).
+_STATIC_TEXT_CACHE = {}
+_STATIC_TEXT_CACHE_LIMIT = 4096
 
-class NodeTextItem(QtWidgets.QGraphicsTextItem):
+
+def _static_text(text, font):
+    """
+    Returns a prepared static text layout shared by all the text items
+    displaying the same text with the same font.
+
+    Args:
+        text (str): plain text.
+        font (QtGui.QFont): text font.
+
+    Returns:
+        QtGui.QStaticText: static text.
+    """
+    key = (text, font.key())
+    static_text = _STATIC_TEXT_CACHE.get(key)
+    if static_text is None:
+        if len(_STATIC_TEXT_CACHE) >= _STATIC_TEXT_CACHE_LIMIT:
+            _STATIC_TEXT_CACHE.clear()
+        static_text = QtGui.QStaticText(text)
+        static_text.setTextFormat(QtCore.Qt.PlainText)
+        static_text.setPerformanceHint(QtGui.QStaticText.AggressiveCaching)
+        static_text.prepare(QtGui.QTransform(), font)
+        _STATIC_TEXT_CACHE[key] = static_text
+    return static_text
+
+
+class StaticTextItem(QtWidgets.QGraphicsItem):
+    """
+    Lightweight plain text item used for the node names and port labels.
+
+    The text is drawn from a ``QtGui.QStaticText`` layout shared between
+    items with the same text and font and has the same size and margin as a
+    ``QtWidgets.QGraphicsTextItem``.
+
+    Args:
+        text (str): plain text.
+        parent (QtWidgets.QGraphicsItem): parent item.
+    """
+
+    #: text margin (same as the QGraphicsTextItem document margin).
+    MARGIN = 4.0
+
+    def __init__(self, text='', parent=None):
+        super(StaticTextItem, self).__init__(parent)
+        self._text = text
+        self._font = QtGui.QFont()
+        self._color = QtGui.QColor(QtCore.Qt.black)
+        self._static_text = _static_text(text, self._font)
+
+    def boundingRect(self):
+        if not self._text:
+            return QtCore.QRectF()
+        size = self._static_text.size()
+        return QtCore.QRectF(0.0, 0.0,
+                             size.width() + (self.MARGIN * 2),
+                             size.height() + (self.MARGIN * 2))
+
+    def paint(self, painter, option, widget=None):
+        """
+        Draws the shared static text.
+
+        Args:
+            painter (QtGui.QPainter): painter used for drawing the item.
+            option (QtGui.QStyleOptionGraphicsItem):
+                used to describe the parameters needed to draw.
+            widget (QtWidgets.QWidget): not used.
+        """
+        if not self._text:
+            return
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        painter.drawStaticText(
+            QtCore.QPointF(self.MARGIN, self.MARGIN), self._static_text
+        )
+
+    def toPlainText(self):
+        return self._text
+
+    def setPlainText(self, text):
+        if text == self._text:
+            return
+        self.prepareGeometryChange()
+        self._text = text
+        self._static_text = _static_text(text, self._font)
+
+    def font(self):
+        return QtGui.QFont(self._font)
+
+    def setFont(self, font):
+        self.prepareGeometryChange()
+        self._font = QtGui.QFont(font)
+        self._static_text = _static_text(self._text, self._font)
+
+    def defaultTextColor(self):
+        return QtGui.QColor(self._color)
+
+    def setDefaultTextColor(self, color):
+        color = QtGui.QColor(color)
+        if color == self._color:
+            return
+        self._color = color
+        self.update()
+
+
+class _NodeTextEditor(QtWidgets.QGraphicsTextItem):
+    """
+    Editable text item created over the node name while it's being renamed.
+
+    Args:
+        text_item (NodeTextItem): node name text item.
+    """
+
+    def __init__(self, text_item):
+        super(_NodeTextEditor, self).__init__(text_item.toPlainText(),
+                                              text_item)
+        self.setFont(text_item.font())
+        self.setDefaultTextColor(text_item.defaultTextColor())
+        self.setTextInteractionFlags(
+            QtCore.Qt.TextEditable |
+            QtCore.Qt.TextSelectableByMouse |
+            QtCore.Qt.TextSelectableByKeyboard
+        )
+
+    def keyPressEvent(self, event):
+        """
+        Re-implemented to catch the Return & Escape keys.
+
+        Args:
+            event (QtGui.QKeyEvent): key event.
+        """
+        if event.key() == QtCore.Qt.Key_Return:
+            self.parentItem().finish_edit(True)
+            return
+        elif event.key() == QtCore.Qt.Key_Escape:
+            self.parentItem().finish_edit(False)
+            return
+        super(_NodeTextEditor, self).keyPressEvent(event)
+
+    def focusOutEvent(self, event):
+        """
+        Re-implemented to apply the new name when the editor loses focus.
+
+        Args:
+            event (QtGui.QFocusEvent):
+        """
+        super(_NodeTextEditor, self).focusOutEvent(event)
+        self.parentItem().finish_edit(True)
+
+
+class NodeTextItem(StaticTextItem):
     """
     NodeTextItem class used to display and edit the name of a NodeItem.
+
+    The name is drawn as static text and an editable text item is only
+    created while the name is edited.
     """
 
     def __init__(self, text, parent=None):
         super(NodeTextItem, self).__init__(text, parent)
         self._locked = False
+        self._editor = None
         self.set_locked(False)
-        self.set_editable(False)
+
+    def paint(self, painter, option, widget=None):
+        if self._editor is not None:
+            return
+        super(NodeTextItem, self).paint(painter, option, widget)
 
     def mouseDoubleClickEvent(self, event):
         """
@@ -26,54 +186,48 @@ class NodeTextItem(QtWidgets.QGraphicsTextItem):
                 return
         super(NodeTextItem, self).mouseDoubleClickEvent(event)
 
-    def keyPressEvent(self, event):
+    def set_editable(self, value=False):
         """
-        Re-implemented to catch the Return & Escape keys when in edit mode.
+        Set the edit mode for the text item.
 
         Args:
-            event (QtGui.QKeyEvent): key event.
+            value (bool):  true in edit mode.
         """
-        if event.key() == QtCore.Qt.Key_Return:
-            current_text = self.toPlainText()
-            self.set_node_name(current_text)
-            self.set_editable(False)
-        elif event.key() == QtCore.Qt.Key_Escape:
-            self.setPlainText(self.node.name)
-            self.set_editable(False)
-        super(NodeTextItem, self).keyPressEvent(event)
+        if self._locked:
+            return
+        if value:
+            if self._editor is None:
+                self._editor = _NodeTextEditor(self)
+                self.update()
+            self._editor.setFocus(QtCore.Qt.MouseFocusReason)
+        else:
+            self.finish_edit(False)
 
-    def focusOutEvent(self, event):
+    def is_editing(self):
         """
-        Re-implemented to jump out of edit mode.
+        Returns whether the node name is being edited.
 
-        Args:
-            event (QtGui.QFocusEvent):
+        Returns:
+            bool: true in edit mode.
         """
-        current_text = self.toPlainText()
-        self.set_node_name(current_text)
-        self.set_editable(False)
-        super(NodeTextItem, self).focusOutEvent(event)
+        return self._editor is not None
 
-    def set_editable(self, value=False):
+    def finish_edit(self, apply=True):
         """
-        Set the edit mode for the text item.
+        Remove the editable text item and update the node name.
 
         Args:
-            value (bool):  true in edit mode.
+            apply (bool): false to discard the edited name.
         """
-        if self._locked:
+        editor, self._editor = self._editor, None
+        if editor is None:
             return
-        if value:
-            self.setTextInteractionFlags(
-                QtCore.Qt.TextEditable |
-                QtCore.Qt.TextSelectableByMouse |
-                QtCore.Qt.TextSelectableByKeyboard
-            )
-        else:
-            self.setTextInteractionFlags(QtCore.Qt.NoTextInteraction)
-            cursor = self.textCursor()
-            cursor.clearSelection()
-            self.setTextCursor(cursor)
+        current_text = editor.toPlainText()
+        editor.setVisible(False)
+        editor.deleteLater()
+        self.update()
+        if apply:
+            self.set_node_name(current_text)
 
     def set_node_name(self, name):
         """
@@ -98,11 +252,10 @@ class NodeTextItem(QtWidgets.QGraphicsTextItem):
         """
         self._locked = state
         if self._locked:
-            self.setFlag(QtWidgets.QGraphicsItem.ItemIsFocusable, False)
+            self.finish_edit(False)
             self.setCursor(QtCore.Qt.ArrowCursor)
             self.setToolTip('')
         else:
-            self.setFlag(QtWidgets.QGraphicsItem.ItemIsFocusable, True)
             self.setToolTip('double-click to edit node name.')
             self.setCursor(QtCore.Qt.IBeamCursor)
 
@@ -13,6 +13,7 @@ from NodeGraphQt.constants import (
     Z_VAL_NODE_WIDGET
 )
 from NodeGraphQt.qgraphics.port import PortItem
+from NodeGraphQt.qgraphics.style_cache import cached_brush, cached_pen
 
 PIPE_STYLES = {
     PipeEnum.DRAW_TYPE_DEFAULT.value: QtCore.Qt.SolidLine,
@@ -91,12 +92,14 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
         """
         painter.save()
 
-        pen = self.pen()
-        if self.disabled():
-            if not self._active:
-                pen.setColor(QtGui.QColor(*PipeEnum.DISABLED_COLOR.value))
-                pen.setStyle(PIPE_STYLES.get(PipeEnum.DRAW_TYPE_DOTTED.value))
-                pen.setWidth(3)
+        if self.disabled() and not self._active:
+            pen = cached_pen(
+                PipeEnum.DISABLED_COLOR.value, 3,
+                PIPE_STYLES.get(PipeEnum.DRAW_TYPE_DOTTED.value),
+                QtCore.Qt.RoundCap, QtCore.Qt.MiterJoin
+            )
+        else:
+            pen = self.pen()
 
         painter.setPen(pen)
         painter.setBrush(self.brush())
@@ -122,11 +125,13 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
 
         if self.disabled():
             if not (self._active or self._highlight):
-                color = QtGui.QColor(*PipeEnum.DISABLED_COLOR.value)
-                pen = self._dir_pointer.pen()
-                pen.setColor(color)
-                self._dir_pointer.setPen(pen)
-                self._dir_pointer.setBrush(color.darker(200))
+                color = PipeEnum.DISABLED_COLOR.value
+                width = self._dir_pointer.pen().width()
+                self._dir_pointer.setPen(cached_pen(
+                    color, width, cap=QtCore.Qt.RoundCap,
+                    join=QtCore.Qt.MiterJoin
+                ))
+                self._dir_pointer.setBrush(cached_brush(color, 200))
 
         self._dir_pointer.setVisible(True)
         loc_pt = self.path().pointAtPercent(0.49)
@@ -423,22 +428,14 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
             width (int): pipe width.
             style (int): pipe style.
         """
-        pen = self.pen()
-        pen.setWidth(width)
-        pen.setColor(QtGui.QColor(*color))
-        pen.setStyle(PIPE_STYLES.get(style))
-        pen.setJoinStyle(QtCore.Qt.MiterJoin)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        self.setPen(pen)
+        self.setPen(cached_pen(color, width, PIPE_STYLES.get(style),
+                               QtCore.Qt.RoundCap, QtCore.Qt.MiterJoin))
         self.setBrush(QtGui.QBrush(QtCore.Qt.NoBrush))
 
-        pen = self._dir_pointer.pen()
-        pen.setJoinStyle(QtCore.Qt.MiterJoin)
-        pen.setCapStyle(QtCore.Qt.RoundCap)
-        pen.setWidth(width)
-        pen.setColor(QtGui.QColor(*color))
-        self._dir_pointer.setPen(pen)
-        self._dir_pointer.setBrush(QtGui.QColor(*color).darker(200))
+        self._dir_pointer.setPen(cached_pen(
+            color, width, cap=QtCore.Qt.RoundCap, join=QtCore.Qt.MiterJoin
+        ))
+        self._dir_pointer.setBrush(cached_brush(color, 200))
 
     def activate(self):
         self._active = True
@@ -632,14 +629,15 @@ class LivePipeItem(PipeItem):
 
         self._idx_pointer.setPolygon(transform.map(self._poly))
 
-        pen_color = QtGui.QColor(*PipeEnum.HIGHLIGHT_COLOR.value)
+        pen_color = PipeEnum.HIGHLIGHT_COLOR.value
         if isinstance(color, (list, tuple)):
-            pen_color = QtGui.QColor(*color)
+            pen_color = color
 
-        pen = self._idx_pointer.pen()
-        pen.setColor(pen_color)
-        self._idx_pointer.setBrush(pen_color.darker(300))
-        self._idx_pointer.setPen(pen)
+        self._idx_pointer.setBrush(cached_brush(pen_color, 300))
+        self._idx_pointer.setPen(cached_pen(
+            pen_color, self._idx_pointer.pen().width(),
+            join=QtCore.Qt.MiterJoin
+        ))
 
 
 class LivePipePolygonItem(QtWidgets.QGraphicsPolygonItem):
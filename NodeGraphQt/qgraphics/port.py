@@ -1,10 +1,19 @@
 #!/usr/bin/python
-from PySide6 import QtGui, QtCore, QtWidgets
+from PySide6 import QtCore, QtWidgets
 
 from NodeGraphQt.constants import (
     PortTypeEnum, PortEnum,
     Z_VAL_PORT,
     ITEM_CACHE_MODE)
+from NodeGraphQt.qgraphics.style_cache import (
+    PORT_GLYPH,
+    PORT_GLYPH_CONNECTED,
+    PORT_GLYPH_HOVER,
+    PORT_GLYPH_HOVER_MULTI,
+    cached_brush,
+    cached_pen,
+    cached_port_path
+)
 
 
 class PortItem(QtWidgets.QGraphicsItem):
@@ -63,59 +72,43 @@ class PortItem(QtWidgets.QGraphicsItem):
         # painter.drawRect(self.boundingRect())
         # ----------------------------------------------------------------------
 
-        rect_w = self._width / 1.8
-        rect_h = self._height / 1.8
-        rect_x = self.boundingRect().center().x() - (rect_w / 2)
-        rect_y = self.boundingRect().center().y() - (rect_h / 2)
-        port_rect = QtCore.QRectF(rect_x, rect_y, rect_w, rect_h)
-
         if self._hovered:
-            color = QtGui.QColor(*PortEnum.HOVER_COLOR.value)
-            border_color = QtGui.QColor(*PortEnum.HOVER_BORDER_COLOR.value)
+            color = PortEnum.HOVER_COLOR.value
+            border_color = PortEnum.HOVER_BORDER_COLOR.value
         elif self.connected_pipes:
-            color = QtGui.QColor(*PortEnum.ACTIVE_COLOR.value)
-            border_color = QtGui.QColor(*PortEnum.ACTIVE_BORDER_COLOR.value)
+            color = PortEnum.ACTIVE_COLOR.value
+            border_color = PortEnum.ACTIVE_BORDER_COLOR.value
         else:
-            color = QtGui.QColor(*self.color)
-            border_color = QtGui.QColor(*self.border_color)
+            color = self.color
+            border_color = self.border_color
 
-        pen = QtGui.QPen(border_color, 1.8)
-        painter.setPen(pen)
-        painter.setBrush(color)
-        painter.drawEllipse(port_rect)
+        painter.setPen(cached_pen(border_color, 1.8))
+        painter.setBrush(cached_brush(color))
+        painter.drawPath(
+            cached_port_path(PORT_GLYPH, self._width, self._height))
 
         if self.connected_pipes and not self._hovered:
-            painter.setBrush(border_color)
-            w = port_rect.width() / 2.5
-            h = port_rect.height() / 2.5
-            rect = QtCore.QRectF(port_rect.center().x() - w / 2,
-                                 port_rect.center().y() - h / 2,
-                                 w, h)
-            border_color = QtGui.QColor(*self.border_color)
-            pen = QtGui.QPen(border_color, 1.6)
-            painter.setPen(pen)
-            painter.setBrush(border_color)
-            painter.drawEllipse(rect)
+            painter.setPen(cached_pen(self.border_color, 1.6))
+            painter.setBrush(cached_brush(self.border_color))
+            painter.drawPath(cached_port_path(
+                PORT_GLYPH_CONNECTED, self._width, self._height))
         elif self._hovered:
             if self.multi_connection:
-                pen = QtGui.QPen(border_color, 1.4)
-                painter.setPen(pen)
-                painter.setBrush(color)
-                w = port_rect.width() / 1.8
-                h = port_rect.height() / 1.8
+                painter.setPen(cached_pen(border_color, 1.4))
+                painter.setBrush(cached_brush(color))
+                glyph = PORT_GLYPH_HOVER_MULTI
             else:
-                painter.setBrush(border_color)
-                w = port_rect.width() / 3.5
-                h = port_rect.height() / 3.5
-            rect = QtCore.QRectF(port_rect.center().x() - w / 2,
-                                 port_rect.center().y() - h / 2,
-                                 w, h)
-            painter.drawEllipse(rect)
+                painter.setBrush(cached_brush(border_color))
+                glyph = PORT_GLYPH_HOVER
+            painter.drawPath(
+                cached_port_path(glyph, self._width, self._height))
         painter.restore()
 
     def itemChange(self, change, value):
         if change == self.GraphicsItemChange.ItemScenePositionHasChanged:
-            self.redraw_connected_pipes()
+            scene = self.scene()
+            if not (scene and scene.defer_pipe_update(self.connected_pipes)):
+                self.redraw_connected_pipes()
         return super(PortItem, self).itemChange(change, value)
 
     def mousePressEvent(self, event):
@@ -4,6 +4,15 @@ import math
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from NodeGraphQt.constants import Z_VAL_NODE_WIDGET, PipeSlicerEnum
+from NodeGraphQt.qgraphics.style_cache import cached_brush, cached_pen
+
+# slicer arrow head pointing up.
+_ARROW_SIZE = 4.0
+_ARROW = QtGui.QPolygonF([
+    QtCore.QPointF(-_ARROW_SIZE, _ARROW_SIZE),
+    QtCore.QPointF(0.0, -_ARROW_SIZE * 0.9),
+    QtCore.QPointF(_ARROW_SIZE, _ARROW_SIZE)
+])
 
 
 class SlicerPipeItem(QtWidgets.QGraphicsPathItem):
@@ -25,12 +34,12 @@ class SlicerPipeItem(QtWidgets.QGraphicsPathItem):
                 used to describe the parameters needed to draw.
             widget (QtWidgets.QWidget): not used.
         """
-        color = QtGui.QColor(*PipeSlicerEnum.COLOR.value)
+        color = PipeSlicerEnum.COLOR.value
+        width = PipeSlicerEnum.WIDTH.value
         p1 = self.path().pointAtPercent(0)
         p2 = self.path().pointAtPercent(1)
         size = 6.0
         offset = size / 2
-        arrow_size = 4.0
 
         painter.save()
         painter.setRenderHint(painter.RenderHint.Antialiasing, True)
@@ -42,34 +51,21 @@ class SlicerPipeItem(QtWidgets.QGraphicsPathItem):
         text_x = painter.fontMetrics().horizontalAdvance(text) / 2
         text_y = painter.fontMetrics().height() / 1.5
         text_pos = QtCore.QPointF(p1.x() - text_x, p1.y() - text_y)
-        text_color = QtGui.QColor(*PipeSlicerEnum.COLOR.value)
-        text_color.setAlpha(80)
-        painter.setPen(QtGui.QPen(
-            text_color, PipeSlicerEnum.WIDTH.value, QtCore.Qt.PenStyle.SolidLine
-        ))
+        text_color = tuple(color[:3]) + (80,)
+        painter.setPen(cached_pen(text_color, width))
         painter.drawText(text_pos, text)
 
-        painter.setPen(QtGui.QPen(
-            color, PipeSlicerEnum.WIDTH.value, QtCore.Qt.PenStyle.DashDotLine
-        ))
+        painter.setPen(cached_pen(color, width, QtCore.Qt.PenStyle.DashDotLine))
         painter.drawPath(self.path())
 
-        pen = QtGui.QPen(
-            color, PipeSlicerEnum.WIDTH.value, QtCore.Qt.PenStyle.SolidLine
-        )
-        pen.setCapStyle(QtCore.Qt.PenCapStyle.RoundCap)
-        pen.setJoinStyle(QtCore.Qt.PenJoinStyle.MiterJoin)
-        painter.setPen(pen)
-        painter.setBrush(color)
+        painter.setPen(cached_pen(color, width,
+                                  cap=QtCore.Qt.PenCapStyle.RoundCap,
+                                  join=QtCore.Qt.PenJoinStyle.MiterJoin))
+        painter.setBrush(cached_brush(color))
 
         rect = QtCore.QRectF(p1.x() - offset, p1.y() - offset, size, size)
         painter.drawEllipse(rect)
 
-        arrow = QtGui.QPolygonF()
-        arrow.append(QtCore.QPointF(-arrow_size, arrow_size))
-        arrow.append(QtCore.QPointF(0.0, -arrow_size * 0.9))
-        arrow.append(QtCore.QPointF(arrow_size, arrow_size))
-
         transform = QtGui.QTransform()
         transform.translate(p2.x(), p2.y())
         radians = math.atan2(p2.y() - p1.y(),
@@ -77,7 +73,7 @@ class SlicerPipeItem(QtWidgets.QGraphicsPathItem):
         degrees = math.degrees(radians) - 90
         transform.rotate(degrees)
 
-        painter.drawPolygon(transform.map(arrow))
+        painter.drawPolygon(transform.map(_ARROW))
         painter.restore()
 
     def draw_path(self, p1, p2):
@@ -0,0 +1,119 @@
+#!/usr/bin/python
+from PySide6 import QtCore, QtGui
+
+from NodeGraphQt.constants import PortEnum
+
+# shared pens, brushes and paths used to paint the port and pipe items so
+# they're not rebuilt for every item on every paint. entries are keyed by the
+# style values (color, width, pen style...) so they never go stale.
+
+# max number of entries before the caches are reset.
+_CACHE_LIMIT = 1024
+
+_PENS = {}
+_BRUSHES = {}
+_PORT_PATHS = {}
+
+#: port glyph drawn for the port body.
+PORT_GLYPH = 'port'
+#: port glyph drawn in the center of a connected port.
+PORT_GLYPH_CONNECTED = 'connected'
+#: port glyph drawn in the center of a hovered multi connection port.
+PORT_GLYPH_HOVER_MULTI = 'hover_multi'
+#: port glyph drawn in the center of a hovered single connection port.
+PORT_GLYPH_HOVER = 'hover'
+
+_PORT_GLYPH_SCALE = {
+    PORT_GLYPH: 1.0,
+    PORT_GLYPH_CONNECTED: 2.5,
+    PORT_GLYPH_HOVER_MULTI: 1.8,
+    PORT_GLYPH_HOVER: 3.5,
+}
+
+
+def _cache_insert(cache, key, value):
+    if len(cache) >= _CACHE_LIMIT:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def cached_pen(color, width=1.0, style=QtCore.Qt.SolidLine,
+               cap=QtCore.Qt.SquareCap, join=QtCore.Qt.BevelJoin):
+    """
+    Returns a shared pen.
+
+    Args:
+        color (tuple): color value in (r, g, b, a).
+        width (float): pen width.
+        style (QtCore.Qt.PenStyle): pen style.
+        cap (QtCore.Qt.PenCapStyle): pen cap style.
+        join (QtCore.Qt.PenJoinStyle): pen join style.
+
+    Returns:
+        QtGui.QPen: pen (don't modify the returned pen).
+    """
+    key = (tuple(color), width, style, cap, join)
+    pen = _PENS.get(key)
+    if pen is None:
+        pen = QtGui.QPen(QtGui.QColor(*color), width, style, cap, join)
+        _cache_insert(_PENS, key, pen)
+    return pen
+
+
+def cached_brush(color, darker=100):
+    """
+    Returns a shared solid brush.
+
+    Args:
+        color (tuple): color value in (r, g, b, a).
+        darker (int): darker factor applied to the color (100 is unchanged).
+
+    Returns:
+        QtGui.QBrush: brush (don't modify the returned brush).
+    """
+    key = (tuple(color), darker)
+    brush = _BRUSHES.get(key)
+    if brush is None:
+        brush_color = QtGui.QColor(*color)
+        if darker != 100:
+            brush_color = brush_color.darker(darker)
+        brush = _cache_insert(_BRUSHES, key, QtGui.QBrush(brush_color))
+    return brush
+
+
+def cached_port_path(glyph, width, height):
+    """
+    Returns the shared ellipse path for a port glyph.
+
+    Args:
+        glyph (str): port glyph (see the ``PORT_GLYPH*`` constants).
+        width (float): port width.
+        height (float): port height.
+
+    Returns:
+        QtGui.QPainterPath: port glyph path in port item coordinates.
+    """
+    key = (glyph, width, height)
+    path = _PORT_PATHS.get(key)
+    if path is None:
+        rect_w = width / 1.8
+        rect_h = height / 1.8
+        cen_x = (width + PortEnum.CLICK_FALLOFF.value) / 2
+        cen_y = height / 2
+        scale = _PORT_GLYPH_SCALE[glyph]
+        w = rect_w / scale
+        h = rect_h / scale
+        path = QtGui.QPainterPath()
+        path.addEllipse(QtCore.QRectF(cen_x - w / 2, cen_y - h / 2, w, h))
+        _cache_insert(_PORT_PATHS, key, path)
+    return path
+
+
+def clear_style_cache():
+    """
+    Clears the shared pens, brushes and paths.
+    """
+    _PENS.clear()
+    _BRUSHES.clear()
+    _PORT_PATHS.clear()
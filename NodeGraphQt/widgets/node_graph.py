@@ -62,7 +62,7 @@ class NodeGraphWidget(QtWidgets.QTabWidget):
     def add_viewer(self, viewer, name, node_id):
         self.addTab(viewer, name)
         index = self.indexOf(viewer)
-        self.setTabToolTip(index, node_id)
+        self.setTabToolTip(index, str(node_id))
         self.setCurrentIndex(index)
 
     def remove_viewer(self, viewer):
@@ -101,13 +101,18 @@ class SubGraphWidget(QtWidgets.QWidget):
         self._viewer_current = viewer
         self._viewer_current.show()
 
-    def remove_viewer(self, viewer=None):
+    def remove_viewer(self, viewer=None, delete=True):
         if viewer is None and self._viewer_current:
             viewer = self._viewer_current
         node_id = self._viewer_widgets.pop(viewer)
         self._navigator.remove_label_item(node_id)
         self._layout.removeWidget(viewer)
-        viewer.deleteLater()
+        if viewer == self._viewer_current:
+            self._viewer_current = None
+        if delete:
+            viewer.deleteLater()
+        else:
+            viewer.hide()
 
     def hide_viewer(self, viewer):
         self._layout.removeWidget(viewer)
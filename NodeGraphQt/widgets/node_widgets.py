@@ -1,7 +1,11 @@
 #!/usr/bin/python
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
-from NodeGraphQt.constants import ViewerEnum, Z_VAL_NODE_WIDGET
+from NodeGraphQt.constants import (
+    ViewerEnum,
+    NODE_WIDGET_POOL_LIMIT,
+    Z_VAL_NODE_WIDGET
+)
 from NodeGraphQt.errors import NodeWidgetError
 
 
@@ -11,6 +15,7 @@ class _NodeGroupBox(QtWidgets.QGroupBox):
         super(_NodeGroupBox, self).__init__(parent)
         layout = QtWidgets.QVBoxLayout(self)
         layout.setSpacing(1)
+        self._title_style = None
         self.setTitle(label)
 
     def setTitle(self, text):
@@ -19,6 +24,11 @@ class _NodeGroupBox(QtWidgets.QGroupBox):
         super(_NodeGroupBox, self).setTitle(text)
 
     def setTitleAlign(self, align='center'):
+        # the style sheet only depends on the alignment and title visibility.
+        title_style = (align, bool(self.title()))
+        if title_style == self._title_style:
+            return
+        self._title_style = title_style
         text_color = tuple(map(lambda i, j: i - j, (255, 255, 255),
                                ViewerEnum.BACKGROUND_COLOR.value))
         style_dict = {
@@ -67,6 +77,56 @@ class _NodeGroupBox(QtWidgets.QGroupBox):
         return self.layout().itemAt(0).widget()
 
 
+class _NodeWidgetPool(object):
+    """
+    Pool of idle embedded widgets shared by the virtualized node widgets
+    so only the hovered or edited node widgets hold a real ``QWidget``.
+
+    Args:
+        limit (int): max number of idle widgets kept per node widget type.
+    """
+
+    def __init__(self, limit=NODE_WIDGET_POOL_LIMIT):
+        self._limit = limit
+        self._idle = {}
+
+    def acquire(self, widget_cls):
+        """
+        Returns an idle group widget for the node widget type or creates
+        a new one.
+
+        Args:
+            widget_cls (type): node widget class.
+
+        Returns:
+            _NodeGroupBox: group widget with the nested custom widget.
+        """
+        idle = self._idle.get(widget_cls)
+        if idle:
+            return idle.pop()
+        return widget_cls._create_group()
+
+    def release(self, widget_cls, group):
+        """
+        Returns the group widget to the pool once it's no longer embedded.
+
+        Args:
+            widget_cls (type): node widget class.
+            group (_NodeGroupBox): group widget.
+        """
+        idle = self._idle.setdefault(widget_cls, [])
+        if len(idle) < self._limit:
+            idle.append(group)
+        else:
+            group.deleteLater()
+
+
+_WIDGET_POOL = _NodeWidgetPool()
+
+# embedded widget sizes for each node widget configuration.
+_WIDGET_SIZES = {}
+
+
 class NodeBaseWidget(QtWidgets.QGraphicsProxyWidget):
     """
     This is the main wrapper class that allows a ``QtWidgets.QWidget`` to be
@@ -92,12 +152,308 @@ class NodeBaseWidget(QtWidgets.QGraphicsProxyWidget):
     :emits: property name, propety value
     """
 
+    #: render the embedded widget as a cached pixmap and only embed a real
+    #: widget from a shared pool while the node widget is hovered or edited.
+    virtualized = False
+
     def __init__(self, parent=None, name=None, label=''):
         super(NodeBaseWidget, self).__init__(parent)
         self.setZValue(Z_VAL_NODE_WIDGET)
         self._name = name
         self._label = label
         self._node = None
+        self._title_align = 'center'
+        self._disabled = False
+        self._proxy_mode = False
+        self._pinned = False
+        if self.virtualized:
+            self.setAcceptHoverEvents(True)
+
+    def paint(self, painter, option, widget=None):
+        if self.widget() is None:
+            if self.virtualized and not self._proxy_mode:
+                self._paint_pixmap(painter)
+            return
+        super(NodeBaseWidget, self).paint(painter, option, widget)
+
+    def hoverEnterEvent(self, event):
+        if self.virtualized and not self._proxy_mode:
+            self.realize()
+        super(NodeBaseWidget, self).hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        super(NodeBaseWidget, self).hoverLeaveEvent(event)
+        if self.virtualized:
+            QtCore.QTimer.singleShot(0, self, self._release_idle)
+
+    def mousePressEvent(self, event):
+        if self.virtualized and not self._proxy_mode:
+            self.realize()
+        super(NodeBaseWidget, self).mousePressEvent(event)
+
+    def focusOutEvent(self, event):
+        super(NodeBaseWidget, self).focusOutEvent(event)
+        if self.virtualized:
+            QtCore.QTimer.singleShot(0, self, self._release_idle)
+
+    @classmethod
+    def _create_group(cls):
+        """
+        Creates a new group widget with the nested custom widget for the
+        widget pool.
+
+        Returns:
+            _NodeGroupBox: group widget.
+        """
+        group = _NodeGroupBox('')
+        group.add_node_widget(cls._create_custom_widget())
+        return group
+
+    @classmethod
+    def _create_custom_widget(cls):
+        """
+        Creates the custom widget nested in the pooled group widgets.
+
+        You must re-implement this function if the widget is virtualized.
+
+        Returns:
+            QtWidgets.QWidget: new custom widget.
+        """
+        raise NotImplementedError
+
+    def _connect_custom_widget(self, widget):
+        """
+        Connect the custom widget signals when it's embedded in this widget.
+
+        Args:
+            widget (QtWidgets.QWidget): pooled custom widget.
+        """
+        return
+
+    def _disconnect_custom_widget(self, widget):
+        """
+        Disconnect the custom widget signals before it's returned to the pool.
+
+        Args:
+            widget (QtWidgets.QWidget): pooled custom widget.
+        """
+        return
+
+    def _apply_state(self, widget):
+        """
+        Sets the stored widget state on a pooled custom widget.
+
+        Args:
+            widget (QtWidgets.QWidget): pooled custom widget.
+        """
+        return
+
+    def _store_state(self, widget):
+        """
+        Stores the state from the custom widget before it's returned to
+        the pool.
+
+        Args:
+            widget (QtWidgets.QWidget): pooled custom widget.
+        """
+        return
+
+    def _size_key(self):
+        """
+        Returns the widget state that affects the widget size.
+
+        Returns:
+            tuple: hashable state.
+        """
+        return ()
+
+    def _state_key(self):
+        """
+        Returns the widget state displayed in the cached pixmap.
+
+        Returns:
+            tuple: hashable state.
+        """
+        return ()
+
+    def _custom_widget(self):
+        """
+        Returns the custom widget currently embedded in this widget.
+
+        Returns:
+            QtWidgets.QWidget: custom widget or None if not embedded.
+        """
+        group = self.widget()
+        if group is None:
+            return
+        return group.get_node_widget()
+
+    def _acquire_group(self):
+        group = _WIDGET_POOL.acquire(self.__class__)
+        group.setTitle(self._label)
+        group.setTitleAlign(self._title_align)
+        group.setDisabled(self._disabled)
+        self._apply_state(group.get_node_widget())
+        group.adjustSize()
+        return group
+
+    def _update_size(self):
+        """
+        Resize the widget to the size of the embedded widget while it's
+        drawn from the cached pixmap.
+        """
+        if not self.virtualized or self.widget() is not None:
+            return
+        key = (self.__class__, self._label, self._title_align,
+               self._size_key())
+        size = _WIDGET_SIZES.get(key)
+        if size is None:
+            group = self._acquire_group()
+            size = QtCore.QSizeF(group.size())
+            _WIDGET_POOL.release(self.__class__, group)
+            _WIDGET_SIZES[key] = size
+        self.resize(size)
+        self.update()
+
+    def _paint_pixmap(self, painter):
+        # render at the zoom level rounded up to 1x, 2x or 4x.
+        scale = painter.worldTransform().m11()
+        scale *= painter.device().devicePixelRatioF()
+        ratio = 1 if scale <= 1.0 else 2 if scale <= 2.0 else 4
+        size = self.size().toSize()
+        key = 'nodegraphqt-widget:{}'.format((
+            self.__class__.__name__, self._label, self._title_align,
+            self._disabled, self._state_key(),
+            size.width(), size.height(), ratio
+        ))
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None:
+            group = self._acquire_group()
+            group.resize(size)
+            pixmap = QtGui.QPixmap(size * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(QtCore.Qt.transparent)
+            group.render(pixmap, QtCore.QPoint(), QtGui.QRegion(),
+                         QtWidgets.QWidget.DrawChildren)
+            _WIDGET_POOL.release(self.__class__, group)
+            QtGui.QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(QtCore.QPointF(0.0, 0.0), pixmap)
+
+    def _release_idle(self):
+        group = self.widget()
+        if group is None or self.isUnderMouse() or self.hasFocus():
+            return
+        if self._is_editing(group.get_node_widget()):
+            return
+        self.release()
+
+    def _is_editing(self, widget):
+        """
+        Returns whether the custom widget is still being edited outside of
+        the node widget bounds (eg. an open popup).
+
+        Args:
+            widget (QtWidgets.QWidget): embedded custom widget.
+
+        Returns:
+            bool: true if being edited.
+        """
+        return False
+
+    def is_realized(self):
+        """
+        Returns whether a real ``QWidget`` is embedded in this node widget.
+
+        Returns:
+            bool: true if embedded.
+        """
+        return self.widget() is not None
+
+    def realize(self, pin=False):
+        """
+        Embed a widget from the widget pool into this node widget.
+        (this is called when a virtualized widget is hovered or clicked.)
+
+        Args:
+            pin (bool): keep the widget embedded until the node is deleted.
+
+        Returns:
+            QtWidgets.QWidget: embedded group widget.
+        """
+        if pin:
+            self._pinned = True
+        group = self.widget()
+        if group is not None:
+            return group
+        visible = self.isVisibleTo(self.parentItem())
+        group = self._acquire_group()
+        self._connect_custom_widget(group.get_node_widget())
+        self.setWidget(group)
+        group.setVisible(visible and not self._proxy_mode)
+        return group
+
+    def release(self):
+        """
+        Return the embedded widget to the widget pool and draw this node
+        widget from the cached pixmap.
+        """
+        if not self.virtualized or self._pinned:
+            return
+        group = self.widget()
+        if group is None:
+            return
+        widget = group.get_node_widget()
+        self._disconnect_custom_widget(widget)
+        self._store_state(widget)
+
+        # hide before removing so the group isn't shown as a window.
+        visible = self.isVisibleTo(self.parentItem())
+        group.hide()
+        self.setWidget(None)
+        _WIDGET_POOL.release(self.__class__, group)
+        self.setVisible(visible)
+        self._update_size()
+
+    def set_title_align(self, align='center'):
+        """
+        Sets the alignment of the label text above the embedded widget.
+
+        Args:
+            align (str): "left", "right" or "center".
+        """
+        self._title_align = align
+        group = self.widget()
+        if group is not None:
+            group.setTitleAlign(align)
+        self._update_size()
+
+    def set_disabled(self, state=False):
+        """
+        Sets the disabled state of the embedded widget.
+
+        Args:
+            state (bool): true to disable.
+        """
+        self._disabled = state
+        group = self.widget()
+        if group is not None:
+            group.setDisabled(state)
+        self.update()
+
+    def set_proxy_mode(self, mode):
+        """
+        Set whether the node widget is drawn while the node is in proxy mode.
+
+        Args:
+            mode (bool): true to hide the embedded widget.
+        """
+        self._proxy_mode = mode
+        if mode:
+            self.release()
+        group = self.widget()
+        if group is not None:
+            group.setVisible(not mode)
+        self.update()
 
     def setToolTip(self, tooltip):
         tooltip = tooltip.replace('\n', '<br/>')
@@ -204,11 +560,15 @@ class NodeBaseWidget(QtWidgets.QGraphicsProxyWidget):
         """
         Returns the embedded QWidget used in the node.
 
+        Note:
+            A virtualized widget is embedded and kept embedded from here on.
+
         Returns:
             QtWidgets.QWidget: nested QWidget
         """
-        widget = self.widget()
-        return widget.get_node_widget()
+        if self.virtualized:
+            self.realize(pin=True)
+        return self.widget().get_node_widget()
 
     def set_custom_widget(self, widget):
         """
@@ -221,6 +581,7 @@ class NodeBaseWidget(QtWidgets.QGraphicsProxyWidget):
             raise NodeWidgetError('Custom node widget already set.')
         group = _NodeGroupBox(self._label)
         group.add_node_widget(widget)
+        self._pinned = True
         self.setWidget(group)
 
     def get_label(self):
@@ -242,6 +603,7 @@ class NodeBaseWidget(QtWidgets.QGraphicsProxyWidget):
         if self.widget():
             self.widget().setTitle(label)
         self._label = label
+        self._update_size()
 
 
 class NodeComboBox(NodeBaseWidget):
@@ -256,15 +618,61 @@ class NodeComboBox(NodeBaseWidget):
         :meth:`NodeGraphQt.BaseNode.add_combo_menu`
     """
 
+    virtualized = True
+
     def __init__(self, parent=None, name='', label='', items=None):
         super(NodeComboBox, self).__init__(parent, name, label)
         self.setZValue(Z_VAL_NODE_WIDGET + 1)
+        self._items = list(items or [])
+        self._index = 0 if self._items else -1
+        self._update_size()
+
+    @classmethod
+    def _create_custom_widget(cls):
         combo = QtWidgets.QComboBox()
         combo.setMinimumHeight(24)
-        combo.addItems(items or [])
-        combo.currentIndexChanged.connect(self.on_value_changed)
         combo.clearFocus()
-        self.set_custom_widget(combo)
+        return combo
+
+    def _connect_custom_widget(self, combo):
+        combo.currentIndexChanged.connect(self.on_value_changed)
+
+    def _disconnect_custom_widget(self, combo):
+        combo.currentIndexChanged.disconnect(self.on_value_changed)
+
+    def _apply_state(self, combo):
+        combo.clear()
+        combo.addItems(self._items)
+        combo.setCurrentIndex(self._index)
+
+    def _store_state(self, combo):
+        self._items = [combo.itemText(i) for i in range(combo.count())]
+        self._index = combo.currentIndex()
+
+    def _size_key(self):
+        return tuple(self._items)
+
+    def _state_key(self):
+        return self.get_value(),
+
+    def _is_editing(self, combo):
+        return combo.view().isVisible()
+
+    def _set_items(self, items, reset=True):
+        """
+        Sets the menu items while the widget is drawn from the cached pixmap.
+
+        Args:
+            items (list[str]): menu items.
+            reset (bool): select the first item.
+        """
+        value = self.get_value()
+        self._items = list(items)
+        if reset or self._index < 0:
+            self._index = 0 if self._items else -1
+        self._update_size()
+        if self.get_value() != value:
+            self.on_value_changed()
 
     @property
     def type_(self):
@@ -277,11 +685,26 @@ class NodeComboBox(NodeBaseWidget):
         Returns:
             str: current text.
         """
-        combo_widget = self.get_custom_widget()
-        return str(combo_widget.currentText())
+        combo_widget = self._custom_widget()
+        if combo_widget is not None:
+            return str(combo_widget.currentText())
+        if 0 <= self._index < len(self._items):
+            return self._items[self._index]
+        return ''
 
     def set_value(self, text=''):
-        combo_widget = self.get_custom_widget()
+        combo_widget = self._custom_widget()
+        if combo_widget is None:
+            if type(text) is list:
+                self._set_items(text)
+            elif text != self.get_value():
+                if text in self._items:
+                    self._index = self._items.index(text)
+                else:
+                    self._index = -1
+                self.update()
+                self.on_value_changed()
+            return
         if type(text) is list:
             combo_widget.clear()
             combo_widget.addItems(text)
@@ -291,26 +714,40 @@ class NodeComboBox(NodeBaseWidget):
             combo_widget.setCurrentIndex(index)
 
     def add_item(self, item):
-        combo_widget = self.get_custom_widget()
+        combo_widget = self._custom_widget()
+        if combo_widget is None:
+            self._set_items(self._items + [item], reset=False)
+            return
         combo_widget.addItem(item)
 
     def add_items(self, items=None):
         if items:
-            combo_widget = self.get_custom_widget()
+            combo_widget = self._custom_widget()
+            if combo_widget is None:
+                self._set_items(self._items + list(items), reset=False)
+                return
             combo_widget.addItems(items)
 
     def all_items(self):
-        combo_widget = self.get_custom_widget()
+        combo_widget = self._custom_widget()
+        if combo_widget is None:
+            return list(self._items)
         return [combo_widget.itemText(i) for i in range(combo_widget.count())]
 
     def sort_items(self, reversed=False):
         items = sorted(self.all_items(), reverse=reversed)
-        combo_widget = self.get_custom_widget()
+        combo_widget = self._custom_widget()
+        if combo_widget is None:
+            self._set_items(items)
+            return
         combo_widget.clear()
         combo_widget.addItems(items)
 
     def clear(self):
-        combo_widget = self.get_custom_widget()
+        combo_widget = self._custom_widget()
+        if combo_widget is None:
+            self._set_items([])
+            return
         combo_widget.clear()
 
 
@@ -326,8 +763,22 @@ class NodeLineEdit(NodeBaseWidget):
         :meth:`NodeGraphQt.BaseNode.add_text_input`
     """
 
+    virtualized = True
+
     def __init__(self, parent=None, name='', label='', text='', placeholder_text=''):
         super(NodeLineEdit, self).__init__(parent, name, label)
+        self._text = text
+        self._placeholder_text = placeholder_text
+        self._update_size()
+
+    @classmethod
+    def _create_group(cls):
+        group = super(NodeLineEdit, cls)._create_group()
+        group.setMaximumWidth(140)
+        return group
+
+    @classmethod
+    def _create_custom_widget(cls):
         bg_color = ViewerEnum.BACKGROUND_COLOR.value
         text_color = tuple(map(lambda i, j: i - j, (255, 255, 255),
                                bg_color))
@@ -351,14 +802,26 @@ class NodeLineEdit(NodeBaseWidget):
             style += '}\n'
             stylesheet += style
         ledit = QtWidgets.QLineEdit()
-        ledit.setText(text)
-        ledit.setPlaceholderText(placeholder_text)
         ledit.setStyleSheet(stylesheet)
         ledit.setAlignment(QtCore.Qt.AlignCenter)
-        ledit.editingFinished.connect(self.on_value_changed)
         ledit.clearFocus()
-        self.set_custom_widget(ledit)
-        self.widget().setMaximumWidth(140)
+        return ledit
+
+    def _connect_custom_widget(self, ledit):
+        ledit.editingFinished.connect(self.on_value_changed)
+
+    def _disconnect_custom_widget(self, ledit):
+        ledit.editingFinished.disconnect(self.on_value_changed)
+
+    def _apply_state(self, ledit):
+        ledit.setText(self._text)
+        ledit.setPlaceholderText(self._placeholder_text)
+
+    def _store_state(self, ledit):
+        self._text = ledit.text()
+
+    def _state_key(self):
+        return self._text, self._placeholder_text
 
     @property
     def type_(self):
@@ -371,7 +834,10 @@ class NodeLineEdit(NodeBaseWidget):
         Returns:
             str: current text.
         """
-        return str(self.get_custom_widget().text())
+        ledit = self._custom_widget()
+        if ledit is None:
+            return str(self._text)
+        return str(ledit.text())
 
     def set_value(self, text=''):
         """
@@ -381,7 +847,12 @@ class NodeLineEdit(NodeBaseWidget):
             text (str): new text.
         """
         if text != self.get_value():
-            self.get_custom_widget().setText(text)
+            ledit = self._custom_widget()
+            if ledit is None:
+                self._text = text
+                self.update()
+            else:
+                ledit.setText(text)
             self.on_value_changed()
 
 
@@ -397,9 +868,23 @@ class NodeCheckBox(NodeBaseWidget):
         :meth:`NodeGraphQt.BaseNode.add_checkbox`
     """
 
+    virtualized = True
+
     def __init__(self, parent=None, name='', label='', text='', state=False):
         super(NodeCheckBox, self).__init__(parent, name, label)
-        _cbox = QtWidgets.QCheckBox(text)
+        self._text = text
+        self._state = state
+        self._update_size()
+
+    @classmethod
+    def _create_group(cls):
+        group = super(NodeCheckBox, cls)._create_group()
+        group.setMaximumWidth(140)
+        return group
+
+    @classmethod
+    def _create_custom_widget(cls):
+        _cbox = QtWidgets.QCheckBox()
         text_color = tuple(map(lambda i, j: i - j, (255, 255, 255),
                                ViewerEnum.BACKGROUND_COLOR.value))
         style_dict = {
@@ -415,14 +900,30 @@ class NodeCheckBox(NodeBaseWidget):
             style += '}\n'
             stylesheet += style
         _cbox.setStyleSheet(stylesheet)
-        _cbox.setChecked(state)
         _cbox.setMinimumWidth(80)
         font = _cbox.font()
         font.setPointSize(11)
         _cbox.setFont(font)
+        return _cbox
+
+    def _connect_custom_widget(self, _cbox):
         _cbox.stateChanged.connect(self.on_value_changed)
-        self.set_custom_widget(_cbox)
-        self.widget().setMaximumWidth(140)
+
+    def _disconnect_custom_widget(self, _cbox):
+        _cbox.stateChanged.disconnect(self.on_value_changed)
+
+    def _apply_state(self, _cbox):
+        _cbox.setText(self._text)
+        _cbox.setChecked(self._state)
+
+    def _store_state(self, _cbox):
+        self._state = _cbox.isChecked()
+
+    def _size_key(self):
+        return self._text,
+
+    def _state_key(self):
+        return self._text, self._state
 
     @property
     def type_(self):
@@ -435,7 +936,10 @@ class NodeCheckBox(NodeBaseWidget):
         Returns:
             bool: checked state.
         """
-        return self.get_custom_widget().isChecked()
+        _cbox = self._custom_widget()
+        if _cbox is None:
+            return self._state
+        return _cbox.isChecked()
 
     def set_value(self, state=False):
         """
@@ -445,4 +949,10 @@ class NodeCheckBox(NodeBaseWidget):
             state (bool): check state.
         """
         if state != self.get_value():
-            self.get_custom_widget().setChecked(state)
+            _cbox = self._custom_widget()
+            if _cbox is None:
+                self._state = state
+                self.update()
+                self.on_value_changed()
+            else:
+                _cbox.setChecked(state)
@@ -0,0 +1,237 @@
+import weakref
+
+from PySide6 import QtCore, QtGui
+
+from NodeGraphQt.base.hooks import (
+    add_method_hook,
+    class_tree,
+    remove_method_hook,
+)
+from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
+from NodeGraphQt.qgraphics.pipe import PipeItem
+from NodeGraphQt.widgets.node_widgets import NodeBaseWidget
+
+
+class PaintHeatMap(object):
+    """
+    Diagnostic overlay for the node viewer that measures the paint time of
+    the node and pipe items (node widgets are added to their node), tints
+    the items from green to red by their cost and lists the most expensive
+    node types.
+
+    Note:
+        Items are cached by the scene so the cost is the average time of the
+        paint calls that weren't served from the item cache.
+    """
+
+    #: number of node types listed in the overlay.
+    TOP_COUNT = 10
+
+    #: overlay refresh interval in milliseconds.
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, viewer):
+        """
+        Args:
+            viewer (NodeGraphQt.widgets.viewer.NodeViewer): node viewer.
+        """
+        self._viewer = viewer
+        self._enabled = False
+        self._hooks = []
+        # {<node_id>: [<total_seconds>, <paint_count>]}
+        self._node_costs = {}
+        # {<pipe item>: [<total_seconds>, <paint_count>]}
+        self._pipe_costs = weakref.WeakKeyDictionary()
+        # {<node_type>: [<total_seconds>, <paint_count>]}
+        self._type_costs = {}
+        self._timer = QtCore.QTimer(viewer)
+        self._timer.setInterval(self.REFRESH_INTERVAL)
+        self._timer.timeout.connect(viewer.viewport().update)
+
+    def __repr__(self):
+        return '<{}() object at {}>'.format(
+            self.__class__.__name__, hex(id(self)))
+
+    def is_enabled(self):
+        """
+        Returns true if the paint times are being measured.
+
+        Returns:
+            bool: true if enabled.
+        """
+        return self._enabled
+
+    def set_enabled(self, enabled=True):
+        """
+        Start or stop measuring the item paint times.
+
+        Args:
+            enabled (bool): true to enable.
+        """
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        if enabled:
+            for base in (AbstractNodeItem, PipeItem, NodeBaseWidget):
+                for cls in class_tree(base):
+                    if 'paint' in cls.__dict__:
+                        add_method_hook(cls, 'paint', self._on_paint)
+                        self._hooks.append(cls)
+            self._timer.start()
+        else:
+            for cls in self._hooks:
+                remove_method_hook(cls, 'paint', self._on_paint)
+            self._hooks = []
+            self._timer.stop()
+        # repaint all the items so they're measured.
+        self._viewer.scene().update()
+
+    def reset(self):
+        """
+        Clear the measured paint times.
+        """
+        self._node_costs.clear()
+        self._pipe_costs.clear()
+        self._type_costs.clear()
+
+    def remove_nodes(self, node_ids):
+        """
+        Clear the measured paint times of deleted nodes.
+        (connected to the "NodeGraph.nodes_deleted" signal)
+
+        Args:
+            node_ids (list[int]): deleted node ids.
+        """
+        for node_id in node_ids:
+            self._node_costs.pop(node_id, None)
+
+    def item_cost(self, item):
+        """
+        Returns the average paint time of an item.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): node or pipe item.
+
+        Returns:
+            float: seconds per paint or None if not measured.
+        """
+        if isinstance(item, AbstractNodeItem):
+            cost = self._node_costs.get(item.id)
+        else:
+            cost = self._pipe_costs.get(item)
+        if cost:
+            return cost[0] / max(1, cost[1])
+
+    def node_type_costs(self, limit=None):
+        """
+        Returns the node types sorted from the most to least expensive
+        total paint time.
+
+        Args:
+            limit (int): max number of node types.
+
+        Returns:
+            list[tuple]: (<node_type>, <total_seconds>, <paint_count>)
+        """
+        costs = sorted(
+            ((t, c[0], c[1]) for t, c in self._type_costs.items()),
+            key=lambda i: i[1], reverse=True
+        )
+        return costs[:limit] if limit else costs
+
+    def _on_paint(self, item, seconds, args):
+        """
+        Paint hook that records the paint time of an item.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): painted item.
+            seconds (float): paint time.
+            args (tuple): paint arguments.
+        """
+        if item.scene() is not self._viewer.scene():
+            return
+        is_widget = isinstance(item, NodeBaseWidget)
+        if is_widget:
+            item = item.parentItem()
+            while item and not isinstance(item, AbstractNodeItem):
+                item = item.parentItem()
+            if item is None:
+                return
+
+        if isinstance(item, AbstractNodeItem):
+            cost = self._node_costs.setdefault(item.id, [0.0, 0])
+        else:
+            cost = self._pipe_costs.setdefault(item, [0.0, 0])
+        cost[0] += seconds
+        if not is_widget:
+            cost[1] += 1
+
+        if isinstance(item, AbstractNodeItem):
+            cost = self._type_costs.setdefault(item.type_, [0.0, 0])
+            cost[0] += seconds
+            if not is_widget:
+                cost[1] += 1
+
+    def draw(self, painter, rect):
+        """
+        Draw the heat map tint over the visible items and the list of the
+        most expensive node types.
+        (called from the viewer "drawForeground" function)
+
+        Args:
+            painter (QtGui.QPainter): painter.
+            rect (QtCore.QRectF): exposed scene rect.
+        """
+        items = []
+        for item in self._viewer.scene().items(rect):
+            if not isinstance(item, (AbstractNodeItem, PipeItem)):
+                continue
+            if not item.isVisible():
+                continue
+            cost = self.item_cost(item)
+            if cost is not None:
+                items.append((item, cost))
+
+        painter.save()
+        if items:
+            max_cost = max(cost for _, cost in items) or 1.0
+            for item, cost in items:
+                # green (cheap) to red (expensive).
+                color = QtGui.QColor.fromHsvF(
+                    0.33 * (1.0 - cost / max_cost), 1.0, 1.0, 0.45)
+                if isinstance(item, PipeItem):
+                    pen = QtGui.QPen(color, 4.0)
+                    painter.strokePath(item.mapToScene(item.path()), pen)
+                else:
+                    painter.fillRect(item.sceneBoundingRect(), color)
+        self._draw_legend(painter)
+        painter.restore()
+
+    def _draw_legend(self, painter):
+        """
+        Draw the most expensive node types in the top right corner of the
+        viewer.
+
+        Args:
+            painter (QtGui.QPainter): painter.
+        """
+        lines = ['paint cost (total ms / paints)']
+        for node_type, total, count in self.node_type_costs(self.TOP_COUNT):
+            lines.append('{:>8.2f} {:>6}  {}'.format(
+                total * 1000.0, count, node_type))
+        text = '\n'.join(lines)
+
+        painter.resetTransform()
+        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        font.setPointSize(8)
+        painter.setFont(font)
+        metrics = QtGui.QFontMetrics(font)
+        text_rect = metrics.boundingRect(
+            QtCore.QRect(0, 0, 1000, 1000), QtCore.Qt.AlignLeft, text)
+        viewport_rect = self._viewer.viewport().rect()
+        text_rect.moveTopRight(viewport_rect.topRight() +
+                               QtCore.QPoint(-16, 16))
+        painter.fillRect(text_rect.adjusted(-6, -6, 6, 6),
+                         QtGui.QColor(10, 10, 10, 180))
+        painter.setPen(QtGui.QColor(200, 200, 200))
+        painter.drawText(text_rect, QtCore.Qt.AlignLeft, text)
@@ -0,0 +1,51 @@
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from NodeGraphQt.base.profiler import NodeGraphProfiler
+
+
+class ProfilerOverlayWidget(QtWidgets.QLabel):
+    """
+    Overlay widget on top of the node viewer that displays the stats
+    recorded by the :class:`NodeGraphQt.base.profiler.NodeGraphProfiler`.
+    """
+
+    #: overlay refresh interval in milliseconds.
+    REFRESH_INTERVAL = 500
+
+    def __init__(self, parent=None, limit=15):
+        super(ProfilerOverlayWidget, self).__init__(parent)
+        self._limit = limit
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
+        self.setTextFormat(QtCore.Qt.PlainText)
+        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        font.setPointSize(8)
+        self.setFont(font)
+        self.setStyleSheet(
+            'QLabel {background: rgba(10, 10, 10, 180); color: #c8c8c8;'
+            ' padding: 6px; border-radius: 3px;}'
+        )
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super(ProfilerOverlayWidget, self).showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super(ProfilerOverlayWidget, self).hideEvent(event)
+
+    def refresh(self):
+        """
+        Update the overlay text from the profiler stats.
+        """
+        profiler = NodeGraphProfiler.instance()
+        if profiler.is_enabled():
+            text = profiler.report(limit=self._limit)
+        else:
+            text = 'profiler disabled (NodeGraph.profiler.enable())'
+        if text != self.text():
+            self.setText(text)
+            self.adjustSize()
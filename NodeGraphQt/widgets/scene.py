@@ -1,4 +1,8 @@
 #!/usr/bin/python
+import bisect
+import itertools
+from contextlib import contextmanager
+
 from PySide6 import QtGui, QtCore, QtWidgets
 
 from NodeGraphQt.constants import ViewerEnum
@@ -12,12 +16,115 @@ class NodeScene(QtWidgets.QGraphicsScene):
         self._grid_color = ViewerEnum.GRID_COLOR.value
         self._bg_color = ViewerEnum.BACKGROUND_COLOR.value
         self.setBackgroundBrush(QtGui.QColor(*self._bg_color))
+        # pipes collected while the pipe updates are deferred.
+        self._deferred_pipes = None
+        # node items mapped to the (<zoom scale>, <order>) key they switch
+        # to proxy mode at, the keys are also kept sorted with the node items
+        # at the same index so zoom changes only select the crossing nodes.
+        self._proxy_nodes = {}
+        self._proxy_keys = []
+        self._proxy_items = []
+        self._proxy_order = itertools.count()
 
     def __repr__(self):
         cls_name = str(self.__class__.__name__)
         return '<{}("{}") object at {}>'.format(
             cls_name, self.viewer(), hex(id(self)))
 
+    def remove_items(self, items):
+        """
+        Remove a batch of items from the scene in one pass (items that are
+        not in the scene are skipped).
+
+        Args:
+            items (list[QtWidgets.QGraphicsItem]): items to remove.
+        """
+        for item in items:
+            if item.scene() is self:
+                self.removeItem(item)
+
+    @contextmanager
+    def defer_pipe_updates(self):
+        """
+        Context manager that collects the pipes of the ports moved in the
+        code block and redraws each pipe once at the end.
+
+        .. code-block:: python
+            :linenos:
+
+            with scene.defer_pipe_updates():
+                for node in nodes:
+                    node.moveBy(10, 0)
+        """
+        if self._deferred_pipes is not None:
+            yield
+            return
+        self._deferred_pipes = set()
+        try:
+            yield
+        finally:
+            pipes, self._deferred_pipes = self._deferred_pipes, None
+            for pipe in pipes:
+                if pipe.scene() is self:
+                    pipe.draw_path(pipe.input_port, pipe.output_port)
+
+    def defer_pipe_update(self, pipes):
+        """
+        Queue pipes to be redrawn if the pipe updates are deferred.
+
+        Args:
+            pipes (list[PipeItem]): pipes to redraw.
+
+        Returns:
+            bool: true if the pipes were queued.
+        """
+        if self._deferred_pipes is None:
+            return False
+        self._deferred_pipes.update(pipes)
+        return True
+
+    def track_proxy_node(self, node, switch_scale=None):
+        """
+        Sets the viewer zoom scale below which the node item is drawn in
+        proxy mode.
+
+        Args:
+            node (NodeGraphQt.qgraphics.node_base.NodeItem): node item.
+            switch_scale (float): zoom scale or None to stop tracking the
+                node item.
+        """
+        key = self._proxy_nodes.pop(node, None)
+        if key is not None:
+            index = bisect.bisect_left(self._proxy_keys, key)
+            del self._proxy_keys[index]
+            del self._proxy_items[index]
+        if switch_scale is None:
+            return
+        key = (switch_scale, next(self._proxy_order))
+        index = bisect.bisect_right(self._proxy_keys, key)
+        self._proxy_keys.insert(index, key)
+        self._proxy_items.insert(index, node)
+        self._proxy_nodes[node] = key
+
+    def proxy_nodes(self, old_scale=None, new_scale=None):
+        """
+        Returns the node items that switch proxy mode between two zoom scales
+        (or all tracked node items if a scale is not specified).
+
+        Args:
+            old_scale (float): previous zoom scale.
+            new_scale (float): current zoom scale.
+
+        Returns:
+            list[NodeGraphQt.qgraphics.node_base.NodeItem]: node items.
+        """
+        if old_scale is None or new_scale is None:
+            return list(self._proxy_nodes)
+        low, high = sorted([old_scale, new_scale])
+        start = bisect.bisect_right(self._proxy_keys, (low, float('inf')))
+        end = bisect.bisect_right(self._proxy_keys, (high, float('inf')))
+        return self._proxy_items[start:end]
+
     # def _draw_text(self, painter, pen):
     #     font = QtGui.QFont()
     #     font.setPixelSize(48)
@@ -1,5 +1,5 @@
 #!/usr/bin/python
-import re
+import heapq
 from collections import OrderedDict
 
 from PySide6 import QtCore, QtWidgets, QtGui
@@ -49,6 +49,167 @@ class TabSearchCompleter(QtWidgets.QCompleter):
         self._using_orig_model = True
 
 
+class TabSearchIndex(object):
+    """
+    Prebuilt search index used by the ``TabSearchMenuWidget`` for fuzzy
+    matching node names.
+
+    Names are indexed by the characters they contain so a query only has to
+    score names that contain every one of its characters. Matches are cached
+    per query so each keystroke narrows the results of the previous query
+    instead of scanning every registered node name again.
+
+    Args:
+        names (list[str]): names to index.
+    """
+
+    #: max number of cached query results.
+    CACHE_SIZE = 64
+
+    def __init__(self, names=None):
+        self._names = set()
+        self._char_index = {}
+        self._cache = OrderedDict()
+        if names:
+            self.set_names(names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    @staticmethod
+    def score(key, name):
+        """
+        Subsequence scorer for matching the ``key`` against a ``name``.
+
+        Args:
+            key (str): lowercase search key.
+            name (str): lowercase name to match against.
+
+        Returns:
+            tuple(int, int) or None: (match length, match start) or None if
+                the key isn't a subsequence of the name.
+        """
+        start = name.find(key[0])
+        if start < 0:
+            return
+        end = start
+        for char in key[1:]:
+            end = name.find(char, end + 1)
+            if end < 0:
+                return
+        return end - start + 1, start
+
+    def set_names(self, names):
+        """
+        Rebuild the index from a list of names.
+
+        Args:
+            names (list[str]): names to index.
+        """
+        self._names.clear()
+        self._char_index.clear()
+        self._cache.clear()
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        """
+        Add a name to the index.
+
+        Args:
+            name (str): name to index.
+        """
+        if name in self._names:
+            return
+        self._names.add(name)
+        for char in set(name.lower()):
+            self._char_index.setdefault(char, set()).add(name)
+        self._cache.clear()
+
+    def remove(self, name):
+        """
+        Remove a name from the index.
+
+        Args:
+            name (str): indexed name.
+        """
+        if name not in self._names:
+            return
+        self._names.discard(name)
+        for char in set(name.lower()):
+            names = self._char_index.get(char)
+            if names is None:
+                continue
+            names.discard(name)
+            if not names:
+                del self._char_index[char]
+        self._cache.clear()
+
+    def _candidates(self, key):
+        """
+        Returns the names to be scored for the search key.
+
+        Args:
+            key (str): lowercase search key.
+
+        Returns:
+            iterable[str]: candidate names.
+        """
+        # a name matching the key also matches every prefix of the key so
+        # the longest cached prefix result is the smallest candidate set.
+        for idx in range(len(key) - 1, 0, -1):
+            matches = self._cache.get(key[:idx])
+            if matches is not None:
+                return matches
+
+        char_sets = []
+        for char in set(key):
+            names = self._char_index.get(char)
+            if not names:
+                return []
+            char_sets.append(names)
+        char_sets.sort(key=len)
+        return char_sets[0].intersection(*char_sets[1:])
+
+    def search(self, key, limit=None):
+        """
+        Fuzzy search the indexed names.
+
+        Args:
+            key (str): search text.
+            limit (int): max number of results returned (optional).
+
+        Returns:
+            list[str]: matching names sorted by best match.
+        """
+        key = key.lower()
+        if not key:
+            return []
+
+        matches = self._cache.get(key)
+        if matches is None:
+            matches = {}
+            for name in self._candidates(key):
+                score = self.score(key, name.lower())
+                if score:
+                    matches[name] = score
+            self._cache[key] = matches
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        results = ((score[0], score[1], name) for name, score in matches.items())
+        if limit:
+            results = heapq.nsmallest(limit, results)
+        else:
+            results = sorted(results)
+        return [name for _, _, name in results]
+
+
 class TabSearchLineEditWidget(QtWidgets.QLineEdit):
 
     tab_pressed = QtCore.Signal()
@@ -96,15 +257,17 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
 
     search_submitted = QtCore.Signal(str)
 
+    #: max number of search results displayed.
+    MAX_RESULTS = 50
+
     def __init__(self, node_dict=None):
         super(TabSearchMenuWidget, self).__init__()
 
         self.line_edit = TabSearchLineEditWidget()
         self.line_edit.tab_pressed.connect(self._close)
 
-        self._node_dict = node_dict or {}
-        if self._node_dict:
-            self._generate_items_from_node_dict()
+        self._node_dict = {}
+        self._node_names = {}
 
         search_widget = QtWidgets.QWidgetAction(self)
         search_widget.setDefaultWidget(self.line_edit)
@@ -150,13 +313,26 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
         self._actions = {}
         self._menus = {}
         self._searched_actions = []
+        self._search_index = TabSearchIndex()
+
+        # menu tree data used to populate the menus when they're shown.
+        # (root menu path is an empty string)
+        self._menu_children = {}
+        self._menu_nodes = {}
+        self._menu_items = {}
+        self._dirty_menus = set()
 
         self._block_submit = False
 
-        self.rebuild = False
+        # nodes are synced from the node graph the next time the search
+        # is shown.
+        self.rebuild = True
 
         self._wire_signals()
 
+        if node_dict:
+            self._sync_nodes(node_dict)
+
     def __repr__(self):
         return '<{} at {}>'.format(self.__class__.__name__, hex(id(self)))
 
@@ -164,35 +340,27 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
         super(TabSearchMenuWidget, self).keyPressEvent(event)
         self.line_edit.keyPressEvent(event)
 
-    @staticmethod
-    def _fuzzy_finder(key, collection):
-        suggestions = []
-        pattern = '.*?'.join(key.lower())
-        regex = re.compile(pattern)
-        for item in collection:
-            match = regex.search(item.lower())
-            if match:
-                suggestions.append((len(match.group()), match.start(), item))
-
-        return [x for _, _, x in sorted(suggestions)]
-
     def _wire_signals(self):
         self.line_edit.returnPressed.connect(self._on_search_submitted)
         self.line_edit.textChanged.connect(self._on_text_changed)
+        self.aboutToShow.connect(lambda: self._populate_menu(''))
 
     def _on_text_changed(self, text):
-        self._clear_actions()
-
         if not text:
+            self._clear_actions()
             self._set_menu_visible(True)
             return
 
         self._set_menu_visible(False)
 
-        action_names = self._fuzzy_finder(text, self._actions.keys())
+        action_names = self._search_index.search(text, self.MAX_RESULTS)
+        actions = [self._get_action(name) for name in action_names]
 
-        self._searched_actions = [self._actions[name] for name in action_names]
-        self.addActions(self._searched_actions)
+        # only update the menu if the displayed results have changed.
+        if actions != self._searched_actions:
+            self._clear_actions()
+            self._searched_actions = actions
+            self.addActions(self._searched_actions)
 
         if self._searched_actions:
             self.setActiveAction(self._searched_actions[0])
@@ -200,7 +368,6 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
     def _clear_actions(self):
         for action in self._searched_actions:
             self.removeAction(action)
-            action.triggered.connect(self._on_search_submitted)
         del self._searched_actions[:]
 
     def _set_menu_visible(self, visible):
@@ -218,12 +385,13 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
         self.line_edit.setFocus()
         self._set_menu_visible(True)
         self._block_submit = False
+        self._populate_menu('')
         self.exec_(QtGui.QCursor.pos())
 
     def _on_search_submitted(self):
         if not self._block_submit:
             action = self.sender()
-            if type(action) is not QtWidgets.QAction:
+            if type(action) is not QtGui.QAction:
                 if len(self._searched_actions) > 0:
                     action = self._searched_actions[0]
                 else:
@@ -237,72 +405,222 @@ class TabSearchMenuWidget(QtWidgets.QMenu):
 
         self._close()
 
-    def build_menu_tree(self):
-        node_types = sorted(self._node_dict.values())
-        node_names = sorted(self._node_dict.keys())
-        menu_tree = OrderedDict()
-
-        max_depth = 0
-        for node_type in node_types:
-            trees = '.'.join(node_type.split('.')[:-1]).split('::')
-            for depth, menu_name in enumerate(trees):
-                new_menu = None
-                menu_path = '::'.join(trees[:depth + 1])
-                if depth in menu_tree.keys():
-                    if menu_name not in menu_tree[depth].keys():
-                        new_menu = QtWidgets.QMenu(menu_name)
-                        new_menu.keyPressEvent = self.keyPressEvent
-                        new_menu.setStyleSheet(self._menu_stylesheet)
-                        menu_tree[depth][menu_path] = new_menu
-                else:
-                    new_menu = QtWidgets.QMenu(menu_name)
-                    new_menu.setStyleSheet(self._menu_stylesheet)
-                    menu_tree[depth] = {menu_path: new_menu}
-                if depth > 0 and new_menu:
-                    new_menu.parentPath = '::'.join(trees[:depth])
-
-                max_depth = max(max_depth, depth)
-
-        for i in range(max_depth+1):
-            menus = menu_tree[i]
-            for menu_path, menu in menus.items():
-                self._menus[menu_path] = menu
-                if i == 0:
-                    self.addMenu(menu)
-                else:
-                    parent_menu = self._menus[menu.parentPath]
-                    parent_menu.addMenu(menu)
-
-        for name in node_names:
-            action = QtWidgets.QAction(name, self)
-            action.setText(name)
+    @staticmethod
+    def _menu_path(node_type):
+        """
+        Returns the menu path for the node type.
+
+        Args:
+            node_type (str): node type identifier.
+
+        Returns:
+            str: menu path (sub menus are separated by "::").
+        """
+        return '.'.join(node_type.split('.')[:-1])
+
+    def _get_action(self, name):
+        """
+        Returns the action for the node name and creates it if it hasn't
+        been created yet.
+
+        Args:
+            name (str): node name displayed in the menu.
+
+        Returns:
+            QtGui.QAction: menu action.
+        """
+        action = self._actions.get(name)
+        if action is None:
+            action = QtGui.QAction(name, self)
             action.triggered.connect(self._on_search_submitted)
             self._actions[name] = action
+        return action
+
+    def _get_menu(self, menu_path):
+        """
+        Returns the menu for the menu path and creates it if it hasn't
+        been created yet.
+
+        Args:
+            menu_path (str): menu path.
+
+        Returns:
+            QtWidgets.QMenu: menu.
+        """
+        if not menu_path:
+            return self
+        menu = self._menus.get(menu_path)
+        if menu is None:
+            menu = QtWidgets.QMenu(menu_path.split('::')[-1])
+            menu.keyPressEvent = self.keyPressEvent
+            menu.setStyleSheet(self._menu_stylesheet)
+            menu.aboutToShow.connect(
+                lambda: self._populate_menu(menu_path)
+            )
+            self._menus[menu_path] = menu
+        return menu
+
+    def _populate_menu(self, menu_path):
+        """
+        Add the sub menus and node actions into the menu if its contents have
+        changed since it was last shown.
+
+        Args:
+            menu_path (str): menu path.
+        """
+        if menu_path not in self._dirty_menus:
+            return
+        self._dirty_menus.discard(menu_path)
+
+        menu = self._get_menu(menu_path)
+        for action in self._menu_items.pop(menu_path, []):
+            menu.removeAction(action)
+
+        items = []
+        for child_path in sorted(self._menu_children.get(menu_path, [])):
+            items.append(self._get_menu(child_path).menuAction())
+        for name in sorted(self._menu_nodes.get(menu_path, [])):
+            items.append(self._get_action(name))
+        menu.addActions(items)
+        self._menu_items[menu_path] = items
+
+    def _add_menu_item(self, name, node_type):
+        """
+        Add a node into the search index and the menu tree.
+
+        Args:
+            name (str): node name displayed in the menu.
+            node_type (str): node type identifier.
+        """
+        self._node_dict[name] = node_type
+        self._search_index.add(name)
+
+        menu_path = self._menu_path(node_type)
+        self._menu_nodes.setdefault(menu_path, set()).add(name)
+        self._dirty_menus.add(menu_path)
+
+        trees = menu_path.split('::')
+        for depth in range(len(trees) - 1, -1, -1):
+            menu_path = '::'.join(trees[:depth + 1])
+            parent_path = '::'.join(trees[:depth])
+            children = self._menu_children.setdefault(parent_path, set())
+            if menu_path in children or not menu_path:
+                break
+            children.add(menu_path)
+            self._dirty_menus.add(parent_path)
+
+    def _remove_menu_item(self, name):
+        """
+        Remove a node from the search index and the menu tree.
+
+        Args:
+            name (str): node name displayed in the menu.
+        """
+        node_type = self._node_dict.pop(name, None)
+        if node_type is None:
+            return
+        self._search_index.remove(name)
+
+        menu_path = self._menu_path(node_type)
+        self._menu_nodes[menu_path].discard(name)
+        self._dirty_menus.add(menu_path)
+
+        action = self._actions.pop(name, None)
+        if action is not None:
+            if action in self._searched_actions:
+                self._searched_actions.remove(action)
+                self.removeAction(action)
+            menu_items = self._menu_items.get(menu_path, [])
+            if action in menu_items:
+                menu_items.remove(action)
+                self._get_menu(menu_path).removeAction(action)
+            action.deleteLater()
+
+        # remove the empty menus.
+        while menu_path:
+            if self._menu_nodes.get(menu_path) or \
+                    self._menu_children.get(menu_path):
+                break
+            self._menu_nodes.pop(menu_path, None)
+            self._menu_children.pop(menu_path, None)
+            self._menu_items.pop(menu_path, None)
+            self._dirty_menus.discard(menu_path)
+            parent_path = '::'.join(menu_path.split('::')[:-1])
+            menu = self._menus.pop(menu_path, None)
+            if menu is not None:
+                parent_items = self._menu_items.get(parent_path, [])
+                if menu.menuAction() in parent_items:
+                    parent_items.remove(menu.menuAction())
+                    self._get_menu(parent_path).removeAction(
+                        menu.menuAction()
+                    )
+                menu.deleteLater()
+
+            self._menu_children[parent_path].discard(menu_path)
+            self._dirty_menus.add(parent_path)
+            menu_path = parent_path
+
+    def _sync_nodes(self, node_dict):
+        """
+        Clear and rebuild the search index and menu tree from the nodes.
+
+        Args:
+            node_dict (dict): {<node name>: [<node type>, ...]}
+        """
+        self._clear_actions()
+        for name in list(self._node_dict.keys()):
+            self._remove_menu_item(name)
+        self._node_names.clear()
+        self.rebuild = False
+        self.add_nodes(node_dict)
 
-            menu_name = self._node_dict[name]
-            menu_path = '.'.join(menu_name.split('.')[:-1])
+    def add_nodes(self, node_dict):
+        """
+        Add nodes to the tab search without rebuilding the existing menus.
 
-            if menu_path in self._menus.keys():
-                self._menus[menu_path].addAction(action)
-            else:
-                self.addAction(action)
+        Note:
+            Nodes with the same name are displayed with their node type
+            eg. ``"Node (io.github.jchanvfx.Node)"``.
+
+        Args:
+            node_dict (dict): {<node name>: [<node type>, ...]}
+        """
+        if self.rebuild:
+            return
+        for name, node_types in node_dict.items():
+            registered = self._node_names.setdefault(name, [])
+            new_types = [t for t in node_types if t not in registered]
+            if not new_types:
+                continue
+            if len(registered) == 1:
+                self._remove_menu_item(name)
+                self._add_menu_item(
+                    '{} ({})'.format(name, registered[0]), registered[0]
+                )
+            registered.extend(new_types)
+            for node_type in new_types:
+                if len(registered) == 1:
+                    self._add_menu_item(name, node_type)
+                else:
+                    self._add_menu_item(
+                        '{} ({})'.format(name, node_type), node_type
+                    )
+
+    def build_menu_tree(self):
+        """
+        Populate every menu in the tab search menu tree.
+
+        Note:
+            Menus are otherwise only populated when they're shown.
+        """
+        menu_paths = ['']
+        while menu_paths:
+            menu_path = menu_paths.pop()
+            self._populate_menu(menu_path)
+            menu_paths.extend(self._menu_children.get(menu_path, []))
 
     def set_nodes(self, node_dict=None):
-        if not self._node_dict or self.rebuild:
-            self._node_dict.clear()
-            self._clear_actions()
-            self._set_menu_visible(False)
-            for menu in self._menus.values():
-                self.removeAction(menu.menuAction())
-            self._actions.clear()
-            self._menus.clear()
-            for name, node_types in node_dict.items():
-                if len(node_types) == 1:
-                    self._node_dict[name] = node_types[0]
-                    continue
-                for node_id in node_types:
-                    self._node_dict['{} ({})'.format(name, node_id)] = node_id
-            self.build_menu_tree()
-            self.rebuild = False
+        if self.rebuild:
+            self._sync_nodes(node_dict or {})
 
         self._show()
@@ -20,6 +20,8 @@ from NodeGraphQt.qgraphics.pipe import PipeItem, LivePipeItem
 from NodeGraphQt.qgraphics.port import PortItem
 from NodeGraphQt.qgraphics.slicer import SlicerPipeItem
 from NodeGraphQt.widgets.dialogs import BaseDialog, FileDialog
+from NodeGraphQt.widgets.paint_heat_map import PaintHeatMap
+from NodeGraphQt.widgets.profiler_overlay import ProfilerOverlayWidget
 from NodeGraphQt.widgets.scene import NodeScene
 from NodeGraphQt.widgets.tab_search import TabSearchMenuWidget
 
@@ -42,14 +44,14 @@ class NodeViewer(QtWidgets.QGraphicsView):
     search_triggered = QtCore.Signal(str, tuple)
     connection_sliced = QtCore.Signal(list)
     connection_changed = QtCore.Signal(list, list)
-    insert_node = QtCore.Signal(object, str, dict)
-    node_name_changed = QtCore.Signal(str, str)
-    node_backdrop_updated = QtCore.Signal(str, str, object)
+    insert_node = QtCore.Signal(object, object, dict)
+    node_name_changed = QtCore.Signal(object, str)
+    node_backdrop_updated = QtCore.Signal(object, str, object)
 
     # pass through signals that are translated into "NodeGraph()" signals.
-    node_selected = QtCore.Signal(str)
+    node_selected = QtCore.Signal(object)
     node_selection_changed = QtCore.Signal(list, list)
-    node_double_clicked = QtCore.Signal(str)
+    node_double_clicked = QtCore.Signal(object)
     data_dropped = QtCore.Signal(QtCore.QMimeData, QtCore.QPoint)
     context_menu_prompt = QtCore.Signal(str, object)
 
@@ -73,6 +75,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.setAcceptDrops(True)
         self.resize(850, 800)
 
+        # zoom scale the node items proxy mode was last computed for.
+        self._proxy_scale = None
         self._scene_range = QtCore.QRectF(
             0, 0, self.size().width(), self.size().height()
         )
@@ -147,6 +151,9 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
         self._build_context_menus()
 
+        self._profiler_overlay = None
+        self._paint_heat_map = None
+
         self.acyclic = True
         self.pipe_collision = False
         self.pipe_slicing = True
@@ -274,6 +281,21 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         self.setSceneRect(self._scene_range)
         self.fitInView(self._scene_range, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        self._update_proxy_modes()
+
+    def _update_proxy_modes(self):
+        """
+        Switch the node items in and out of proxy mode once per zoom change
+        (panning the scene doesn't change the scale and is skipped).
+        """
+        scale = self.transform().m11()
+        if scale == self._proxy_scale:
+            return
+        # only the nodes crossing the proxy mode threshold are updated.
+        nodes = self.scene().proxy_nodes(self._proxy_scale, scale)
+        self._proxy_scale = scale
+        for node in nodes:
+            node.auto_switch_mode(scale)
 
     def _combined_rect(self, nodes):
         """
@@ -285,9 +307,13 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             QtCore.QRectF: combined rect
         """
-        group = self.scene().createItemGroup(nodes)
-        rect = group.boundingRect()
-        self.scene().destroyItemGroup(group)
+        rect = QtCore.QRectF()
+        for node in nodes:
+            rect |= node.sceneBoundingRect()
+            # include the ports and widgets outside the node rect.
+            children_rect = node.childrenBoundingRect()
+            if not children_rect.isNull():
+                rect |= node.mapRectToScene(children_rect)
         return rect
 
     def _items_near(self, pos, item_type=None, width=20, height=20):
@@ -355,6 +381,11 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._last_size = self.size()
         super(NodeViewer, self).resizeEvent(event)
 
+    def drawForeground(self, painter, rect):
+        super(NodeViewer, self).drawForeground(painter, rect)
+        if self._paint_heat_map and self._paint_heat_map.is_enabled():
+            self._paint_heat_map.draw(painter, rect)
+
     def contextMenuEvent(self, event):
         self.RMB_state = False
 
@@ -1203,6 +1234,10 @@ class NodeViewer(QtWidgets.QGraphicsView):
         rect = self.mapToScene(rect).boundingRect()
         self.scene().update(rect)
 
+    def tab_search_add_nodes(self, nodes):
+        if isinstance(self._search_widget, TabSearchMenuWidget):
+            self._search_widget.add_nodes(nodes)
+
     def rebuild_tab_search(self):
         if isinstance(self._search_widget, TabSearchMenuWidget):
             self._search_widget.rebuild = True
@@ -1416,24 +1451,31 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         Globally move specified nodes.
 
+        The nodes are offset in one pass and the connected pipes are redrawn
+        once at the end.
+
         Args:
             nodes (list[AbstractNodeItem]): node items.
             pos (tuple or list): custom x, y position.
             offset (tuple or list): x, y position offset.
+
+        Returns:
+            list[float]: x, y offset the nodes were moved by.
         """
-        group = self.scene().createItemGroup(nodes)
-        group_rect = group.boundingRect()
         if pos:
             x, y = pos
         else:
+            center = self._combined_rect(nodes).center()
             pos = self.mapToScene(self._previous_pos)
-            x = pos.x() - group_rect.center().x()
-            y = pos.y() - group_rect.center().y()
+            x = pos.x() - center.x()
+            y = pos.y() - center.y()
         if offset:
             x += offset[0]
             y += offset[1]
-        group.setPos(x, y)
-        self.scene().destroyItemGroup(group)
+        with self.scene().defer_pipe_updates():
+            for node in nodes:
+                node.moveBy(x, y)
+        return [float(x), float(y)]
 
     def get_pipes_from_nodes(self, nodes=None):
         nodes = nodes or self.selected_nodes()
@@ -1471,7 +1513,15 @@ class NodeViewer(QtWidgets.QGraphicsView):
             if not nodes:
                 return
 
-        rect = self._combined_rect(nodes)
+        self.center_on_rect(self._combined_rect(nodes))
+
+    def center_on_rect(self, rect):
+        """
+        Center on the scene rect.
+
+        Args:
+            rect (QtCore.QRectF): scene rect.
+        """
         self._scene_range.translate(rect.center() - self._scene_range.center())
         self.setSceneRect(self._scene_range)
 
@@ -1563,7 +1613,16 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self._set_viewer_zoom(value, 0.0)
 
     def zoom_to_nodes(self, nodes):
-        self._scene_range = self._combined_rect(nodes)
+        self.zoom_to_rect(self._combined_rect(nodes))
+
+    def zoom_to_rect(self, rect):
+        """
+        Zoom to fit the scene rect.
+
+        Args:
+            rect (QtCore.QRectF): scene rect.
+        """
+        self._scene_range = QtCore.QRectF(rect)
         self._update_scene()
 
         if self.get_zoom() > 0.1:
@@ -1639,6 +1698,40 @@ class NodeViewer(QtWidgets.QGraphicsView):
         self.SHIFT_state = False
         self.ALT_state = False
 
+    def profiler_overlay_visible(self):
+        """
+        Returns true if the profiler overlay is visible.
+
+        Returns:
+            bool: true if visible.
+        """
+        return bool(self._profiler_overlay and
+                    not self._profiler_overlay.isHidden())
+
+    def set_profiler_overlay_visible(self, visible=True):
+        """
+        Show or hide the profiler overlay.
+
+        Args:
+            visible (bool): true to show the overlay.
+        """
+        if visible and self._profiler_overlay is None:
+            self._profiler_overlay = ProfilerOverlayWidget(self)
+            self._profiler_overlay.move(10, 10)
+        if self._profiler_overlay:
+            self._profiler_overlay.setVisible(visible)
+
+    def paint_heat_map(self):
+        """
+        Returns the paint cost heat map.
+
+        Returns:
+            PaintHeatMap: paint heat map.
+        """
+        if self._paint_heat_map is None:
+            self._paint_heat_map = PaintHeatMap(self)
+        return self._paint_heat_map
+
     def use_OpenGL(self):
         """
         Use QOpenGLWidget as the viewer.
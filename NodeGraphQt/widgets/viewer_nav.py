@@ -95,14 +95,15 @@ class NodeNavigationDelagate(QtWidgets.QStyledItemDelegate):
 
 class NodeNavigationWidget(QtWidgets.QListView):
 
-    navigation_changed = QtCore.Signal(str, list)
+    navigation_changed = QtCore.Signal(object, list)
 
     def __init__(self, parent=None):
         super(NodeNavigationWidget, self).__init__(parent)
-        self.setSelectionMode(self.SingleSelection)
-        self.setResizeMode(self.Adjust)
-        self.setViewMode(self.ListMode)
-        self.setFlow(self.LeftToRight)
+        self.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.setResizeMode(QtWidgets.QListView.ResizeMode.Adjust)
+        self.setViewMode(QtWidgets.QListView.ViewMode.ListMode)
+        self.setFlow(QtWidgets.QListView.Flow.LeftToRight)
         self.setDragEnabled(False)
         self.setMinimumHeight(20)
         self.setMaximumHeight(36)
@@ -132,17 +133,21 @@ class NodeNavigationWidget(QtWidgets.QListView):
             rows = [r for r in rows if index.row() < r]
         if not rows:
             return
-        rm_node_ids = [self.model().item(r, 0).toolTip() for r in rows]
-        node_id = self.model().item(index.row(), 0).toolTip()
+        rm_node_ids = [self._item_node_id(r) for r in rows]
+        node_id = self._item_node_id(index.row())
         [self.model().removeRow(r) for r in rows]
         self.navigation_changed.emit(node_id, rm_node_ids)
 
+    def _item_node_id(self, row):
+        return self.model().item(row, 0).data(QtCore.Qt.UserRole)
+
     def clear(self):
         self.model().sourceMode().clear()
 
     def add_label_item(self, label, node_id):
         item = QtGui.QStandardItem(label)
-        item.setToolTip(node_id)
+        item.setToolTip(str(node_id))
+        item.setData(node_id, QtCore.Qt.UserRole)
         metrics = QtGui.QFontMetrics(item.font())
         if hasattr(metrics, 'horizontalAdvance'):
             width = metrics.horizontalAdvance(item.text())
@@ -159,12 +164,12 @@ class NodeNavigationWidget(QtWidgets.QListView):
         rows = reversed(range(self.model().rowCount()))
         for r in rows:
             item = self.model().item(r, 0)
-            if item.toolTip() == node_id:
+            if item.data(QtCore.Qt.UserRole) == node_id:
                 item.setText(label)
 
     def remove_label_item(self, node_id):
         rows = reversed(range(1, self.model().rowCount()))
-        node_ids = [self.model().item(r, 0).toolTip() for r in rows]
+        node_ids = [self._item_node_id(r) for r in rows]
         if node_id not in node_ids:
             return
         index = node_ids.index(node_id)
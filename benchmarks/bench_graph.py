@@ -0,0 +1,308 @@
+#!/usr/bin/python
+"""
+Benchmark the core node graph operations on synthetic graphs.
+
+The benchmarks run offscreen and time ``create_node``, ``connect_to``,
+``_serialize``, ``_deserialize``, ``auto_layout_nodes``, ``copy_nodes``,
+``paste_nodes`` and ``delete_nodes`` on chain, fan-in/fan-out, random DAG
+and nested group graphs (the groups are expanded one level deep so their
+sub graphs are serialized from real nodes).
+
+.. code-block:: bash
+
+    python -m benchmarks.bench_graph --sizes 1000 10000 --output new.json
+    python -m benchmarks.bench_graph --compare old.json new.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# the benchmarks don't need a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore, QtWidgets
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from NodeGraphQt.pkg_info import __version__
+
+from benchmarks.graphs import (
+    SHAPES,
+    delete_graph,
+    expand_group_nodes,
+    new_graph,
+)
+
+#: default graph sizes (100000 is supported but slow).
+SIZES = [1000, 10000]
+
+#: benchmarked operations in the order they are run.
+OPERATIONS = [
+    'create_node',
+    'connect_to',
+    'serialize',
+    'deserialize',
+    'auto_layout_nodes',
+    'copy_nodes',
+    'paste_nodes',
+    'delete_nodes',
+]
+
+
+def _max_rss_kb():
+    """
+    Returns:
+        int: peak resident memory of the process in kilobytes or None.
+    """
+    if resource is None:
+        return
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, linux reports kilobytes.
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+class _Timer(object):
+    """
+    Times an operation and records the python memory it allocated.
+    """
+
+    def __init__(self, track_memory=False):
+        self._track_memory = track_memory
+        self.seconds = 0.0
+        self.memory_kb = None
+        self.memory_peak_kb = None
+
+    def __enter__(self):
+        gc.collect()
+        if self._track_memory:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.seconds = time.perf_counter() - self._start
+        if self._track_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory_kb = (current - self._memory_start) / 1024.0
+            self.memory_peak_kb = (peak - self._memory_start) / 1024.0
+
+
+def run_shape(shape, size, operations=None, track_memory=False, seed=0):
+    """
+    Run the benchmarked operations once on a new graph.
+
+    Args:
+        shape (str): graph shape from :data:`benchmarks.graphs.SHAPES`.
+        size (int): number of nodes.
+        operations (list[str]): operations to report (default: all).
+        track_memory (bool): record the python memory allocated.
+        seed (int): random seed for the random graphs.
+
+    Returns:
+        dict: {<operation>: {'seconds': float, 'memory_kb': float,
+            'memory_peak_kb': float}}
+    """
+    create_func, edges_func = SHAPES[shape]
+    results = {}
+
+    def timed(name):
+        timer = _Timer(track_memory)
+        results[name] = timer
+        return timer
+
+    graph = new_graph()
+    with timed('create_node'):
+        nodes = create_func(graph, size)
+
+    edges = edges_func(len(nodes), seed)
+    with timed('connect_to'):
+        for source, target in edges:
+            nodes[source].output(0).connect_to(nodes[target].input(0),
+                                               push_undo=False)
+
+    with timed('serialize'):
+        data = graph._serialize(graph.all_nodes())
+
+    load_graph = new_graph()
+    with timed('deserialize'):
+        expand_group_nodes(load_graph, load_graph._deserialize(data))
+    delete_graph(load_graph)
+
+    with timed('auto_layout_nodes'):
+        graph.auto_layout_nodes(nodes)
+
+    with timed('copy_nodes'):
+        graph.copy_nodes(nodes)
+
+    with timed('paste_nodes'):
+        pasted = list(graph.paste_nodes())
+
+    with timed('delete_nodes'):
+        graph.delete_nodes(pasted)
+
+    graph.undo_stack().clear()
+    delete_graph(graph)
+
+    operations = operations or OPERATIONS
+    return {
+        name: {
+            'seconds': timer.seconds,
+            'memory_kb': timer.memory_kb,
+            'memory_peak_kb': timer.memory_peak_kb,
+        }
+        for name, timer in results.items() if name in operations
+    }
+
+
+def run(shapes=None, sizes=None, operations=None, repeat=1,
+        track_memory=False, seed=0, log=None):
+    """
+    Run the benchmarks.
+
+    Args:
+        shapes (list[str]): graph shapes (default: all).
+        sizes (list[int]): graph sizes (default: :data:`SIZES`).
+        operations (list[str]): operations to report (default: all).
+        repeat (int): number of times each benchmark is run.
+        track_memory (bool): record the python memory allocated.
+        seed (int): random seed for the random graphs.
+        log (callable): function called with a progress message.
+
+    Returns:
+        dict: benchmark report with ``meta`` and ``results``.
+    """
+    shapes = shapes or sorted(SHAPES.keys())
+    sizes = sizes or SIZES
+    if track_memory:
+        tracemalloc.start()
+
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            runs = [run_shape(shape, size, operations, track_memory, seed)
+                    for _ in range(repeat)]
+            for name in OPERATIONS:
+                if name not in runs[0]:
+                    continue
+                seconds = [r[name]['seconds'] for r in runs]
+                result = {
+                    'shape': shape,
+                    'size': size,
+                    'operation': name,
+                    'seconds': seconds,
+                    'min': min(seconds),
+                    'median': statistics.median(seconds),
+                }
+                if track_memory:
+                    result['memory_kb'] = max(
+                        r[name]['memory_kb'] for r in runs)
+                    result['memory_peak_kb'] = max(
+                        r[name]['memory_peak_kb'] for r in runs)
+                results.append(result)
+                if log:
+                    log('{:<8} {:>7} {:<18} {:>9.4f}s'.format(
+                        shape, size, name, result['median']))
+
+    if track_memory:
+        tracemalloc.stop()
+
+    return {
+        'meta': {
+            'nodegraphqt': __version__,
+            'qt': QtCore.qVersion(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(),
+            'repeat': repeat,
+            'seed': seed,
+            'max_rss_kb': _max_rss_kb(),
+        },
+        'results': results,
+    }
+
+
+def compare(old_report, new_report):
+    """
+    Compare the median times of two benchmark reports.
+
+    Args:
+        old_report (dict): baseline report.
+        new_report (dict): new report.
+
+    Returns:
+        list[dict]: matching results with the ``ratio`` of new / old.
+    """
+    old_results = {
+        (r['shape'], r['size'], r['operation']): r
+        for r in old_report['results']
+    }
+    rows = []
+    for result in new_report['results']:
+        key = (result['shape'], result['size'], result['operation'])
+        old = old_results.get(key)
+        if not old:
+            continue
+        rows.append({
+            'shape': key[0],
+            'size': key[1],
+            'operation': key[2],
+            'old': old['median'],
+            'new': result['median'],
+            'ratio': result['median'] / old['median'] if old['median'] else None,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES.keys()))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--operations', nargs='+', choices=OPERATIONS)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--memory', action='store_true',
+                        help='record the python memory allocated '
+                             '(tracemalloc slows down the timings).')
+    parser.add_argument('--output', help='write the json report to a file.')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two json reports.')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old_report = json.load(f)
+        with open(args.compare[1]) as f:
+            new_report = json.load(f)
+        for row in compare(old_report, new_report):
+            ratio = row['ratio']
+            print('{:<8} {:>7} {:<18} {:>9.4f}s {:>9.4f}s {:>7}'.format(
+                row['shape'], row['size'], row['operation'], row['old'],
+                row['new'], '{:.2f}x'.format(ratio) if ratio else '-'))
+        return 0
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    report = run(args.shapes, args.sizes, args.operations, max(1, args.repeat),
+                 args.memory, args.seed, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/python
+"""
+Benchmark the memory used by the node and port models.
+
+The node models of the synthetic graphs are measured with a deep
+``sys.getsizeof`` walk (objects shared between models such as interned
+property names and the class defaults are only counted once) and reported
+as bytes per node and bytes per port.
+
+.. code-block:: bash
+
+    python -m benchmarks.bench_memory --sizes 1000 10000 --output memory.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+# the benchmarks don't need a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore, QtWidgets
+from shiboken6 import Shiboken
+
+from NodeGraphQt.base.model import NodeGraphModel, NodeModel, PortModel
+from NodeGraphQt.base.node import NodeObject
+from NodeGraphQt.pkg_info import __version__
+
+from benchmarks.graphs import SHAPES, delete_graph, new_graph
+
+#: default graph sizes.
+SIZES = [1000, 10000]
+
+
+def model_size(obj, seen):
+    """
+    Returns the deep size of a model object, the graph model, node objects
+    and Qt objects are not included.
+
+    Args:
+        obj (object): object to measure.
+        seen (set[int]): ids of the objects already measured.
+
+    Returns:
+        int: size in bytes.
+    """
+    if id(obj) in seen or isinstance(
+            obj, (NodeGraphModel, NodeObject, Shiboken.Object)):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += model_size(key, seen) + model_size(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for value in obj:
+            size += model_size(value, seen)
+    elif not isinstance(obj, type):
+        if hasattr(obj, '__dict__'):
+            size += model_size(obj.__dict__, seen)
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(obj, name):
+                    size += model_size(getattr(obj, name), seen)
+    return size
+
+
+def run_shape(shape, size, seed=0):
+    """
+    Measure the node models of a new graph.
+
+    Args:
+        shape (str): graph shape from :data:`benchmarks.graphs.SHAPES`.
+        size (int): number of nodes.
+        seed (int): random seed for the random graphs.
+
+    Returns:
+        dict: measured sizes.
+    """
+    create_func, edges_func = SHAPES[shape]
+    graph = new_graph()
+    nodes = create_func(graph, size)
+    for source, target in edges_func(len(nodes), seed):
+        nodes[source].output(0).connect_to(nodes[target].input(0),
+                                           push_undo=False)
+
+    # shared class level data is counted once up front so it isn't
+    # attributed to the first node.
+    seen = set()
+    for cls in (NodeModel, PortModel):
+        model_size(cls.__dict__, seen)
+
+    models = [n.model for n in graph.all_nodes()]
+    port_count = 0
+    port_bytes = 0
+    node_bytes = 0
+    for model in models:
+        ports = list(model.inputs.values()) + list(model.outputs.values())
+        port_count += len(ports)
+        port_bytes += sum(model_size(p, seen) for p in ports)
+        node_bytes += model_size(model, seen)
+
+    connections = sum(
+        len(names) for m in models for p in m.outputs.values()
+        for names in p.connected_ports.values()
+    )
+    delete_graph(graph)
+
+    node_count = len(models)
+    return {
+        'shape': shape,
+        'size': size,
+        'nodes': node_count,
+        'ports': port_count,
+        'connections': connections,
+        'model_bytes': node_bytes + port_bytes,
+        'bytes_per_node': (node_bytes + port_bytes) / node_count,
+        'bytes_per_port': port_bytes / port_count if port_count else 0.0,
+    }
+
+
+def run(shapes=None, sizes=None, seed=0, log=None):
+    """
+    Run the benchmarks.
+
+    Args:
+        shapes (list[str]): graph shapes (default: all).
+        sizes (list[int]): graph sizes (default: :data:`SIZES`).
+        seed (int): random seed for the random graphs.
+        log (callable): function called with a progress message.
+
+    Returns:
+        dict: benchmark report with ``meta`` and ``results``.
+    """
+    shapes = shapes or sorted(SHAPES.keys())
+    sizes = sizes or SIZES
+
+    results = []
+    for shape in shapes:
+        for size in sizes:
+            result = run_shape(shape, size, seed)
+            results.append(result)
+            if log:
+                log('{:<8} {:>7} {:>9.1f} bytes/node {:>7.1f} bytes/port'
+                    .format(shape, size, result['bytes_per_node'],
+                            result['bytes_per_port']))
+
+    return {
+        'meta': {
+            'nodegraphqt': __version__,
+            'qt': QtCore.qVersion(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES.keys()))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the json report to a file.')
+    args = parser.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    report = run(args.shapes, args.sizes, args.seed, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,428 @@
+#!/usr/bin/python
+"""
+Benchmark the node viewer frame times while panning, zooming, rubber band
+selecting, dragging nodes and drawing a live connection pipe.
+
+The viewer is driven offscreen with mouse and wheel events and every frame
+is rendered to a ``QImage`` to time the ``NodeScene.drawBackground``,
+``NodeItem.paint`` and ``PipeItem.paint`` calls, the items are cached by
+Qt so the paint counts are the item cache misses for each frame.
+
+.. code-block:: bash
+
+    python -m benchmarks.bench_render --sizes 100 1000 --output render.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+# the benchmarks don't need a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from NodeGraphQt.pkg_info import __version__
+from NodeGraphQt.qgraphics.node_base import NodeItem
+from NodeGraphQt.qgraphics.pipe import LivePipeItem, PipeItem
+from NodeGraphQt.qgraphics.port import PortItem
+from NodeGraphQt.widgets.scene import NodeScene
+
+from benchmarks.graphs import (
+    GRID_SPACING,
+    SHAPES,
+    create_nodes,
+    delete_graph,
+    new_graph,
+)
+
+#: default graph sizes.
+SIZES = [100, 1000, 5000]
+
+#: benchmarked interactions in the order they are run.
+SCENARIOS = ['pan', 'zoom', 'rubber_band', 'drag', 'live_pipe']
+
+#: viewport size the frames are rendered at.
+VIEWPORT_SIZE = (1280, 800)
+
+#: number of frames rendered for each interaction.
+FRAMES = 60
+
+#: number of selected nodes moved in the drag interaction.
+DRAG_COUNT = 50
+
+
+def percentiles(values, points=(50, 90, 99)):
+    """
+    Returns the percentiles for the values.
+
+    Args:
+        values (list[float]): values.
+        points (tuple[int]): percentiles.
+
+    Returns:
+        dict: {'p<point>': <value>, 'max': <value>}
+    """
+    values = sorted(values)
+    if not values:
+        return {}
+    result = {}
+    for point in points:
+        index = min(len(values) - 1, int(round(point / 100.0 * (len(values) - 1))))
+        result['p{}'.format(point)] = values[index]
+    result['max'] = values[-1]
+    return result
+
+
+class PaintCounter(object):
+    """
+    Context manager that counts the item paint calls and the pipe path
+    redraws by wrapping the methods on the graphics item classes.
+    """
+
+    #: {<class>: <method names>} wrapped while the counter is active.
+    METHODS = {
+        NodeScene: ['drawBackground'],
+        NodeItem: ['paint'],
+        PortItem: ['paint'],
+        PipeItem: ['paint', 'draw_path'],
+        LivePipeItem: ['draw_path'],
+    }
+
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.seconds = defaultdict(float)
+        self._originals = []
+
+    def __enter__(self):
+        for cls, names in self.METHODS.items():
+            for name in names:
+                func = cls.__dict__[name]
+                self._originals.append((cls, name, func))
+                setattr(cls, name, self._wrap(func, name))
+        return self
+
+    def __exit__(self, *args):
+        for cls, name, func in self._originals:
+            setattr(cls, name, func)
+        self._originals = []
+
+    def reset(self):
+        """
+        Reset the counts.
+        """
+        self.counts.clear()
+        self.seconds.clear()
+
+    def _wrap(self, func, name):
+        """
+        Returns a wrapper that counts and times the calls to the function
+        under the item class name (super calls aren't counted twice).
+        """
+        counter = self
+        active = set()
+
+        def wrapper(item, *args, **kwargs):
+            item_id = id(item)
+            if item_id in active:
+                return func(item, *args, **kwargs)
+            active.add(item_id)
+            start = time.perf_counter()
+            try:
+                return func(item, *args, **kwargs)
+            finally:
+                key = '{}.{}'.format(type(item).__name__, name)
+                counter.counts[key] += 1
+                counter.seconds[key] += time.perf_counter() - start
+                active.discard(item_id)
+        return wrapper
+
+
+class ViewerDriver(object):
+    """
+    Drives the node viewer with mouse and wheel events and renders the
+    frames to an image.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.viewer = graph.viewer()
+        graph.widget.resize(*VIEWPORT_SIZE)
+        graph.widget.show()
+        QtWidgets.QApplication.processEvents()
+        self.image = QtGui.QImage(self.viewer.viewport().size(),
+                                  QtGui.QImage.Format_ARGB32_Premultiplied)
+
+    def reset_view(self):
+        """
+        Show the top left corner of the node grid at 100% zoom and clear the
+        selection.
+        """
+        self.graph.clear_selection()
+        size = self.viewer.viewport().size()
+        self.viewer._scene_range = QtCore.QRectF(
+            -GRID_SPACING[0], -GRID_SPACING[1], size.width(), size.height())
+        self.viewer._update_scene()
+
+    def render(self):
+        """
+        Render a frame of the viewer to the image.
+
+        Returns:
+            float: seconds it took to render.
+        """
+        self.image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(self.image)
+        start = time.perf_counter()
+        self.viewer.render(painter)
+        seconds = time.perf_counter() - start
+        painter.end()
+        return seconds
+
+    def _send(self, event):
+        QtWidgets.QApplication.sendEvent(self.viewer.viewport(), event)
+
+    def mouse(self, event_type, pos, button=QtCore.Qt.LeftButton,
+              buttons=None):
+        """
+        Send a mouse event to the viewport.
+
+        Args:
+            event_type (QtCore.QEvent.Type): event type.
+            pos (QtCore.QPointF): viewport position.
+            button (QtCore.Qt.MouseButton): button.
+            buttons (QtCore.Qt.MouseButtons): pressed buttons.
+        """
+        if buttons is None:
+            buttons = QtCore.Qt.NoButton \
+                if event_type == QtCore.QEvent.MouseButtonRelease else button
+        if event_type == QtCore.QEvent.MouseMove:
+            button = QtCore.Qt.NoButton
+        pos = QtCore.QPointF(pos)
+        global_pos = QtCore.QPointF(self.viewer.viewport().mapToGlobal(pos))
+        self._send(QtGui.QMouseEvent(event_type, pos, global_pos, button,
+                                     buttons, QtCore.Qt.NoModifier))
+
+    def wheel(self, pos, delta):
+        """
+        Send a wheel event to the viewport.
+
+        Args:
+            pos (QtCore.QPointF): viewport position.
+            delta (int): angle delta.
+        """
+        pos = QtCore.QPointF(pos)
+        global_pos = QtCore.QPointF(self.viewer.viewport().mapToGlobal(pos))
+        self._send(QtGui.QWheelEvent(
+            pos, global_pos, QtCore.QPoint(), QtCore.QPoint(0, delta),
+            QtCore.Qt.NoButton, QtCore.Qt.NoModifier,
+            QtCore.Qt.NoScrollPhase, False))
+
+    def map_from_scene(self, pos):
+        """
+        Args:
+            pos (QtCore.QPointF): scene position.
+
+        Returns:
+            QtCore.QPointF: viewport position.
+        """
+        return QtCore.QPointF(self.viewer.mapFromScene(pos))
+
+    def drag(self, start, end, frames, button=QtCore.Qt.LeftButton):
+        """
+        Generator that presses the mouse at the start position, moves it to
+        the end position over the frames and releases it.
+
+        Args:
+            start (QtCore.QPointF): viewport start position.
+            end (QtCore.QPointF): viewport end position.
+            frames (int): number of mouse moves.
+            button (QtCore.Qt.MouseButton): button.
+        """
+        self.mouse(QtCore.QEvent.MouseButtonPress, start, button)
+        for i in range(1, frames + 1):
+            pos = start + (end - start) * (i / float(frames))
+            self.mouse(QtCore.QEvent.MouseMove, pos, button, buttons=button)
+            yield
+        self.mouse(QtCore.QEvent.MouseButtonRelease, end, button)
+
+
+def _pan(driver, nodes, frames):
+    center = QtCore.QPointF(driver.viewer.viewport().rect().center())
+    end = center - QtCore.QPointF(VIEWPORT_SIZE[0], VIEWPORT_SIZE[1]) * 0.5
+    return driver.drag(center, end, frames, QtCore.Qt.MiddleButton)
+
+
+def _zoom(driver, nodes, frames):
+    center = QtCore.QPointF(driver.viewer.viewport().rect().center())
+    half = frames // 2
+    for i in range(frames):
+        driver.wheel(center, -120 if i < half else 120)
+        yield
+
+
+def _rubber_band(driver, nodes, frames):
+    start = driver.map_from_scene(
+        QtCore.QPointF(-GRID_SPACING[0] * 0.5, -GRID_SPACING[1] * 0.5))
+    end = QtCore.QPointF(VIEWPORT_SIZE[0] - 1, VIEWPORT_SIZE[1] - 1)
+    return driver.drag(start, end, frames)
+
+
+def _drag(driver, nodes, frames):
+    for node in nodes[:DRAG_COUNT]:
+        node.set_selected(True)
+    view = nodes[0].view
+    start = driver.map_from_scene(view.sceneBoundingRect().center())
+    end = start + QtCore.QPointF(GRID_SPACING[0], GRID_SPACING[1]) * 2
+    return driver.drag(start, end, frames)
+
+
+def _live_pipe(driver, nodes, frames):
+    port = nodes[0].output(0).view
+    start = driver.map_from_scene(port.sceneBoundingRect().center())
+    end = start + QtCore.QPointF(GRID_SPACING[0] * 3, GRID_SPACING[1] * 3)
+    return driver.drag(start, end, frames)
+
+
+#: {<scenario>: <function returning the frame generator>}
+SCENARIO_FUNCTIONS = {
+    'pan': _pan,
+    'zoom': _zoom,
+    'rubber_band': _rubber_band,
+    'drag': _drag,
+    'live_pipe': _live_pipe,
+}
+
+
+def run_scenario(driver, nodes, scenario, frames=FRAMES):
+    """
+    Run an interaction and time the frames.
+
+    Args:
+        driver (ViewerDriver): viewer driver.
+        nodes (list[NodeGraphQt.BaseNode]): graph nodes.
+        scenario (str): interaction from :data:`SCENARIOS`.
+        frames (int): number of frames.
+
+    Returns:
+        dict: frame time percentiles and paint counts.
+    """
+    driver.reset_view()
+    driver.render()
+
+    paint_times = []
+    event_times = []
+    with PaintCounter() as counter:
+        start = time.perf_counter()
+        for _ in SCENARIO_FUNCTIONS[scenario](driver, nodes, frames):
+            event_times.append(time.perf_counter() - start)
+            paint_times.append(driver.render())
+            start = time.perf_counter()
+        QtWidgets.QApplication.processEvents()
+
+    frame_count = max(1, len(paint_times))
+    pipe_redraws = sum(c for k, c in counter.counts.items()
+                       if k.endswith('.draw_path'))
+    return {
+        'frames': len(paint_times),
+        'paint_ms': {k: v * 1000.0 for k, v in
+                     percentiles(paint_times).items()},
+        'event_ms': {k: v * 1000.0 for k, v in
+                     percentiles(event_times).items()},
+        'paint_counts': dict(counter.counts),
+        'paint_counts_per_frame': {
+            k: c / float(frame_count) for k, c in counter.counts.items()
+        },
+        'paint_seconds': dict(counter.seconds),
+        'pipe_redraws': pipe_redraws,
+    }
+
+
+def run(shapes=None, sizes=None, scenarios=None, frames=FRAMES, seed=0,
+        log=None):
+    """
+    Run the rendering benchmarks.
+
+    Args:
+        shapes (list[str]): graph shapes (default: chain).
+        sizes (list[int]): graph sizes (default: :data:`SIZES`).
+        scenarios (list[str]): interactions (default: all).
+        frames (int): number of frames for each interaction.
+        seed (int): random seed for the random graphs.
+        log (callable): function called with a progress message.
+
+    Returns:
+        dict: benchmark report with ``meta`` and ``results``.
+    """
+    shapes = shapes or ['chain']
+    sizes = sizes or SIZES
+    scenarios = scenarios or SCENARIOS
+
+    results = []
+    for shape in shapes:
+        _, edges_func = SHAPES[shape]
+        for size in sizes:
+            graph = new_graph()
+            nodes = create_nodes(graph, size)
+            for source, target in edges_func(size, seed):
+                nodes[source].output(0).connect_to(nodes[target].input(0),
+                                                   push_undo=False)
+            driver = ViewerDriver(graph)
+            for scenario in scenarios:
+                result = run_scenario(driver, nodes, scenario, frames)
+                result.update({'shape': shape, 'size': size,
+                               'scenario': scenario})
+                results.append(result)
+                if log:
+                    log('{:<8} {:>7} {:<12} p50 {:>8.2f}ms  p99 {:>8.2f}ms'
+                        '  pipe redraws {:>7}'.format(
+                            shape, size, scenario,
+                            result['paint_ms'].get('p50', 0.0),
+                            result['paint_ms'].get('p99', 0.0),
+                            result['pipe_redraws']))
+            graph.undo_stack().clear()
+            delete_graph(graph)
+
+    return {
+        'meta': {
+            'nodegraphqt': __version__,
+            'qt': QtCore.qVersion(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(),
+            'viewport': list(VIEWPORT_SIZE),
+            'frames': frames,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES.keys()))
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS)
+    parser.add_argument('--frames', type=int, default=FRAMES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the json report to a file.')
+    args = parser.parse_args(argv)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    report = run(args.shapes, args.sizes, args.scenarios,
+                 max(1, args.frames), args.seed, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
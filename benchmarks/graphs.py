@@ -0,0 +1,290 @@
+#!/usr/bin/python
+"""
+Synthetic node graphs used by the benchmarks.
+"""
+import random
+
+from PySide6 import QtCore, QtWidgets
+
+from NodeGraphQt import BaseNode, GroupNode, NodeGraph
+
+
+class BenchNode(BaseNode):
+    """
+    A node with a multi input and a multi output used to build the
+    benchmark graphs.
+    """
+
+    __identifier__ = 'nodegraphqt.benchmarks'
+
+    NODE_NAME = 'bench'
+
+    def __init__(self):
+        super(BenchNode, self).__init__()
+        self.add_input('in', multi_input=True)
+        self.add_output('out')
+        self.create_property('value', 0)
+
+
+class BenchGroupNode(GroupNode):
+    """
+    A group node used to build the nested group benchmark graphs.
+    """
+
+    __identifier__ = 'nodegraphqt.benchmarks'
+
+    NODE_NAME = 'bench group'
+
+    def __init__(self):
+        super(BenchGroupNode, self).__init__()
+        self.add_input('in', multi_input=True)
+        self.add_output('out')
+
+
+#: node classes to register with the benchmark graphs.
+NODE_CLASSES = [BenchNode, BenchGroupNode]
+
+#: grid columns and spacing the nodes are created with.
+GRID_COLUMNS = 100
+GRID_SPACING = (250, 120)
+
+#: number of nodes inside each nested group and the nesting depth.
+GROUP_SIZE = 10
+GROUP_DEPTH = 2
+
+
+def new_graph():
+    """
+    Returns:
+        NodeGraphQt.NodeGraph: node graph with the bench nodes registered.
+    """
+    graph = NodeGraph()
+    graph.register_nodes(NODE_CLASSES)
+    return graph
+
+
+def delete_graph(graph):
+    """
+    Clear the node graph and free its widgets.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+    """
+    graph.clear_session()
+    graph.widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    QtWidgets.QApplication.processEvents()
+
+
+def _grid_pos(index):
+    """
+    Args:
+        index (int): node index.
+
+    Returns:
+        list[float]: x, y grid position.
+    """
+    return [(index % GRID_COLUMNS) * GRID_SPACING[0],
+            (index // GRID_COLUMNS) * GRID_SPACING[1]]
+
+
+def create_nodes(graph, count):
+    """
+    Create the bench nodes in a grid.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        count (int): number of nodes.
+
+    Returns:
+        list[BenchNode]: created nodes.
+    """
+    return [
+        graph.create_node(BenchNode.type_, selected=False, pos=_grid_pos(i),
+                          push_undo=False)
+        for i in range(count)
+    ]
+
+
+def chain_session(count, start_index=0):
+    """
+    Build a serialized session of a chain of bench nodes without creating a
+    graph.
+
+    Args:
+        count (int): number of nodes.
+        start_index (int): index for the first node id.
+
+    Returns:
+        dict: serialized session.
+    """
+    node_ids = ['0x{:x}'.format(start_index + i) for i in range(count)]
+    session = {
+        'graph': {'acyclic': True, 'pipe_collision': False},
+        'nodes': {},
+        'connections': [],
+    }
+    for i, node_id in enumerate(node_ids):
+        session['nodes'][node_id] = {
+            'type_': BenchNode.type_,
+            'name': '{} {}'.format(BenchNode.NODE_NAME, i),
+            'pos': _grid_pos(i),
+            'custom': {'value': 0},
+        }
+        if i:
+            session['connections'].append({
+                'out': [node_ids[i - 1], 'out'],
+                'in': [node_id, 'in'],
+            })
+    return session
+
+
+def nested_session(size=GROUP_SIZE, depth=GROUP_DEPTH):
+    """
+    Build a serialized group session with a chain of bench nodes and a
+    nested group at each level.
+
+    Args:
+        size (int): number of bench nodes at each level.
+        depth (int): nesting depth.
+
+    Returns:
+        tuple(dict, int): serialized session, total number of nodes.
+    """
+    session = chain_session(size)
+    total = size
+    if depth > 1:
+        sub_session, sub_total = nested_session(size, depth - 1)
+        group_id = '0x{:x}'.format(size)
+        session['nodes'][group_id] = {
+            'type_': BenchGroupNode.type_,
+            'name': '{} {}'.format(BenchGroupNode.NODE_NAME, depth),
+            'pos': _grid_pos(size),
+            'subgraph_session': sub_session,
+        }
+        session['connections'].append({
+            'out': ['0x{:x}'.format(size - 1), 'out'],
+            'in': [group_id, 'in'],
+        })
+        total += 1 + sub_total
+    return session, total
+
+
+def create_group_nodes(graph, count):
+    """
+    Create nested group nodes until the total number of nodes (including
+    the nodes inside the groups) reaches the count.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        count (int): total number of nodes.
+
+    Returns:
+        list[BenchGroupNode]: created group nodes.
+    """
+    session, total = nested_session()
+    groups = []
+    for i in range(max(1, count // (total + 1))):
+        group = graph.create_node(BenchGroupNode.type_, selected=False,
+                                  pos=_grid_pos(i), push_undo=False)
+        group.set_sub_graph_session(session)
+        groups.append(group)
+    expand_group_nodes(graph, groups)
+    return groups
+
+
+def expand_group_nodes(graph, nodes):
+    """
+    Build the sub graphs of the group nodes (one level deep) and collapse
+    them into the sub graph cache, so the nodes inside the groups exist and
+    are serialized from the sub graphs.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.NodeObject]): nodes (other than group nodes
+            are skipped).
+    """
+    groups = [n for n in nodes if isinstance(n, GroupNode)]
+    if not groups:
+        return
+    # the sub graph tabs are added to the node graph widget.
+    graph.widget
+    for group in groups:
+        group.expand()
+        group.collapse()
+
+
+def chain_edges(count, seed=None):
+    """
+    Returns the edges for a chain where each node is connected to the next.
+
+    Args:
+        count (int): number of nodes.
+        seed (int): unused.
+
+    Returns:
+        list[tuple(int, int)]: (<source_index>, <target_index>) edges.
+    """
+    return [(i, i + 1) for i in range(count - 1)]
+
+
+def fan_edges(count, seed=None):
+    """
+    Returns the edges for a wide fan-out from the first node to the middle
+    nodes that fan-in to the last node.
+
+    Args:
+        count (int): number of nodes.
+        seed (int): unused.
+
+    Returns:
+        list[tuple(int, int)]: (<source_index>, <target_index>) edges.
+    """
+    if count < 3:
+        return chain_edges(count)
+    edges = [(0, i) for i in range(1, count - 1)]
+    edges += [(i, count - 1) for i in range(1, count - 1)]
+    return edges
+
+
+def random_dag_edges(count, seed=0, max_inputs=3):
+    """
+    Returns the edges for a random directed acyclic graph where each node
+    is connected to up to ``max_inputs`` random nodes before it.
+
+    Args:
+        count (int): number of nodes.
+        seed (int): random seed.
+        max_inputs (int): max number of inputs per node.
+
+    Returns:
+        list[tuple(int, int)]: (<source_index>, <target_index>) edges.
+    """
+    rand = random.Random(seed)
+    edges = []
+    for i in range(1, count):
+        sources = rand.sample(range(i), min(i, rand.randint(1, max_inputs)))
+        edges += [(source, i) for source in sorted(sources)]
+    return edges
+
+
+def connect_nodes(nodes, edges):
+    """
+    Connect the nodes from the edges.
+
+    Args:
+        nodes (list[NodeGraphQt.BaseNode]): nodes.
+        edges (list[tuple(int, int)]): (<source_index>, <target_index>) edges.
+    """
+    for source, target in edges:
+        nodes[source].output(0).connect_to(nodes[target].input(0),
+                                           push_undo=False)
+
+
+#: graph shapes {<name>: (<create_function>, <edges_function>)}
+SHAPES = {
+    'chain': (create_nodes, chain_edges),
+    'fan': (create_nodes, fan_edges),
+    'random': (create_nodes, random_dag_edges),
+    'nested': (create_group_nodes, chain_edges),
+}
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+# the tests don't need a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtWidgets
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """
+    Returns:
+        QtWidgets.QApplication: application shared by the tests.
+    """
+    return (QtWidgets.QApplication.instance() or
+            QtWidgets.QApplication([]))
+
+
+@pytest.fixture
+def graph(qapp):
+    """
+    Returns:
+        NodeGraphQt.NodeGraph: empty node graph.
+    """
+    from NodeGraphQt import NodeGraph
+    node_graph = NodeGraph()
+    yield node_graph
+    node_graph.clear_session()
+    node_graph.widget.deleteLater()
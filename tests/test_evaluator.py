@@ -0,0 +1,60 @@
+from NodeGraphQt import BaseNode, NodeGraph
+from NodeGraphQt.constants import NodeExecutorEnum
+
+
+class SourceNode(BaseNode):
+
+    __identifier__ = 'nodegraphqt.tests'
+
+    NODE_NAME = 'source'
+
+    def __init__(self):
+        super(SourceNode, self).__init__()
+        self.add_output('out')
+        self.create_property('value', 6)
+
+    def compute(self, inputs):
+        return {'out': self.get_property('value')}
+
+
+class SquareProcessNode(BaseNode):
+
+    __identifier__ = 'nodegraphqt.tests'
+
+    NODE_NAME = 'square'
+
+    COMPUTE_EXECUTOR = NodeExecutorEnum.PROCESS.value
+
+    def __init__(self):
+        super(SquareProcessNode, self).__init__()
+        self.add_input('in')
+        self.add_output('out')
+        self.create_property('offset', 0)
+
+    @classmethod
+    def process_compute(cls, properties, inputs):
+        return {'out': (inputs['in'] or 0) ** 2 + properties['offset']}
+
+
+def _build_graph():
+    node_graph = NodeGraph()
+    node_graph.register_nodes([SourceNode, SquareProcessNode])
+    source = node_graph.create_node(SourceNode.type_)
+    square = node_graph.create_node(SquareProcessNode.type_)
+    source.set_output(0, square.input(0))
+    return node_graph, square
+
+
+def test_process_node_evaluate_matches_scheduler(qapp):
+    eval_graph, eval_node = _build_graph()
+    run_graph, run_node = _build_graph()
+
+    results = eval_graph.evaluator.evaluate()
+
+    scheduler = run_graph.scheduler
+    scheduler.run()
+    run_results = scheduler.wait()
+    scheduler.shutdown()
+
+    assert results[eval_node.id] == {'out': 36}
+    assert run_results[run_node.id] == results[eval_node.id]
@@ -0,0 +1,29 @@
+from NodeGraphQt import BaseNode
+
+
+class GeometryNode(BaseNode):
+
+    __identifier__ = 'nodegraphqt.tests'
+
+    NODE_NAME = 'geometry'
+
+
+def test_view_move_updates_geometry_store(graph):
+    graph.register_node(GeometryNode)
+    node = graph.create_node(GeometryNode.type_, pos=[0, 0])
+    other = graph.create_node(GeometryNode.type_, pos=[50, 50])
+    geometry = graph.model.geometry
+
+    node.view.setPos(800, 600)
+
+    assert geometry.pos(node.id) == [800.0, 600.0]
+    x, y, width, height = graph.nodes_bounding_rect()
+    assert x + width == 800.0 + node.view.width
+    assert y + height == 600.0 + node.view.height
+    assert graph.nearest_node([810, 610]) is node
+
+    # moves made while the node is removed are picked up on undo.
+    graph.delete_node(node)
+    node.view.setPos(-200, -100)
+    graph.undo_stack().undo()
+    assert geometry.pos(node.id) == [-200.0, -100.0]
@@ -0,0 +1,13 @@
+from NodeGraphQt.widgets.tab_search import TabSearchIndex
+
+
+def test_search_index_set_names_clears_cache(qapp):
+    index = TabSearchIndex(['Add', 'Multiply', 'Subtract'])
+    assert index.search('a') == ['Add', 'Subtract']
+
+    index.set_names([])
+    assert index.search('a') == []
+
+    index.set_names(['Alpha', 'Beta'])
+    assert index.search('a') == ['Alpha', 'Beta']
+    assert index.search('ad') == []